@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file AsyncioExecutionContext.py
+# @brief Periodic execution context awaiting asynchronous callbacks
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import threading
+
+import OpenRTM_aist
+import RTC
+
+try:
+  import asyncio
+  import concurrent.futures
+except ImportError:
+  asyncio = None
+
+
+current_ec = threading.local()
+
+
+##
+# @if jp
+# @brief コールバックの戻り値がコルーチンの場合に完了を待つ
+#
+# RTCのコールバック (onExecute() 等) が async def で定義されている場
+# 合、戻り値のコルーチンを実行して結果を返す。呼び出し元のスレッドが
+# AsyncioExecutionContext のスレッドの場合はその実行コンテキストのイ
+# ベントループで、それ以外の場合はスレッド毎のイベントループで実行す
+# る。コルーチン以外の戻り値はそのまま返す。
+#
+# @param ret コールバックの戻り値
+# @return ReturnCode_t
+#
+# @else
+# @brief Wait for the completion if a callback returned a coroutine
+#
+# When a callback of an RTC (onExecute() etc.) is defined with
+# async def, the returned coroutine is executed and its result is
+# returned. The coroutine runs on the event loop of the
+# AsyncioExecutionContext if the calling thread belongs to it, and on
+# a per-thread event loop otherwise. Other return values are returned
+# as is.
+#
+# @param ret Return value of the callback
+# @return ReturnCode_t
+#
+# @endif
+def awaitCallback(ret):
+  if asyncio is None or not asyncio.iscoroutine(ret):
+    return ret
+
+  ec_ = getattr(current_ec, "ec", None)
+  if ec_ is not None:
+    return ec_.runCoroutine(ret)
+
+  loop_ = getattr(current_ec, "loop", None)
+  if loop_ is None:
+    loop_ = asyncio.new_event_loop()
+    current_ec.loop = loop_
+  return loop_.run_until_complete(ret)
+
+
+
+##
+# @if jp
+# @class AsyncioExecutionContext
+# @brief asyncio のイベントループを持つ周期実行コンテキスト
+#
+# PeriodicExecutionContext と同様に周期実行を行うが、専用のスレッドで
+# asyncio のイベントループを実行し、async def で定義されたRTCのコー
+# ルバック (onExecute()、onStateUpdate()、onActivated() 等) をそのイ
+# ベントループで実行する。実行コンテキストのスレッドはコルーチンの完
+# 了を待ってから次のRTCを実行するため、実行順序は同期的なコールバッ
+# クと同じである。同期的なコールバックを持つRTCはそのまま実行される。
+#
+# コールバック中のコルーチンからは InPort.read_async() で新しいデータ
+# の到着を待つことができ、待機中もイベントループ上の他のタスクは実行
+# される。
+#
+# 以下のプロパティを使用する。
+#
+# - callback_timeout: 1回のコールバックのコルーチンの完了を待つ時間
+#                     [s]。デフォルトは実行周期。超過した場合はコルー
+#                     チンをキャンセルし、RTC_ERROR を返す。
+#
+# Python 2 では asyncio が使用できないため、PeriodicExecutionContext
+# と同じ動作となる。
+#
+# @since 2.0.0
+#
+# @else
+# @class AsyncioExecutionContext
+# @brief Periodic execution context with an asyncio event loop
+#
+# This context executes periodically like PeriodicExecutionContext,
+# and additionally runs an asyncio event loop in a dedicated thread.
+# Callbacks of RTCs defined with async def (onExecute(),
+# onStateUpdate(), onActivated() etc.) are executed on this event
+# loop. Since the thread of the context waits for the completion of
+# the coroutine before executing the next RTC, the execution order is
+# the same as for synchronous callbacks. RTCs with synchronous
+# callbacks are executed as before.
+#
+# A coroutine in a callback can wait for the arrival of new data by
+# InPort.read_async(), and the other tasks on the event loop keep
+# running while it waits.
+#
+# The following property is used.
+#
+# - callback_timeout: Time to wait for the coroutine of one callback
+#                     [s]. The default is the execution period. On
+#                     timeout the coroutine is cancelled and
+#                     RTC_ERROR is returned.
+#
+# Since asyncio is not available on Python 2, this context behaves as
+# PeriodicExecutionContext there.
+#
+# @since 2.0.0
+#
+# @endif
+class AsyncioExecutionContext(OpenRTM_aist.PeriodicExecutionContext):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @else
+  # @brief Constructor
+  # @endif
+  def __init__(self):
+    OpenRTM_aist.PeriodicExecutionContext.__init__(self)
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("rtobject.asyncio_ec")
+    self._rtcout.RTC_TRACE("AsyncioExecutionContext.__init__()")
+    self._loop = None
+    self._loopThread = None
+    self._callbackTimeout = 0.0
+    return
+
+
+  ##
+  # @if jp
+  # @brief 初期化関数
+  #
+  # イベントループのスレッドを起動する。
+  #
+  # @param self
+  # @param props プロパティ
+  #
+  # @else
+  # @brief Initialization
+  #
+  # The thread of the event loop is started.
+  #
+  # @param self
+  # @param props Properties
+  #
+  # @endif
+  def init(self, props):
+    OpenRTM_aist.PeriodicExecutionContext.init(self, props)
+
+    timeout_ = [0.0]
+    if OpenRTM_aist.stringTo(timeout_, props.getProperty("callback_timeout", "0.0")):
+      self._callbackTimeout = timeout_[0]
+
+    if asyncio is None:
+      self._rtcout.RTC_WARN("asyncio is not available. Coroutine callbacks are not supported.")
+      return
+
+    self._loop = asyncio.new_event_loop()
+    self._loopThread = threading.Thread(target=self.runLoop)
+    self._loopThread.daemon = True
+    self._loopThread.start()
+    return
+
+
+  ##
+  # @if jp
+  # @brief 終了関数
+  # @else
+  # @brief Finalization
+  # @endif
+  def exit(self):
+    OpenRTM_aist.PeriodicExecutionContext.exit(self)
+    if self._loop:
+      self._loop.call_soon_threadsafe(self._loop.stop)
+      self._loopThread.join()
+      self._loop.close()
+      self._loop = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief イベントループを取得する
+  #
+  # RTCがバックグラウンドのタスクを登録する場合に使用する。
+  #
+  # @return イベントループ。asyncio が使用できない場合は None
+  #
+  # @else
+  # @brief Get the event loop
+  #
+  # This can be used by RTCs to register background tasks.
+  #
+  # @return Event loop. None if asyncio is not available
+  #
+  # @endif
+  def getEventLoop(self):
+    return self._loop
+
+
+  def runLoop(self):
+    asyncio.set_event_loop(self._loop)
+    self._loop.run_forever()
+    return
+
+
+  ##
+  # @if jp
+  # @brief コルーチンをイベントループで実行し、完了を待つ
+  #
+  # @param self
+  # @param coro コールバックが返したコルーチン
+  # @return コルーチンの戻り値。タイムアウトした場合は RTC_ERROR
+  #
+  # @else
+  # @brief Execute a coroutine on the event loop and wait for it
+  #
+  # @param self
+  # @param coro Coroutine returned by a callback
+  # @return Return value of the coroutine. RTC_ERROR on timeout
+  #
+  # @endif
+  def runCoroutine(self, coro):
+    timeout_ = self._callbackTimeout
+    if timeout_ <= 0.0:
+      timeout_ = self.getPeriod().toDouble()
+
+    future_ = asyncio.run_coroutine_threadsafe(coro, self._loop)
+    try:
+      return future_.result(timeout_)
+    except concurrent.futures.TimeoutError:
+      future_.cancel()
+      self._rtcout.RTC_ERROR("Callback did not complete within %f [s].", timeout_)
+      return RTC.RTC_ERROR
+
+
+  def svc(self):
+    if self._loop:
+      current_ec.ec = self
+    try:
+      return OpenRTM_aist.PeriodicExecutionContext.svc(self)
+    finally:
+      current_ec.ec = None
+
+
+
+##
+# @if jp
+# @brief ExecutionContext を初期化する
+#
+# ExecutionContext 起動用ファクトリを登録する。
+#
+# @param manager マネージャオブジェクト
+#
+# @else
+#
+# @endif
+def AsyncioExecutionContextInit(manager):
+  OpenRTM_aist.ExecutionContextFactory.instance().addFactory("AsyncioExecutionContext",
+                                                             OpenRTM_aist.AsyncioExecutionContext,
+                                                             OpenRTM_aist.ECDelete)
+  return
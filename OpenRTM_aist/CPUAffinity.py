@@ -11,6 +11,7 @@
 
 import os
 import ctypes
+import threading
 
 
 ##
@@ -137,6 +138,15 @@ def setThreadAffinity(cpu_num_list):
     return True
     
   else:
+    if hasattr(os, "sched_setaffinity"):
+      # pid 0 is the calling thread on Linux
+      try:
+        cpus_ = set([int(num) for num in cpu_num_list])
+        os.sched_setaffinity(0, cpus_)
+        return os.sched_getaffinity(0) == cpus_
+      except (OSError, ValueError):
+        return False
+
     from ctypes.util import find_library
     pthread = find_library("pthread")
     if pthread is None:
@@ -158,3 +168,226 @@ def setThreadAffinity(cpu_num_list):
     else:
       return True
 
+
+
+##
+# @if jp
+# @brief 塼󥰥ݥꥷ̾
+# @else
+# @brief Names of the scheduling policies
+# @endif
+SCHED_POLICY_NAMES = ["SCHED_OTHER", "SCHED_FIFO", "SCHED_RR",
+                      "SCHED_BATCH", "SCHED_IDLE"]
+
+threads = {}
+threads_mutex = threading.RLock()
+
+
+##
+# @if jp
+# @brief 塼󥰥ݥꥷ̾ os ⥸塼Ѵ
+#
+# "SCHED_FIFO""FIFO""fifo" Τηդ롣
+#
+# @param name ݥꥷ̾
+# @return os.SCHED_* ̾͡ޤϻѤǤʤĶξ None
+#
+# @else
+# @brief Convert a scheduling policy name into the constant of os
+#
+# "SCHED_FIFO", "FIFO" and "fifo" are all accepted.
+#
+# @param name Policy name
+# @return Value of os.SCHED_*. None for an unknown name or if not
+#         available
+#
+# @endif
+#
+def toSchedPolicy(name):
+  name_ = name.strip().upper()
+  if not name_.startswith("SCHED_"):
+    name_ = "SCHED_" + name_
+  if name_ not in SCHED_POLICY_NAMES:
+    return None
+  return getattr(os, name_, None)
+
+
+##
+# @if jp
+# @brief os ⥸塼򥹥塼󥰥ݥꥷ̾Ѵ
+# @param policy os.SCHED_* 
+# @return ݥꥷ̾
+# @else
+# @brief Convert a constant of os into the scheduling policy name
+# @param policy Value of os.SCHED_*
+# @return Policy name
+# @endif
+#
+def schedPolicyToString(policy):
+  for name_ in SCHED_POLICY_NAMES:
+    if getattr(os, name_, None) == policy:
+      return name_
+  return str(policy)
+
+
+##
+# @if jp
+# @brief ƤӽФåɤΥ塼󥰥ݥꥷͥ٤
+#
+# os.sched_setscheduler() Ѥ뤿ᡢLinux  Python 3.3 ʹߤ
+# ΤͭǤ롣SCHED_FIFOSCHED_RR ˤ̾ø
+# (CAP_SYS_NICE) ɬפǤ롣
+#
+# @param policy ݥꥷ̾
+# @param priority ͥ١SCHED_OTHERSCHED_BATCH Ǥ 0
+# @return TrueԤFalse
+#
+# @else
+# @brief Set the scheduling policy and the priority of the calling thread
+#
+# Since os.sched_setscheduler() is used, this works only with Python
+# 3.3 or later on Linux. Setting SCHED_FIFO or SCHED_RR usually
+# requires a privilege (CAP_SYS_NICE).
+#
+# @param policy Policy name
+# @param priority Priority. 0 for SCHED_OTHER and SCHED_BATCH
+# @return True if succeeded, False otherwise
+#
+# @endif
+#
+def setThreadScheduler(policy, priority=0):
+  if not hasattr(os, "sched_setscheduler"):
+    return False
+  policy_ = toSchedPolicy(policy)
+  if policy_ is None:
+    return False
+  try:
+    # pid 0 is the calling thread on Linux
+    os.sched_setscheduler(0, policy_, os.sched_param(priority))
+  except (OSError, ValueError):
+    return False
+  return os.sched_getscheduler(0) == policy_
+
+
+##
+# @if jp
+# @brief ƤӽФåɤOSΥåID
+# @return åIDǤʤ None
+# @else
+# @brief Get the OS thread ID of the calling thread
+# @return Thread ID. None if not available
+# @endif
+#
+def getThreadId():
+  if hasattr(threading, "get_native_id"):
+    return threading.get_native_id()
+  if os.name == "nt":
+    return ctypes.windll.kernel32.GetCurrentThreadId()
+  try:
+    from ctypes.util import find_library
+    libc = ctypes.CDLL(find_library("c"))
+    # SYS_gettid on x86_64 Linux
+    return libc.syscall(186)
+  except (OSError, AttributeError, TypeError):
+    return None
+
+
+##
+# @if jp
+# @brief ƤӽФåɤե졼ΥåɤȤϿ
+#
+# Ͽåɤ getThreadSettings() ǧǤ롣Ʊ
+# åɤϿ̾򹹿롣
+#
+# @param name åɤ̾
+#
+# @else
+# @brief Register the calling thread as a thread of the framework
+#
+# The settings of the registered threads can be checked by
+# getThreadSettings(). Registering the same thread again updates the
+# name.
+#
+# @param name Name of the thread
+#
+# @endif
+#
+def registerThread(name):
+  tid_ = getThreadId()
+  if tid_ is None:
+    return
+  threads_mutex.acquire()
+  threads[threading.current_thread()] = (name, tid_)
+  threads_mutex.release()
+  return
+
+
+##
+# @if jp
+# @brief ƤӽФåɤϿ
+# @else
+# @brief Unregister the calling thread
+# @endif
+#
+def unregisterThread():
+  threads_mutex.acquire()
+  threads.pop(threading.current_thread(), None)
+  threads_mutex.release()
+  return
+
+
+##
+# @if jp
+# @brief Ͽ줿åɤμºݤ
+#
+# ϿƤ¸γƥåɤˤĤơʲͤļΥ
+# Ȥ֤Ǥʤͤ None Ȥʤ롣
+#
+# - name: åɤ̾
+# - tid: OSΥåID
+# - sched_policy: 塼󥰥ݥꥷ̾
+# - sched_priority: ͥ
+# - cpu_affinity: CPUֹΥꥹ
+#
+# @return Υꥹ
+#
+# @else
+# @brief Get the effective settings of the registered threads
+#
+# A list of dictionaries with the following entries is returned for
+# each registered living thread. Unavailable values are None.
+#
+# - name: Name of the thread
+# - tid: OS thread ID
+# - sched_policy: Scheduling policy name
+# - sched_priority: Priority
+# - cpu_affinity: List of CPU numbers
+#
+# @return List of settings
+#
+# @endif
+#
+def getThreadSettings():
+  threads_mutex.acquire()
+  threads_ = list(threads.items())
+  threads_mutex.release()
+
+  result_ = []
+  for thread_, (name_, tid_) in threads_:
+    if not thread_.is_alive():
+      continue
+    settings_ = {"name": name_,
+                 "tid": tid_,
+                 "sched_policy": None,
+                 "sched_priority": None,
+                 "cpu_affinity": None}
+    try:
+      if hasattr(os, "sched_getscheduler"):
+        settings_["sched_policy"] = schedPolicyToString(os.sched_getscheduler(tid_))
+        settings_["sched_priority"] = os.sched_getparam(tid_).sched_priority
+      if hasattr(os, "sched_getaffinity"):
+        settings_["cpu_affinity"] = sorted(os.sched_getaffinity(tid_))
+    except OSError:
+      pass
+    result_.append(settings_)
+  return result_
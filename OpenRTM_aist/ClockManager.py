@@ -59,6 +59,28 @@ class IClock:
     pass
 
 
+  ##
+  # @if jp
+  # @brief ʥäǼ
+  #
+  # TimeValue ʤᡢǡΥॹǻѤ
+  # 롣
+  #
+  # @return ߤλ [ns]
+  #
+  # @else
+  # @brief Getting time as an integer in nanoseconds
+  #
+  # This does not create a TimeValue, and is used to set timestamps
+  # of data etc.
+  #
+  # @return Current time [ns]
+  #
+  # @endif
+  def gettime_ns(self):
+    return self.gettime().toNsec()
+
+
   ##
   # @if jp
   # @brief ꤹ
@@ -90,7 +112,10 @@ class SystemClock(IClock):
 
   # virtual coil::TimeValue gettime() const;
   def gettime(self):
-    return OpenRTM_aist.Time().getTime()
+    return OpenRTM_aist.TimeValue.fromNsec(OpenRTM_aist.time_ns())
+
+  def gettime_ns(self):
+    return OpenRTM_aist.time_ns()
 
   # virtual bool settime(coil::TimeValue clocktime);
   def settime(self, clocktime):
@@ -151,20 +176,22 @@ class AdjustedClock(IClock):
   """
 
   def __init__(self):
-    self._offset = OpenRTM_aist.TimeValue(0.0)
+    self._offset = 0
     self._offsetMutex = threading.RLock()
     return
 
 
   # virtual coil::TimeValue gettime() const;
   def gettime(self):
-    guard = OpenRTM_aist.ScopedLock(self._offsetMutex)
-    return OpenRTM_aist.Time().getTime() - self._offset
+    return OpenRTM_aist.TimeValue.fromNsec(self.gettime_ns())
+
+  def gettime_ns(self):
+    return OpenRTM_aist.time_ns() - self._offset
     
   # virtual bool settime(coil::TimeValue clocktime);
   def settime(self, clocktime):
     guard = OpenRTM_aist.ScopedLock(self._offsetMutex)
-    self._offset = OpenRTM_aist.Time().getTime() - clocktime
+    self._offset = OpenRTM_aist.time_ns() - clocktime.toNsec()
     return True
 
 clockmgr = None
@@ -472,10 +472,19 @@ class PortActionListener:
 #
 # - EC_ATTACHED:          ExecutionContext ɲû
 # - EC_DETACHED:          ExecutionContext 
+# - EC_DEADLINE_MISS:     ExecutionContext μν¹ԼĶ
+#                         ꥹʤ ec_id ˲äĶ [s]
+#                         ˼롣
 #
 # @else
 # @brief The types of ExecutionContextActionListener
 # 
+# - EC_ATTACHED:          At attaching ExecutionContext
+# - EC_DETACHED:          At detaching ExecutionContext
+# - EC_DEADLINE_MISS:     When a cycle of the ExecutionContext overran
+#                         the period. The listener takes the overrun
+#                         time [s] in addition to ec_id.
+#
 # @endif
 class ExecutionContextActionListenerType:
   """
@@ -485,7 +494,8 @@ class ExecutionContextActionListenerType:
 
   EC_ATTACHED            = 0
   EC_DETACHED            = 1
-  EC_ACTION_LISTENER_NUM = 2
+  EC_DEADLINE_MISS       = 2
+  EC_ACTION_LISTENER_NUM = 3
 
 ##
 # @if jp
@@ -540,6 +550,7 @@ class ExecutionContextActionListener:
   def toString(type):
     typeString = ["ATTACH_EC",
                   "DETACH_EC",
+                  "DEADLINE_MISS",
                   "EC_ACTION_LISTENER_NUM"]
     if type < ExecutionContextActionListenerType.EC_ACTION_LISTENER_NUM:
       return typeString[type]
@@ -572,7 +583,7 @@ class ExecutionContextActionListener:
   #
   # @endif
   #virtual void operator()(UniqueId ec_id) = 0;
-  def __call__(self, ec_id):
+  def __call__(self, ec_id, *args):
     pass
 
 
@@ -1053,21 +1064,21 @@ class ExecutionContextActionListenerHolder:
   #
   # ϿƤꥹʤΥХå᥽åɤƤӽФ
   #
-  # @param info ConnectorInfo
-  # @param cdrdata ǡ
+  # @param ec_id ¹ԥƥȤID
+  # @param args EC_DEADLINE_MISS ξĶ [s]
   # @else
   #
   # @brief Notify listeners. 
   #
   # This calls the Callback method of the registered listener. 
   #
-  # @param info ConnectorInfo
-  # @param cdrdata Data
+  # @param ec_id ID of the execution context
+  # @param args Overrun time [s] for EC_DEADLINE_MISS
   # @endif
   #void notify(UniqueId ec_id);
-  def notify(self, ec_id):
+  def notify(self, ec_id, *args):
     for listener in self._listeners:
-      listener.listener(ec_id)
+      listener.listener(ec_id, *args)
     return
 
 
@@ -396,6 +396,10 @@ class ConfigAdmin:
     self._active     = True
     self._changed    = False
     self._params     = []
+    self._paramIndex = {}
+    self._appliedId  = None
+    self._dirty      = []
+    self._dirtyNames = set()
     self._emptyconf  = OpenRTM_aist.Properties()
     self._newConfig  = []
     self._listeners  = OpenRTM_aist.ConfigurationListeners()
@@ -477,6 +481,7 @@ class ConfigAdmin:
       return False
     conf_ = Config(param_name, var, def_val, trans)
     self._params.append(conf_)
+    self._paramIndex[param_name] = conf_
     conf_.setCallback(self.onUpdateParam)
     self.update(self.getActiveId(), param_name)
     
@@ -510,14 +515,11 @@ class ConfigAdmin:
   #
   # bool unbindParameter(const char* param_name);
   def unbindParameter(self, param_name):
-    find_idx = -1
-    for (find_idx,param) in enumerate(self._params):
-      if param.name == param_name:
-        break
-    if find_idx == -1:
+    conf_ = self._paramIndex.pop(param_name, None)
+    if conf_ is None:
       return False
 
-    del self._params[find_idx]
+    self._params.remove(conf_)
 
     # configsets
     leaf = self._configsets.getLeaf()
@@ -629,6 +631,22 @@ class ConfigAdmin:
   #
   # @endif
   #
+  # @if jp
+  #
+  # update(void) ϡ󤹤٤ƤΥѥ᡼򹹿ե졼
+  # 󥻥åȤƥ֤Ǥ硢setConfigurationSetValues()
+  # ѹ줿ѥ᡼Τߤ򹹿롣ʳξϤ٤Ƥ
+  # ѥ᡼򹹿롣
+  #
+  # @else
+  #
+  # If the configuration set whose values were last applied to all
+  # the parameters is still active, update(void) updates only the
+  # parameters changed by setConfigurationSetValues(). Otherwise all
+  # the parameters are updated.
+  #
+  # @endif
+  #
   def update(self, config_set=None, config_param=None):
     # update(const char* config_set)
     
@@ -641,6 +659,8 @@ class ConfigAdmin:
         if prop.hasKey(self._params[i].name):
           # self._changedParam is updated here
           self._params[i].update(prop.getProperty(self._params[i].name))
+      self._appliedId = config_set
+      self.clearDirty()
       self.onUpdate(config_set)
 
     # update(const char* config_set, const char* config_param)
@@ -648,21 +668,93 @@ class ConfigAdmin:
       self._changedParam = []
       key = config_set
       key = key+"."+config_param
-      for conf in self._params:
-        if conf.name == config_param:
-          conf.update(self._configsets.getProperty(key))
-          #self.onUpdateParam(config_set, config_param)
-          return
+      conf = self._paramIndex.get(config_param)
+      if conf is not None:
+        conf.update(self._configsets.getProperty(key))
+        #self.onUpdateParam(config_set, config_param)
+        if config_set != self._appliedId:
+          self._appliedId = None
+        return
 
     # update()
     if config_set is None and config_param is None:
       self._changedParam = []
       if self._changed and self._active:
-        self.update(self._activeId)
+        if self._appliedId == self._activeId:
+          self.updateDirty()
+        else:
+          self.update(self._activeId)
         self._changed = False
       return
 
 
+  ##
+  # @if jp
+  #
+  # @brief ѹ줿ѥ᡼Τߤ򹹿
+  #
+  # ƥ֤ʥե졼󥻥åȤΤιʹߤ
+  # ѹ줿ѥ᡼ͤǥե졼ѥ᡼򹹿
+  # 롣ѥ᡼ѹ줿˹롣
+  #
+  # @param self 
+  #
+  # @else
+  #
+  # @brief Update only the changed parameters
+  #
+  # The configuration parameters are updated with the values of the
+  # active configuration set changed since the last update. The
+  # parameters are updated in the order of the changes.
+  #
+  # @param self 
+  #
+  # @endif
+  def updateDirty(self):
+    prop = self._configsets.findNode(self._activeId)
+    if prop is None:
+      return
+    dirty_ = self._dirty
+    self.clearDirty()
+    for name_ in dirty_:
+      conf_ = self._paramIndex.get(name_)
+      if conf_ is not None and prop.hasKey(name_):
+        # self._changedParam is updated here
+        conf_.update(prop.getProperty(name_))
+    self.onUpdate(self._activeId)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ѥ᡼ѹѤߤȤƵϿ
+  # @param self 
+  # @param names ѥ᡼̾Υꥹ
+  # @else
+  # @brief Record parameters as changed
+  # @param self 
+  # @param names List of parameter names
+  # @endif
+  def markDirty(self, names):
+    for name_ in names:
+      if name_ in self._paramIndex and name_ not in self._dirtyNames:
+        self._dirtyNames.add(name_)
+        self._dirty.append(name_)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ѹѤߥѥ᡼εϿ򥯥ꥢ
+  # @else
+  # @brief Clear the record of changed parameters
+  # @endif
+  def clearDirty(self):
+    self._dirty = []
+    self._dirtyNames = set()
+    return
+
+
   ##
   # @if jp
   # 
@@ -690,14 +782,7 @@ class ConfigAdmin:
   # @endif
   # bool isExist(const char* name);
   def isExist(self, param_name):
-    if not self._params:
-      return False
-    
-    for conf in self._params:
-      if conf.name == param_name:
-        return True
-
-    return False
+    return param_name in self._paramIndex
 
 
   ##
@@ -939,6 +1024,8 @@ class ConfigAdmin:
     #  return False
 
     p.mergeProperties(config_set)
+    if node_ == self._appliedId:
+      self.markDirty(config_set.propertyNames())
     self._changed = True
     self._active  = False
     self.onSetConfigurationSet(config_set)
@@ -1105,6 +1192,8 @@ class ConfigAdmin:
       del p
 
     del self._newConfig[idx]
+    if config_id == self._appliedId:
+      self._appliedId = None
 
     self._changed = True
     self._active  = False
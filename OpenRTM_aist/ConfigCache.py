@@ -0,0 +1,389 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file ConfigCache.py
+# @brief On-disk cache of parsed configuration files
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import os
+import sys
+import errno
+import hashlib
+import threading
+
+try:
+  import cPickle as pickle
+except ImportError:
+  import pickle
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @brief キャッシュディレクトリを指定する環境変数
+# @else
+# @brief Environment variable to specify the cache directory
+# @endif
+CONFIG_CACHE_ENV = "RTC_CONFIG_CACHE_DIR"
+
+CONFIG_CACHE_VERSION = 1
+
+
+##
+# @if jp
+# @class ConfigCache
+# @brief 設定ファイルの解析結果のディスクキャッシュ
+#
+# rtc.conf やコンポーネントの設定ファイルを Properties.readEntries()
+# で解析した (キー, 値) のリストを、ファイルのパス、サイズ、更新時刻
+# とともにキャッシュディレクトリに pickle で保存する。次回以降はパス、
+# サイズ、更新時刻が一致する場合に解析を省略し、保存されたリストを記
+# 述順にプロパティに設定する。このため結果は Properties.load() と同じ
+# になる。
+#
+# キャッシュの読み書きに失敗した場合はファイルを解析する。キャッシュ
+# ファイルは Python のメジャーバージョン毎に作成される。
+#
+# @since 2.0.0
+#
+# @else
+# @class ConfigCache
+# @brief On-disk cache of parsed configuration files
+#
+# The list of (key, value) obtained by parsing rtc.conf or component
+# configuration files with Properties.readEntries() is pickled into
+# the cache directory with the path, size and modification time of
+# the file. Afterwards, if the path, size and modification time
+# match, parsing is skipped and the stored list is set to the
+# properties in the order of appearance, so the result is the same as
+# Properties.load().
+#
+# If reading or writing the cache fails, the file is parsed. Cache
+# files are created for each major version of Python.
+#
+# @since 2.0.0
+#
+# @endif
+class ConfigCache:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @param cache_dir キャッシュディレクトリ
+  # @else
+  # @brief Constructor
+  # @param cache_dir Cache directory
+  # @endif
+  def __init__(self, cache_dir):
+    self._cacheDir = cache_dir
+    self._mutex = threading.RLock()
+    self._hits = 0
+    self._misses = 0
+    return
+
+
+  ##
+  # @if jp
+  # @brief 設定ファイルを読み込む
+  #
+  # キャッシュが有効であればキャッシュから、そうでなければファイルを
+  # 解析してプロパティに設定し、キャッシュを更新する。
+  #
+  # @param self
+  # @param prop 設定先のプロパティ
+  # @param file_name 設定ファイルのパス
+  #
+  # @return キャッシュを使用した場合 True
+  #
+  # @exception IOError, OSError ファイルを開けない場合
+  #
+  # @else
+  # @brief Load a configuration file
+  #
+  # The entries are read from the cache if it is valid, otherwise the
+  # file is parsed and the cache is updated, and they are set to the
+  # properties.
+  #
+  # @param self
+  # @param prop Properties to be set
+  # @param file_name Path of the configuration file
+  #
+  # @return True if the cache was used
+  #
+  # @exception IOError, OSError The file cannot be opened
+  #
+  # @endif
+  def load(self, prop, file_name):
+    path_ = os.path.abspath(file_name)
+    stamp_ = getFileStamp(path_)
+    if stamp_ is None:
+      raise IOError(errno.ENOENT, os.strerror(errno.ENOENT), path_)
+    stamp_ = (path_,) + stamp_
+    cache_file_ = self.getCacheFile(path_)
+
+    entries_ = self.read(cache_file_, stamp_)
+    hit_ = entries_ is not None
+    if not hit_:
+      with open(path_, "r") as fd:
+        entries_ = prop.readEntries(fd)
+      self.write(cache_file_, stamp_, entries_)
+
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    if hit_:
+      self._hits += 1
+    else:
+      self._misses += 1
+    del guard
+
+    for key, value in entries_:
+      prop.setProperty(key, value)
+    return hit_
+
+
+  ##
+  # @if jp
+  # @brief 設定ファイルに対応するキャッシュファイルのパスを取得する
+  # @else
+  # @brief Get the path of the cache file of a configuration file
+  # @endif
+  def getCacheFile(self, path):
+    digest_ = hashlib.sha1(path.encode("utf-8")).hexdigest()
+    return os.path.join(self._cacheDir,
+                        "%s.py%d.conf_cache" % (digest_, sys.version_info[0]))
+
+
+  ##
+  # @if jp
+  # @brief キャッシュファイルを読み込む
+  # @return (キー, 値) のリスト。キャッシュが無効な場合は None
+  # @else
+  # @brief Read a cache file
+  # @return List of (key, value). None if the cache is not valid
+  # @endif
+  def read(self, cache_file, stamp):
+    data_ = readPickleFile(cache_file)
+    try:
+      if data_.get("version") != CONFIG_CACHE_VERSION or \
+            data_.get("stamp") != stamp:
+        return None
+      return data_["entries"]
+    except Exception:
+      return None
+
+
+  ##
+  # @if jp
+  # @brief キャッシュファイルを書き込む
+  # @return 書き込みに成功した場合 True
+  # @else
+  # @brief Write a cache file
+  # @return True if written successfully
+  # @endif
+  def write(self, cache_file, stamp, entries):
+    return writePickleFile(cache_file, {"version": CONFIG_CACHE_VERSION,
+                                        "stamp": stamp,
+                                        "entries": entries})
+
+
+  ##
+  # @if jp
+  # @brief キャッシュの使用状況を取得する
+  # @return (キャッシュを使用した回数, ファイルを解析した回数)
+  # @else
+  # @brief Get the usage of the cache
+  # @return (number of cache hits, number of parsed files)
+  # @endif
+  def getStatistics(self):
+    return (self._hits, self._misses)
+
+
+
+config_caches = {}
+config_caches_mutex = threading.RLock()
+
+
+##
+# @if jp
+# @brief ファイルのサイズと更新時刻を取得する
+#
+# キャッシュやファイル監視でファイルの変更を判定するために使用する。
+# 更新時刻は可能であればナノ秒単位の値を使用する。
+#
+# @param file_name ファイルのパス
+# @return (サイズ, 更新時刻)。ファイルが存在しない場合は None
+#
+# @else
+# @brief Get the size and the modification time of a file
+#
+# This is used to detect changes of files by caches and watchers. The
+# modification time in nanoseconds is used if available.
+#
+# @param file_name Path of the file
+# @return (size, modification time). None if the file does not exist
+#
+# @endif
+def getFileStamp(file_name):
+  try:
+    st_ = os.stat(file_name)
+  except OSError:
+    return None
+  return (st_.st_size, getattr(st_, "st_mtime_ns", st_.st_mtime))
+
+
+##
+# @if jp
+# @brief pickle で保存されたファイルを読み込む
+# @param file_name ファイルのパス
+# @return 読み込んだオブジェクト。読み込めない場合は None
+# @else
+# @brief Read a pickled file
+# @param file_name Path of the file
+# @return The object read. None if it cannot be read
+# @endif
+def readPickleFile(file_name):
+  try:
+    with open(file_name, "rb") as fd:
+      return pickle.load(fd)
+  except Exception:
+    return None
+
+
+##
+# @if jp
+# @brief オブジェクトを pickle でファイルに書き込む
+#
+# ディレクトリが存在しない場合は作成する。一時ファイルに書き込んだ
+# 後に置き換えるため、同時に読み込まれても不完全な内容が読まれるこ
+# とはない。
+#
+# @param file_name ファイルのパス
+# @param data 書き込むオブジェクト
+# @return 書き込みに成功した場合 True
+#
+# @else
+# @brief Write an object to a file with pickle
+#
+# The directory is created if it does not exist. The file is written
+# to a temporary file and then replaced, so a concurrent reader never
+# reads an incomplete content.
+#
+# @param file_name Path of the file
+# @param data Object to be written
+# @return True if written successfully
+#
+# @endif
+def writePickleFile(file_name, data):
+  dir_ = os.path.dirname(file_name)
+  tmp_ = "%s.%d.%d.tmp" % (file_name, os.getpid(),
+                           threading.current_thread().ident)
+  try:
+    if dir_ and not os.path.isdir(dir_):
+      os.makedirs(dir_)
+    with open(tmp_, "wb") as fd:
+      pickle.dump(data, fd, 2)
+    if hasattr(os, "replace"):
+      os.replace(tmp_, file_name)
+    else:
+      if os.path.exists(file_name):
+        os.remove(file_name)
+      os.rename(tmp_, file_name)
+    return True
+  except Exception:
+    try:
+      os.remove(tmp_)
+    except OSError:
+      pass
+    return False
+
+
+##
+# @if jp
+# @brief キャッシュディレクトリを取得する
+#
+# プロパティの manager.config_cache.dir、環境変数 RTC_CONFIG_CACHE_DIR
+# の順に参照する。
+#
+# @param prop プロパティ
+# @return キャッシュディレクトリ。キャッシュを使用しない場合は空文字列
+#
+# @else
+# @brief Get the cache directory
+#
+# manager.config_cache.dir of the properties and the environment
+# variable RTC_CONFIG_CACHE_DIR are referred in this order.
+#
+# @param prop Properties
+# @return Cache directory. An empty string if the cache is not used
+#
+# @endif
+def getConfigCacheDir(prop):
+  dir_ = prop.getProperty("manager.config_cache.dir")
+  if not dir_:
+    dir_ = os.getenv(CONFIG_CACHE_ENV, "")
+  return dir_
+
+
+##
+# @if jp
+# @brief キャッシュディレクトリの ConfigCache を取得する
+# @param cache_dir キャッシュディレクトリ
+# @return ConfigCache
+# @else
+# @brief Get the ConfigCache of a cache directory
+# @param cache_dir Cache directory
+# @return ConfigCache
+# @endif
+def getConfigCache(cache_dir):
+  guard = OpenRTM_aist.ScopedLock(config_caches_mutex)
+  cache_ = config_caches.get(cache_dir)
+  if cache_ is None:
+    cache_ = ConfigCache(cache_dir)
+    config_caches[cache_dir] = cache_
+  return cache_
+
+
+##
+# @if jp
+# @brief 設定ファイルを読み込む
+#
+# cache_dir が指定されている場合は ConfigCache を使用し、そうでなけれ
+# ば Properties.load() で読み込む。
+#
+# @param prop 設定先のプロパティ
+# @param file_name 設定ファイルのパス
+# @param cache_dir キャッシュディレクトリ。空文字列でキャッシュを使用しない
+#
+# @exception IOError, OSError ファイルを開けない場合
+#
+# @else
+# @brief Load a configuration file
+#
+# ConfigCache is used if cache_dir is given, otherwise the file is
+# read by Properties.load().
+#
+# @param prop Properties to be set
+# @param file_name Path of the configuration file
+# @param cache_dir Cache directory. An empty string not to use the cache
+#
+# @exception IOError, OSError The file cannot be opened
+#
+# @endif
+def loadConfigFile(prop, file_name, cache_dir=""):
+  if cache_dir:
+    getConfigCache(cache_dir).load(prop, file_name)
+    return
+
+  with open(file_name, "r") as fd:
+    prop.load(fd)
+  return
@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file ConfigWatcher.py
+# @brief Hot reload of component configuration files
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import threading
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @class ConfigWatcher
+# @brief コンポーネントの設定ファイルの変更を監視するクラス
+#
+# Manager の Timer から周期的に check() を呼び出し、コンポーネントの
+# 型およびインスタンスの設定ファイルのサイズと更新時刻を確認する。変
+# 更された場合は Manager.loadComponentConfig() で設定を読み直し、各
+# コンフィギュレーションセットについて現在の値と異なるパラメータのみ
+# を ConfigAdmin.setConfigurationSetValues() で設定する。存在しない
+# コンフィギュレーションセットは addConfigurationSet() で追加する。
+#
+# 変更があった場合は最後にアクティブなコンフィギュレーションセットを
+# 再度アクティブ化する。変更されたパラメータは、SDO からの設定と同様
+# に、コンポーネントの次の update() (on_activated、on_state_update
+# 等) で ConfigAdmin によりまとめて反映される。このため ConfigAdmin
+# のリスナーは設定ファイルの変更1回につき1度ずつ通知される。
+#
+# ファイルから削除されたパラメータはコンポーネントから削除されない。
+#
+# rtc.conf の以下の項目で有効にする。
+#
+# - manager.config_watch.enable: YES で有効 (デフォルト: NO)
+# - manager.config_watch.interval: 確認周期 [s] (デフォルト: 1.0)
+#
+# @since 2.0.0
+#
+# @else
+# @class ConfigWatcher
+# @brief Watcher of the configuration files of components
+#
+# check() is called periodically from the Timer of the Manager, and
+# checks the size and the modification time of the type and the
+# instance configuration files of components. If they are changed,
+# the configuration is reloaded by Manager.loadComponentConfig(), and
+# for each configuration set only the parameters that differ from the
+# current values are set by ConfigAdmin.setConfigurationSetValues().
+# Configuration sets that do not exist are added by
+# addConfigurationSet().
+#
+# If anything was changed, the active configuration set is activated
+# again at the end. As with the configuration through SDO, the changed
+# parameters are applied together by ConfigAdmin on the next update()
+# of the component (on_activated, on_state_update, etc.), so the
+# listeners of ConfigAdmin are notified once per change of the
+# configuration files.
+#
+# Parameters removed from the files are not removed from the
+# component.
+#
+# This is enabled by the following keys of rtc.conf.
+#
+# - manager.config_watch.enable: YES to enable (default: NO)
+# - manager.config_watch.interval: Interval of the check [s]
+#                                  (default: 1.0)
+#
+# @since 2.0.0
+#
+# @endif
+class ConfigWatcher:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @param self
+  # @param manager Manager
+  # @else
+  # @brief Constructor
+  # @param self
+  # @param manager Manager
+  # @endif
+  def __init__(self, manager):
+    self._manager = manager
+    self._rtcout = manager.getLogbuf("config_watcher")
+    self._entries = {}
+    self._mutex = threading.RLock()
+    return
+
+
+  ##
+  # @if jp
+  # @brief コンポーネントの設定ファイルの監視を開始する
+  #
+  # 現在のサイズと更新時刻を記録する。すでに監視している場合は監視す
+  # るファイルを置き換える。
+  #
+  # @param self
+  # @param comp RTコンポーネント
+  # @param files 設定ファイルのパスのリスト
+  #
+  # @else
+  # @brief Start watching the configuration files of a component
+  #
+  # The current sizes and modification times are recorded. If the
+  # component is already watched, the watched files are replaced.
+  #
+  # @param self
+  # @param comp RT-Component
+  # @param files List of paths of the configuration files
+  #
+  # @endif
+  def watch(self, comp, files):
+    files_ = [f for f in files if f]
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    if not files_:
+      self._entries.pop(id(comp), None)
+      return
+    self._entries[id(comp)] = self.Entry(comp, files_,
+                                         [self.getStamp(f) for f in files_])
+    self._rtcout.RTC_DEBUG("Watching %s: %s",
+                           (comp.getInstanceName(), OpenRTM_aist.flatten(files_)))
+    return
+
+
+  ##
+  # @if jp
+  # @brief コンポーネントの設定ファイルの監視を終了する
+  # @param self
+  # @param comp RTコンポーネント
+  # @else
+  # @brief Stop watching the configuration files of a component
+  # @param self
+  # @param comp RT-Component
+  # @endif
+  def unwatch(self, comp):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    self._entries.pop(id(comp), None)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 設定ファイルの変更を確認する
+  #
+  # Timer から呼び出される。変更された設定ファイルを持つコンポーネン
+  # トの設定を読み直す。
+  #
+  # @param self
+  #
+  # @else
+  # @brief Check the changes of the configuration files
+  #
+  # This is called from the Timer. The configuration of the components
+  # whose configuration files were changed is reloaded.
+  #
+  # @param self
+  #
+  # @endif
+  def check(self):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    entries_ = list(self._entries.values())
+    del guard
+
+    for entry_ in entries_:
+      stamps_ = [self.getStamp(f) for f in entry_.files]
+      if stamps_ == entry_.stamps:
+        continue
+      entry_.stamps = stamps_
+      self._rtcout.RTC_INFO("Configuration file of %s changed.",
+                            entry_.comp.getInstanceName())
+      try:
+        self.reload(entry_.comp)
+      except:
+        self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+    return
+
+
+  ##
+  # @if jp
+  # @brief コンポーネントの設定を読み直して変更を反映する
+  # @param self
+  # @param comp RTコンポーネント
+  # @return 変更されたパラメータの数
+  # @else
+  # @brief Reload the configuration of a component and apply the changes
+  # @param self
+  # @param comp RT-Component
+  # @return Number of the changed parameters
+  # @endif
+  def reload(self, comp):
+    prop_ = self._manager.loadComponentConfig(comp, [])
+    conf_ = prop_.findNode("conf")
+    if conf_ is None:
+      return 0
+
+    admin_ = comp.getConfigService()
+    changed_ = 0
+    for set_ in conf_.getLeaf():
+      id_ = set_.getName()
+      diff_ = self.diff(admin_.getConfigurationSet(id_), set_)
+      if diff_ is None:
+        continue
+
+      if admin_.haveConfig(id_):
+        admin_.setConfigurationSetValues(diff_)
+      else:
+        admin_.addConfigurationSet(diff_)
+      keys_ = diff_.propertyNames()
+      self._rtcout.RTC_DEBUG("%s: conf.%s changed: %s",
+                             (comp.getInstanceName(), id_,
+                              OpenRTM_aist.flatten(keys_)))
+      changed_ += len(keys_)
+
+    if changed_:
+      admin_.activateConfigurationSet(admin_.getActiveId())
+    return changed_
+
+
+  ##
+  # @if jp
+  # @brief コンフィギュレーションセットの差分を取得する
+  # @param self
+  # @param current 現在のコンフィギュレーションセット
+  # @param new 新しいコンフィギュレーションセット
+  # @return 値が異なるパラメータのプロパティ。差分がない場合は None
+  # @else
+  # @brief Get the difference of configuration sets
+  # @param self
+  # @param current Current configuration set
+  # @param new New configuration set
+  # @return Properties of the parameters with different values. None
+  #         if there is no difference
+  # @endif
+  def diff(self, current, new):
+    diff_ = None
+    for key_ in new.propertyNames():
+      value_ = new.getProperty(key_)
+      if current.getProperty(key_) == value_:
+        continue
+      if diff_ is None:
+        diff_ = OpenRTM_aist.Properties(key=new.getName())
+      diff_.setProperty(key_, value_)
+    return diff_
+
+
+  ##
+  # @if jp
+  # @brief ファイルのサイズと更新時刻を取得する
+  # @param self
+  # @param file_name ファイルのパス
+  # @return (サイズ, 更新時刻)。ファイルが存在しない場合は None
+  # @else
+  # @brief Get the size and the modification time of a file
+  # @param self
+  # @param file_name Path of the file
+  # @return (size, modification time). None if the file does not exist
+  # @endif
+  def getStamp(self, file_name):
+    return OpenRTM_aist.getFileStamp(file_name)
+
+
+  ##
+  # @if jp
+  # @class Entry
+  # @brief 監視対象の情報
+  # @else
+  # @class Entry
+  # @brief Information of a watched component
+  # @endif
+  class Entry:
+    def __init__(self, comp, files, stamps):
+      self.comp = comp
+      self.files = files
+      self.stamps = stamps
+      return
@@ -120,7 +120,7 @@ class DataFlowComponentBase(OpenRTM_aist.RTObject_impl, OpenRTM__POA.DataFlowCom
       if self._readAll:
         self.readAll()
       
-      ret = self.onExecute(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onExecute(ec_id))
 
       if self._writeAll:
         self.writeAll()
@@ -177,7 +177,7 @@ class DataFlowComponentBase(OpenRTM_aist.RTObject_impl, OpenRTM__POA.DataFlowCom
     ret = RTC.RTC_ERROR
     try:
       self.preOnStateUpdate(ec_id)
-      ret = self.onStateUpdate(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onStateUpdate(ec_id))
       self._configsets.update()
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
@@ -227,7 +227,7 @@ class DataFlowComponentBase(OpenRTM_aist.RTObject_impl, OpenRTM__POA.DataFlowCom
     ret = RTC.RTC_ERROR
     try:
       self.preOnRateChanged(ec_id)
-      ret = self.onRateChanged(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onRateChanged(ec_id))
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       ret = RTC.RTC_ERROR
@@ -0,0 +1,579 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file DataflowExecutionContext.py
+# @brief Periodic execution context ordered by data port connections
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import heapq
+import threading
+
+from omniORB import CORBA
+
+import OpenRTM_aist
+import RTC
+
+
+##
+# @if jp
+# @class DataflowWorkerPool
+# @brief 独立したRTCの処理を並列に実行するスレッドプール
+#
+# run() に与えた関数群をプールのスレッドと呼び出し元のスレッドで実行
+# し、全ての関数が終了するまで待機する。
+#
+# @since 2.0.0
+#
+# @else
+# @class DataflowWorkerPool
+# @brief Thread pool executing independent RTCs in parallel
+#
+# The functions given to run() are executed by the threads of the pool
+# and the calling thread, and run() waits until all of them finish.
+#
+# @since 2.0.0
+#
+# @endif
+class DataflowWorkerPool:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @param self
+  # @param num スレッド数
+  # @else
+  # @brief Constructor
+  # @param self
+  # @param num Number of threads
+  # @endif
+  def __init__(self, num):
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("dataflow_ec_worker")
+    self._cond = threading.Condition(threading.RLock())
+    self._jobs = []
+    self._pending = 0
+    self._running = True
+    self._threads = []
+    for i in range(num):
+      th_ = threading.Thread(target=self.svc)
+      th_.daemon = True
+      th_.start()
+      self._threads.append(th_)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 関数群を実行し、全ての終了を待つ
+  # @param self
+  # @param funcs 実行する関数のリスト
+  # @else
+  # @brief Execute the functions and wait for all of them
+  # @param self
+  # @param funcs List of functions to be executed
+  # @endif
+  def run(self, funcs):
+    self._cond.acquire()
+    self._jobs.extend(funcs)
+    self._pending += len(funcs)
+    self._cond.notify_all()
+    self._cond.release()
+
+    while self.runOne():
+      pass
+
+    self._cond.acquire()
+    while self._pending > 0:
+      self._cond.wait()
+    self._cond.release()
+    return
+
+
+  def runOne(self):
+    self._cond.acquire()
+    if not self._jobs:
+      self._cond.release()
+      return False
+    func_ = self._jobs.pop(0)
+    self._cond.release()
+
+    try:
+      func_()
+    finally:
+      self._cond.acquire()
+      self._pending -= 1
+      if self._pending == 0:
+        self._cond.notify_all()
+      self._cond.release()
+    return True
+
+
+  def svc(self):
+    while True:
+      self._cond.acquire()
+      while self._running and not self._jobs:
+        self._cond.wait()
+      running_ = self._running
+      self._cond.release()
+      if not running_:
+        return
+      try:
+        self.runOne()
+      except:
+        self._rtcout.RTC_ERROR("Executing a component failed.")
+        self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+
+
+  ##
+  # @if jp
+  # @brief スレッドを終了する
+  # @else
+  # @brief Terminate the threads
+  # @endif
+  def finalize(self):
+    self._cond.acquire()
+    self._running = False
+    self._cond.notify_all()
+    self._cond.release()
+    for th_ in self._threads:
+      th_.join()
+    self._threads = []
+    return
+
+
+
+##
+# @if jp
+# @class DataflowExecutionContextWorker
+# @brief データフロー順にRTCを実行する ExecutionContextWorker
+#
+# 参加しているRTCのデータポートの接続 (PortAdmin が保持するポートの
+# コネクタプロファイル) から OutPort 側のRTCを上流とする依存グラフを
+# 構築し、トポロジカル順序でRTCを実行する。依存関係のないRTCは現在
+# の順序 (初期状態ではアタッチ順) を維持し、循環する接続に含まれる
+# RTCはその順序で最後に実行する。
+#
+# 依存グラフは、RTCの追加・削除時、ローカルのRTCのポートの接続・切
+# 断時、および requestSort() の呼び出し時に、周期の境界で再構築する。
+# リモートのRTCの接続変更は検知できないため、requestSort() を使用する。
+#
+# ワーカースレッド数を設定した場合、同じ深さにある互いに依存しない
+# RTCの on_execute をスレッドプールで並列に実行する。
+#
+# @since 2.0.0
+#
+# @else
+# @class DataflowExecutionContextWorker
+# @brief ExecutionContextWorker executing RTCs in dataflow order
+#
+# A dependency graph, where the RTC owning an OutPort is upstream of
+# the RTCs owning the connected InPorts, is built from the data port
+# connections of the participants (the connector profiles of the
+# ports held by PortAdmin), and the RTCs are executed in topological
+# order. RTCs without dependency keep their current order (initially
+# the attach order), and RTCs in cyclic connections are executed last
+# in that order.
+#
+# The graph is rebuilt at a cycle boundary when an RTC is added or
+# removed, when a port of a local RTC is connected or disconnected,
+# and when requestSort() is called. Since connection changes of
+# remote RTCs cannot be detected, requestSort() should be used for
+# them.
+#
+# If the number of worker threads is set, on_execute of independent
+# RTCs at the same depth is executed in parallel by a thread pool.
+#
+# @since 2.0.0
+#
+# @endif
+class DataflowExecutionContextWorker(OpenRTM_aist.ExecutionContextWorker):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @else
+  # @brief Constructor
+  # @endif
+  def __init__(self):
+    OpenRTM_aist.ExecutionContextWorker.__init__(self)
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("dataflow_ec_worker")
+    self._levels = []
+    self._pool = None
+    self._dirty = True
+    self._listeners = {}
+    return
+
+
+  ##
+  # @if jp
+  # @brief 終了処理
+  # @else
+  # @brief Finalization
+  # @endif
+  def exit(self):
+    OpenRTM_aist.ExecutionContextWorker.exit(self)
+    self.setWorkerThreads(0)
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    for comp in list(self._listeners.keys()):
+      self.removeConnectListeners(comp)
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  # @brief 並列実行に使用するワーカースレッド数を設定する
+  #
+  # @param self
+  # @param num スレッド数。0 の場合は全てのRTCを EC のスレッドで実行する
+  #
+  # @else
+  # @brief Set the number of worker threads for parallel execution
+  #
+  # @param self
+  # @param num Number of threads. If 0, all RTCs are executed in the
+  #            thread of the EC
+  #
+  # @endif
+  def setWorkerThreads(self, num):
+    if self._pool:
+      self._pool.finalize()
+      self._pool = None
+    if num > 0:
+      self._pool = DataflowWorkerPool(num)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 次の周期の境界で依存グラフを再構築する
+  # @else
+  # @brief Rebuild the dependency graph at the next cycle boundary
+  # @endif
+  def requestSort(self):
+    self._dirty = True
+    return
+
+
+  ##
+  # @if jp
+  # @brief 現在の実行順序を取得する
+  # @return RTObjectStateMachine のリスト
+  # @else
+  # @brief Get the current execution order
+  # @return List of RTObjectStateMachine
+  # @endif
+  def getExecutionOrder(self):
+    return list(self._comps)
+
+
+  def start(self):
+    self.updateComponentList()
+    return OpenRTM_aist.ExecutionContextWorker.start(self)
+
+
+  def invokeWorkerDo(self):
+    if self._pool is None or self._measuring:
+      OpenRTM_aist.ExecutionContextWorker.invokeWorkerDo(self)
+      return
+
+    self._rtcout.RTC_PARANOID("invokeWorkerDo()")
+    for level in self._levels:
+      if len(level) == 1:
+        level[0].workerDo()
+      else:
+        self._pool.run([comp.workerDo for comp in level])
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTCリストを更新し、必要に応じて実行順序を再計算する
+  # @else
+  # @brief Update the RTC list and re-sort the execution order if needed
+  # @endif
+  def updateComponentList(self):
+    if not self._listChanged and not self._dirty:
+      return
+
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    OpenRTM_aist.ExecutionContextWorker.updateComponentList(self)
+
+    for comp in list(self._listeners.keys()):
+      if comp not in self._comps:
+        self.removeConnectListeners(comp)
+        self._dirty = True
+    for comp in self._comps:
+      if comp not in self._listeners:
+        self.addConnectListeners(comp)
+        self._dirty = True
+
+    if self._dirty:
+      self._dirty = False
+      self.sortComponents()
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  # @brief 依存グラフを構築し、RTCリストをトポロジカル順序に並べ替える
+  # @else
+  # @brief Build the dependency graph and sort the RTC list topologically
+  # @endif
+  def sortComponents(self):
+    comps_ = self._comps
+    len_ = len(comps_)
+    succ_ = [set() for i in range(len_)]
+    indeg_ = [0] * len_
+    for i in range(len_):
+      for j in self.getDownstream(comps_[i], comps_):
+        if j != i and j not in succ_[i]:
+          succ_[i].add(j)
+          indeg_[j] += 1
+
+    ready_ = [i for i in range(len_) if indeg_[i] == 0]
+    heapq.heapify(ready_)
+    depth_ = [0] * len_
+    order_ = []
+    while ready_:
+      i = heapq.heappop(ready_)
+      order_.append(i)
+      for j in succ_[i]:
+        depth_[j] = max(depth_[j], depth_[i] + 1)
+        indeg_[j] -= 1
+        if indeg_[j] == 0:
+          heapq.heappush(ready_, j)
+
+    if len(order_) < len_:
+      self._rtcout.RTC_WARN("Cyclic data port connections found. "
+                            "%d RTCs are executed last.",
+                            len_ - len(order_))
+      cyclic_ = [i for i in range(len_) if i not in order_]
+      base_ = max([depth_[i] for i in order_] + [-1]) + 1
+      for i in cyclic_:
+        depth_[i] = base_
+        base_ += 1
+      order_.extend(cyclic_)
+
+    levels_ = {}
+    for i in order_:
+      levels_.setdefault(depth_[i], []).append(comps_[i])
+
+    self._comps = tuple([comps_[i] for i in order_])
+    self._levels = [levels_[d] for d in sorted(levels_.keys())]
+    self._rtcout.RTC_DEBUG("Execution order: %s", str(order_))
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTCの OutPort に接続された下流のRTCを取得する
+  #
+  # @param self
+  # @param comp RTObjectStateMachine
+  # @param comps RTObjectStateMachine のリスト
+  # @return 下流のRTCの comps 中のインデックスのリスト
+  #
+  # @else
+  # @brief Get the downstream RTCs connected to the OutPorts of the RTC
+  #
+  # @param self
+  # @param comp RTObjectStateMachine
+  # @param comps List of RTObjectStateMachine
+  # @return List of indexes of the downstream RTCs in comps
+  #
+  # @endif
+  def getDownstream(self, comp, comps):
+    ret_ = []
+    try:
+      rtc_ = comp.getRTObject()._narrow(RTC.RTObject)
+      if CORBA.is_nil(rtc_):
+        return ret_
+      for port in rtc_.get_ports():
+        pprof_ = port.get_port_profile()
+        prop_ = OpenRTM_aist.Properties()
+        OpenRTM_aist.NVUtil.copyToProperties(prop_, pprof_.properties)
+        if prop_.getProperty("port.port_type") != "DataOutPort":
+          continue
+        for cprof in pprof_.connector_profiles:
+          for peer in cprof.ports:
+            if peer._is_equivalent(port):
+              continue
+            owner_ = peer.get_port_profile().owner
+            for j in range(len(comps)):
+              if comps[j].isEquivalent(owner_):
+                ret_.append(j)
+    except:
+      self._rtcout.RTC_WARN("Getting data port connections failed.")
+      self._rtcout.RTC_DEBUG(OpenRTM_aist.Logger.print_exception())
+    return ret_
+
+
+  def addConnectListeners(self, comp):
+    listeners_ = []
+    try:
+      poa_ = OpenRTM_aist.Manager.instance().getPOA()
+      rtobj_ = poa_.reference_to_servant(comp.getRTObject())
+      for type_ in (OpenRTM_aist.PortConnectRetListenerType.ON_CONNECTED,
+                    OpenRTM_aist.PortConnectRetListenerType.ON_DISCONNECTED):
+        listeners_.append((type_, rtobj_.addPortConnectRetListener(type_,
+                                                                   self.onConnectionChanged)))
+    except:
+      self._rtcout.RTC_DEBUG("Connection changes of a remote RTC are not monitored.")
+      rtobj_ = None
+    self._listeners[comp] = (rtobj_, listeners_)
+    return
+
+
+  def removeConnectListeners(self, comp):
+    rtobj_, listeners_ = self._listeners.pop(comp)
+    for type_, listener_ in listeners_:
+      rtobj_.removePortConnectRetListener(type_, listener_)
+    return
+
+
+  def onConnectionChanged(self, portname, cprofile, ret):
+    self._rtcout.RTC_DEBUG("Connection of %s changed.", portname)
+    self._dirty = True
+    return
+
+
+
+##
+# @if jp
+# @class DataflowExecutionContext
+# @brief データフロー順に周期実行する ExecutionContext
+#
+# PeriodicExecutionContext と同様に周期実行を行うが、参加している
+# RTCをデータポートの接続に基づくトポロジカル順序で実行するため、後
+# からアタッチされた上流のRTCによる1周期分の遅延が生じない。
+#
+# 以下のプロパティを使用する。
+#
+# - worker_threads: 互いに依存しないRTCの on_execute を並列に実行す
+#                   るスレッド数 (デフォルト: 0、並列実行しない)
+#
+# Python の処理は GIL により直列化されるため、並列実行は on_execute
+# がリモート呼び出しや GIL を解放する拡張モジュールで時間を費やす場
+# 合に有効である。
+#
+# @since 2.0.0
+#
+# @else
+# @class DataflowExecutionContext
+# @brief ExecutionContext executing periodically in dataflow order
+#
+# This context executes periodically like PeriodicExecutionContext,
+# but the participants are executed in topological order of their
+# data port connections, so that an upstream RTC attached later does
+# not add one period of latency.
+#
+# The following property is used.
+#
+# - worker_threads: Number of threads executing on_execute of
+#                   independent RTCs in parallel (default: 0, no
+#                   parallel execution)
+#
+# Since Python code is serialized by the GIL, parallel execution is
+# effective when on_execute spends its time in remote calls or in
+# extension modules releasing the GIL.
+#
+# @since 2.0.0
+#
+# @endif
+class DataflowExecutionContext(OpenRTM_aist.PeriodicExecutionContext):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @else
+  # @brief Constructor
+  # @endif
+  def __init__(self):
+    OpenRTM_aist.PeriodicExecutionContext.__init__(self)
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("rtobject.dataflow_ec")
+    self._rtcout.RTC_TRACE("DataflowExecutionContext.__init__()")
+    self._worker = DataflowExecutionContextWorker()
+    self._worker.setECRef(self.getObjRef())
+    return
+
+
+  ##
+  # @if jp
+  # @brief 初期化関数
+  # @param self
+  # @param props プロパティ
+  # @else
+  # @brief Initialization
+  # @param self
+  # @param props Properties
+  # @endif
+  def init(self, props):
+    OpenRTM_aist.PeriodicExecutionContext.init(self, props)
+    threads_ = [0]
+    if not OpenRTM_aist.stringTo(threads_, props.getProperty("worker_threads", "0")):
+      self._rtcout.RTC_ERROR("invalid worker_threads value: %s",
+                             props.getProperty("worker_threads"))
+      return
+    self._worker.setWorkerThreads(threads_[0])
+    return
+
+
+  ##
+  # @if jp
+  # @brief 次の周期の境界で実行順序を再計算する
+  #
+  # リモートのRTCの接続を変更した場合に呼び出す。
+  #
+  # @else
+  # @brief Re-sort the execution order at the next cycle boundary
+  #
+  # This should be called when connections of remote RTCs are changed.
+  #
+  # @endif
+  def requestSort(self):
+    self._worker.requestSort()
+    return
+
+
+  ##
+  # @if jp
+  # @brief 現在の実行順序をRTCのリストで取得する
+  # @else
+  # @brief Get the current execution order as a list of RTCs
+  # @endif
+  def getExecutionOrder(self):
+    return [comp.getRTObject() for comp in self._worker.getExecutionOrder()]
+
+
+
+##
+# @if jp
+# @brief ExecutionContext を初期化する
+#
+# ExecutionContext 起動用ファクトリを登録する。
+#
+# @param manager マネージャオブジェクト
+#
+# @else
+#
+# @endif
+def DataflowExecutionContextInit(manager):
+  OpenRTM_aist.ExecutionContextFactory.instance().addFactory("DataflowExecutionContext",
+                                                             OpenRTM_aist.DataflowExecutionContext,
+                                                             OpenRTM_aist.ECDelete)
+  return
@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file DeadlineWatchdog.py
+# @brief Deadline miss watchdog for execution contexts
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import threading
+
+import OpenRTM_aist
+import RTC
+
+
+##
+# @if jp
+# @class DeadlineWatchdog
+# @brief 実行コンテキストのデッドライン超過監視クラス
+#
+# 実行コンテキストの1周期分の処理時間と、各RTCの on_execute と
+# on_state_update の合計時間を実行周期と比較し、超過を記録する。
+#
+# - 周期の処理時間が実行周期を超えた場合、実行コンテキストの超過とし
+#   て記録し、ACTIVE状態のローカルのRTCの EC_DEADLINE_MISS リスナに
+#   超過時間 [s] を通知する。
+# - RTC自身の処理時間が実行周期を超えた場合、そのRTCの超過として記録
+#   する。連続超過回数が error_limit に達した場合はRTCをERROR状態に遷
+#   移させる。error_limit が0の場合は遷移させない。
+#
+# 各RTCの処理時間は ExecutionContextWorker が実行プロファイル
+# (execution_profile) と同じ方法で計測する。
+#
+# @since 2.0.0
+#
+# @else
+# @class DeadlineWatchdog
+# @brief Deadline miss watchdog of execution contexts
+#
+# The execution time of a cycle of the execution context and the sum
+# of on_execute and on_state_update of each RTC are compared with
+# the period, and overruns are recorded.
+#
+# - When the execution time of a cycle exceeds the period, it is
+#   recorded as an overrun of the execution context, and the overrun
+#   time [s] is notified to the EC_DEADLINE_MISS listeners of the
+#   local RTCs in ACTIVE state.
+# - When the execution time of an RTC itself exceeds the period, it is
+#   recorded as an overrun of the RTC. When the number of consecutive
+#   overruns reaches error_limit, the RTC is moved to ERROR state. No
+#   transition is done if error_limit is 0.
+#
+# The execution time of each RTC is measured by ExecutionContextWorker
+# in the same way as the execution profile (execution_profile).
+#
+# @since 2.0.0
+#
+# @endif
+class DeadlineWatchdog:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @param error_limit ERROR状態に遷移させる連続超過回数。0 で無効
+  # @else
+  # @brief Constructor
+  # @param error_limit Number of consecutive overruns to move an RTC
+  #                    to ERROR state. 0 to disable
+  # @endif
+  def __init__(self, error_limit=0):
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("deadline_watchdog")
+    self._mutex = threading.RLock()
+    self._errorLimit = error_limit
+    self._missCount = 0
+    self._cycleCount = 0
+    self._totalOverrun = 0
+    self._maxOverrun = 0
+    self._comps = {}
+    return
+
+
+  ##
+  # @if jp
+  # @brief ERROR状態に遷移させる連続超過回数を設定する
+  # @else
+  # @brief Set the number of consecutive overruns to move an RTC to ERROR
+  # @endif
+  def setErrorLimit(self, error_limit):
+    self._errorLimit = error_limit
+    return
+
+
+  def getErrorLimit(self):
+    return self._errorLimit
+
+
+  ##
+  # @if jp
+  # @brief 1周期分の処理時間を確認する
+  #
+  # @param comps 参加しているRTC (RTObjectStateMachine) のリスト
+  # @param ns 処理時間 [ns]
+  # @param period 実行周期 [ns]
+  #
+  # @else
+  # @brief Check the execution time of a cycle
+  #
+  # @param comps List of participants (RTObjectStateMachine)
+  # @param ns Execution time [ns]
+  # @param period Period [ns]
+  #
+  # @endif
+  def checkCycle(self, comps, ns, period):
+    self._cycleCount += 1
+    if period <= 0 or ns <= period:
+      return
+
+    overrun_ = ns - period
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    self._missCount += 1
+    self._totalOverrun += overrun_
+    if overrun_ > self._maxOverrun:
+      self._maxOverrun = overrun_
+    del guard
+
+    overrun_sec_ = float(overrun_) / OpenRTM_aist.nsec_per_sec
+    self._rtcout.RTC_DEBUG("Deadline miss: %f [s] overrun.", overrun_sec_)
+    for comp in comps:
+      if not comp.isCurrentState(RTC.ACTIVE_STATE):
+        continue
+      try:
+        comp.onDeadlineMiss(overrun_sec_)
+      except:
+        self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTCの処理時間を確認する
+  #
+  # @param comp RTObjectStateMachine
+  # @param ns on_execute と on_state_update の合計時間 [ns]
+  # @param period 実行周期 [ns]
+  #
+  # @else
+  # @brief Check the execution time of an RTC
+  #
+  # @param comp RTObjectStateMachine
+  # @param ns Sum of on_execute and on_state_update [ns]
+  # @param period Period [ns]
+  #
+  # @endif
+  def checkComponent(self, comp, ns, period):
+    stat_ = self._comps.get(comp)
+    if period <= 0 or ns <= period:
+      if stat_ is not None:
+        stat_.consecutive = 0
+      return
+
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    if stat_ is None:
+      stat_ = self.ComponentStat()
+      self._comps[comp] = stat_
+    stat_.record(ns - period)
+    del guard
+
+    if self._errorLimit > 0 and stat_.consecutive >= self._errorLimit:
+      self._rtcout.RTC_ERROR("RTC (ec_handle %d) overran the period %d times "
+                             "in a row. Moving to ERROR state.",
+                             (comp.getExecutionContextHandle(),
+                              stat_.consecutive))
+      stat_.consecutive = 0
+      comp.goTo(RTC.ERROR_STATE)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 参加者から削除されたRTCの記録を削除する
+  # @else
+  # @brief Remove the record of the RTC removed from the participants
+  # @endif
+  def removeComponent(self, comp):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    self._comps.pop(comp, None)
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  # @brief 実行コンテキストの超過回数を取得する
+  # @return (超過回数, 周期数)
+  # @else
+  # @brief Get the number of overruns of the execution context
+  # @return (number of overruns, number of cycles)
+  # @endif
+  def getMissCount(self):
+    return (self._missCount, self._cycleCount)
+
+
+  ##
+  # @if jp
+  # @brief 実行コンテキストの最大・合計超過時間を取得する
+  # @return (最大超過時間 [ns], 合計超過時間 [ns])
+  # @else
+  # @brief Get the maximum and total overrun of the execution context
+  # @return (maximum overrun [ns], total overrun [ns])
+  # @endif
+  def getOverrun(self):
+    return (self._maxOverrun, self._totalOverrun)
+
+
+  ##
+  # @if jp
+  # @brief RTC毎の超過記録を取得する
+  # @return RTObjectStateMachine をキー、ComponentStat を値とする dict
+  # @else
+  # @brief Get the overrun records of each RTC
+  # @return dict from RTObjectStateMachine to ComponentStat
+  # @endif
+  def getComponentStats(self):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    stats_ = dict(self._comps)
+    del guard
+    return stats_
+
+
+  ##
+  # @if jp
+  # @brief 記録をクリアする
+  # @else
+  # @brief Clear the records
+  # @endif
+  def reset(self):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    self._missCount = 0
+    self._cycleCount = 0
+    self._totalOverrun = 0
+    self._maxOverrun = 0
+    self._comps = {}
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  # @class ComponentStat
+  # @brief RTC毎の超過記録
+  #
+  # - misses: 超過回数
+  # - consecutive: 連続超過回数
+  # - max_overrun: 最大超過時間 [ns]
+  # - total_overrun: 合計超過時間 [ns]
+  #
+  # @else
+  # @class ComponentStat
+  # @brief Overrun record of each RTC
+  #
+  # - misses: Number of overruns
+  # - consecutive: Number of consecutive overruns
+  # - max_overrun: Maximum overrun [ns]
+  # - total_overrun: Total overrun [ns]
+  #
+  # @endif
+  class ComponentStat:
+    def __init__(self):
+      self.misses = 0
+      self.consecutive = 0
+      self.max_overrun = 0
+      self.total_overrun = 0
+      return
+
+    def record(self, overrun):
+      self.misses += 1
+      self.consecutive += 1
+      self.total_overrun += overrun
+      if overrun > self.max_overrun:
+        self.max_overrun = overrun
+      return
@@ -84,6 +84,8 @@ default_config =["config.version",                   OpenRTM_aist.openrtm_versio
                  "manager.shutdown_auto",            "YES",
                  "manager.auto_shutdown_duration",   "10.0",
                  "manager.termination_waittime",          "1.0",
+                 "manager.config_watch.enable",      "NO",
+                 "manager.config_watch.interval",    "1.0",
                  "manager.name",                     "manager",
                  "manager.command",                  "rtcd",
                  "manager.nameservers",               "default",
@@ -93,6 +95,8 @@ default_config =["config.version",                   OpenRTM_aist.openrtm_versio
                  "manager.modules.Python.manager_cmd", "rtcd_python",
                  "manager.modules.Java.manager_cmd", "rtcd_java",
                  "manager.modules.search_auto", "YES",
+                 "manager.modules.scan_processes", "0",
+                 "manager.modules.scan_threads", "0",
                  "manager.local_service.enabled_services","ALL",
                  "sdo.service.provider.enabled_services",  "ALL",
                  "sdo.service.consumer.enabled_services",  "ALL",
@@ -17,6 +17,9 @@
 
 
 
+import threading
+import time
+
 import OpenRTM_aist
 import RTC
 
@@ -27,11 +30,39 @@ import RTC
 #
 # Periodic EventDrivenExecutionContext饹
 #
+# äƤRTC InPort ˥ǡ夷ǥ򵯾
+# ACTIVE ֤RTC¹Ԥ롣¹夷ʣΥǡˤ
+# 1μ¹ԤˤޤȤ롣InPort ؤΥǡϥͥ
+# ON_RECEIVED ӥ쥯žˤ긡Τ롣
+#
+# ʲΥץѥƥѤ롣
+#
+# - min_interval: ¹Դֳ֤κǾ [s] (ǥե: 0.0)μ
+#                 ԤвᤷƤʤԵƤ¹Ԥ롣
+# - max_interval: ¹Դֳ֤κ [s] (ǥե: 0.0̵)ǡ
+#                 夷ʤǤ⤳δֳ֤Ǽ¹Ԥ롣
+#
 # @since 2.0.0
 #
 # @else
 # @class EventDrivenExecutionContext
 # @brief EventDrivenExecutionContext class
+#
+# The worker is woken up when data arrives at an InPort of the
+# participants, and the ACTIVE RTCs are executed. Wakeups by several
+# data arriving during an execution are coalesced into one execution.
+# Data arrival is detected by ON_RECEIVED of the connectors and by
+# direct transfer.
+#
+# The following properties are used.
+#
+# - min_interval: Minimum interval of executions [s] (default: 0.0).
+#                 If it has not elapsed since the last execution, the
+#                 execution is delayed.
+# - max_interval: Maximum interval of executions [s] (default: 0.0,
+#                 disabled). The RTCs are executed at this interval
+#                 even if no data arrives.
+#
 # @endif
 class EventDrivenExecutionContext(OpenRTM_aist.PeriodicExecutionContext):
   """
@@ -51,7 +82,305 @@ class EventDrivenExecutionContext(OpenRTM_aist.PeriodicExecutionContext):
     OpenRTM_aist.PeriodicExecutionContext.__init__(self)
     self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("rtobject.eventdriven_ec")
     self.setKind(RTC.EVENT_DRIVEN)
+    self._eventthread = self.WorkerThreadCtrl()
+    self._minInterval = 0.0
+    self._maxInterval = 0.0
+    self._lastExecution = 0.0
+    self._eventCount = 0
+    self._executionCount = 0
+    self._inportHooks = {}
+    return
+
+
+  ##
+  # @if jp
+  # @brief ؿ
+  #
+  # @param self
+  # @param props ץѥƥ
+  #
+  # @else
+  # @brief Initialization
+  #
+  # @param self
+  # @param props Properties
+  #
+  # @endif
+  def init(self, props):
+    OpenRTM_aist.PeriodicExecutionContext.init(self, props)
+
+    interval_ = [0.0]
+    if OpenRTM_aist.stringTo(interval_, props.getProperty("min_interval", "0.0")):
+      self._minInterval = interval_[0]
+    else:
+      self._rtcout.RTC_ERROR("invalid min_interval value: %s",
+                             props.getProperty("min_interval"))
+
+    interval_ = [0.0]
+    if OpenRTM_aist.stringTo(interval_, props.getProperty("max_interval", "0.0")):
+      self._maxInterval = interval_[0]
+    else:
+      self._rtcout.RTC_ERROR("invalid max_interval value: %s",
+                             props.getProperty("max_interval"))
+    return
+
+
+  ##
+  # @if jp
+  # @brief λؿ
+  # @else
+  # @brief Finalization
+  # @endif
+  def exit(self, Task=OpenRTM_aist.Task):
+    guard = OpenRTM_aist.ScopedLock(self._svcmutex)
+    self._svc = False
+    del guard
+    self.notifyEvent()
+
+    for rtobj in list(self._inportHooks.keys()):
+      self.unhookInPorts(rtobj)
+    OpenRTM_aist.PeriodicExecutionContext.exit(self, Task)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 򵯾
+  #
+  # InPort ؤΥǡ˸ƤӽФ롣¹ξϡ
+  # ¹Ԥνλˤ⤦1¹Ԥ롣
+  #
+  # @else
+  # @brief Wake up the worker
+  #
+  # This is called when data arrives at an InPort. If the worker is
+  # executing, it is executed only once more after the execution.
+  #
+  # @endif
+  def notifyEvent(self):
+    self._eventthread._cond.acquire()
+    self._eventCount += 1
+    self._eventthread._running = True
+    self._eventthread._cond.notify()
+    self._eventthread._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǡβȼ¹Բ
+  #
+  # βȼ¹ԲκޤȤƽ줿ΤοȤʤ롣
+  #
+  # @return (β, ¹Բ)
+  #
+  # @else
+  # @brief Get the numbers of data arrival notifications and executions
+  #
+  # The difference between them is the number of coalesced
+  # notifications.
+  #
+  # @return (notifications, executions)
+  #
+  # @endif
+  def getEventStatistics(self):
+    return (self._eventCount, self._executionCount)
+
+
+  def waitEvent(self):
+    guard = OpenRTM_aist.ScopedLock(self._eventthread._mutex)
+    while not self._eventthread._running and self.threadRunning():
+      if self._maxInterval > 0.0:
+        remain_ = self._lastExecution + self._maxInterval - time.time()
+        if remain_ <= 0.0:
+          break
+        self._eventthread._cond.wait(remain_)
+      else:
+        self._eventthread._cond.wait()
+    self._eventthread._running = False
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  # @brief ݡͥȤΥƥӥƥåɴؿ
+  #
+  # ǡԤ夷ǻäƤRTC¹Ԥ롣
+  #
+  # @else
+  # @brief Thread function of the activity of the components
+  #
+  # This waits for data to arrive and executes the participants when
+  # it arrives.
+  #
+  # @endif
+  def svc(self):
+    self._rtcout.RTC_TRACE("svc()")
+
+    self.applyThreadSettings()
+
+    while self.threadRunning():
+      self.waitEvent()
+
+      OpenRTM_aist.ExecutionContextBase.invokeWorkerPreDo(self)
+      guard = OpenRTM_aist.ScopedLock(self._workerthread._mutex)
+      while not self._workerthread._running:
+        self._workerthread._cond.wait()
+      del guard
+
+      if self._minInterval > 0.0:
+        remain_ = self._lastExecution + self._minInterval - time.time()
+        if remain_ > 0.0:
+          time.sleep(remain_)
+
+      self._lastExecution = time.time()
+      OpenRTM_aist.ExecutionContextBase.invokeWorkerDo(self)
+      OpenRTM_aist.ExecutionContextBase.invokeWorkerPostDo(self)
+      self._executionCount += 1
+
+    self._rtcout.RTC_DEBUG("Thread terminated.")
+    return 0
+
+
+  def bindComponent(self, rtc):
+    ret_ = OpenRTM_aist.PeriodicExecutionContext.bindComponent(self, rtc)
+    if ret_ == RTC.RTC_OK:
+      self.hookInPorts(rtc)
+    return ret_
+
+
+  def onAddedComponent(self, rtobj):
+    rtobj_ = self.getServant(rtobj)
+    if rtobj_:
+      self.hookInPorts(rtobj_)
+    return OpenRTM_aist.PeriodicExecutionContext.onAddedComponent(self, rtobj)
+
+
+  def onRemovedComponent(self, rtobj):
+    rtobj_ = self.getServant(rtobj)
+    if rtobj_ in self._inportHooks:
+      self.unhookInPorts(rtobj_)
+    ret_ = OpenRTM_aist.PeriodicExecutionContext.onRemovedComponent(self, rtobj)
+    self.notifyEvent()
+    return ret_
+
+
+  def onStarted(self):
+    for rtobj in list(self._inportHooks.keys()):
+      self.hookInPorts(rtobj)
+    ret_ = OpenRTM_aist.PeriodicExecutionContext.onStarted(self)
+    self.notifyEvent()
+    return ret_
+
+
+  ##
+  # @if jp
+  # @brief ܤ¹Ԥ뤿˥򵯾
+  #
+  # ܤϥμ¹Ի˹Ԥ뤿ᡢǡ夷ʤ
+  # ǤܤԤʤ褦˥򵯾롣Ʊܥ⡼ɤ
+  #  onWaiting*() Ʊܥ⡼ (sync_transition: NO) Ǥ
+  # count  -1  onActivated()onDeactivated()onReset() Ƥӽ
+  # 롣Ʊܥ⡼ɤǤܤδλˤ onActivated() ʤɤ
+  # ƤӽФ뤬ξϵʤ
+  #
+  # @else
+  # @brief Wake up the worker to execute the state transition
+  #
+  # Since the state transition is executed by the worker, the worker
+  # is woken up so that the transition does not wait for data to
+  # arrive. onWaiting*() are called in the synchronous transition
+  # mode, and onActivated(), onDeactivated() and onReset() with count
+  # -1 in the asynchronous transition mode (sync_transition: NO). In
+  # the synchronous mode onActivated() and the others are also called
+  # after the transition completes, and the worker is not woken up
+  # then.
+  #
+  # @endif
+  def onWaitingActivated(self, comp, count):
+    ret_ = OpenRTM_aist.PeriodicExecutionContext.onWaitingActivated(self, comp, count)
+    self.notifyEvent()
+    return ret_
+
+
+  def onActivated(self, comp, count):
+    ret_ = OpenRTM_aist.PeriodicExecutionContext.onActivated(self, comp, count)
+    if count < 0:
+      self.notifyEvent()
+    return ret_
+
+
+  def onWaitingDeactivated(self, comp, count):
+    ret_ = OpenRTM_aist.PeriodicExecutionContext.onWaitingDeactivated(self, comp, count)
+    self.notifyEvent()
+    return ret_
+
+
+  def onDeactivated(self, comp, count):
+    ret_ = OpenRTM_aist.PeriodicExecutionContext.onDeactivated(self, comp, count)
+    if count < 0:
+      self.notifyEvent()
+    return ret_
+
+
+  def onWaitingReset(self, comp, count):
+    ret_ = OpenRTM_aist.PeriodicExecutionContext.onWaitingReset(self, comp, count)
+    self.notifyEvent()
+    return ret_
+
+
+  def onReset(self, comp, count):
+    ret_ = OpenRTM_aist.PeriodicExecutionContext.onReset(self, comp, count)
+    if count < 0:
+      self.notifyEvent()
+    return ret_
+
+
+  def getServant(self, rtobj):
+    try:
+      return OpenRTM_aist.Manager.instance().getPOA().reference_to_servant(rtobj)
+    except:
+      self._rtcout.RTC_WARN("Data arrival of a remote RTC cannot be detected.")
+      return None
+
+
+  ##
+  # @if jp
+  # @brief RTC InPort ˥ǡΥХåꤹ
+  #
+  # InPort  onInitialize() ɲä뤿ᡢ¹ԥƥȤγ
+  # ϻˤƤӽФ̤ InPort ˤΤꤹ롣
+  #
+  # @param self
+  # @param rtobj RTC
+  # @else
+  # @brief Set the data arrival callback to the InPorts of the RTC
+  #
+  # Since InPorts are added in onInitialize(), this is also called
+  # when the context starts, and sets the callback only to the InPorts
+  # not hooked yet.
+  #
+  # @param self
+  # @param rtobj RTC
+  # @endif
+  def hookInPorts(self, rtobj):
+    hooks_ = self._inportHooks.setdefault(rtobj, [])
+    for inport in rtobj.getInPorts():
+      if inport in hooks_:
+        continue
+      if hasattr(inport, "addDataArrivalCallback"):
+        inport.addDataArrivalCallback(self.notifyEvent)
+        hooks_.append(inport)
+      else:
+        self._rtcout.RTC_WARN("Data arrival of %s cannot be detected.",
+                              inport.getName())
+    return
+
 
+  def unhookInPorts(self, rtobj):
+    for inport in self._inportHooks.pop(rtobj, []):
+      inport.removeDataArrivalCallback(self.notifyEvent)
     return
 
 
@@ -406,6 +406,9 @@ class ExecutionContextBase:
     self._deactivationTimeout = deactivationTO_[0]
     self._resetTimeout        = resetTO_[0]
 
+    self.setExecutionProfileMode(props)
+    self.setDeadlineWatchdogMode(props)
+
     self._rtcout.RTC_DEBUG("ExecutionContext's configurations:")
     self._rtcout.RTC_DEBUG("Exec rate   : %f [Hz]", self.getRate())
 
@@ -609,6 +612,8 @@ class ExecutionContextBase:
       self._rtcout.RTC_ERROR("Setting execution rate failed. %f", rate)
       return ret_
 
+    self._worker.setProfilePeriod(self.getPeriod())
+
     ret_ = self._worker.rateChanged()
     if ret_ != RTC.RTC_OK:
       self._rtcout.RTC_ERROR("Invoking on_rate_changed() for each RTC failed.")
@@ -1035,8 +1040,242 @@ class ExecutionContextBase:
     props_ = OpenRTM_aist.Properties()
     OpenRTM_aist.NVUtil.copyToProperties(props_, prof_.properties)
     self._rtcout.RTC_DEBUG(props_)
+
+    if self._worker.isExecutionProfileEnabled():
+      prof_ = RTC.ExecutionContextProfile(prof_.kind, prof_.rate, prof_.owner,
+                                          prof_.participants,
+                                          prof_.properties +
+                                          self.getExecutionProfileNVList())
     return self.onGetProfile(prof_)
 
+
+  ##
+  # @if jp
+  # @brief RTCμ¹Իַ¬ͭ/̵ˤ
+  #
+  # ͭˤȡäƤRTC on_execute  on_state_update 
+  # ¹Ի֤пΥҥȥ˵Ͽ롣̵ξϷ
+  # ¬ϰڹԤʤ
+  #
+  # @param enable ͭˤ True
+  #
+  # @else
+  # @brief Enable/disable measurement of execution time of each RTC
+  #
+  # When enabled, the execution times of on_execute and
+  # on_state_update of each participant RTC are recorded into log-scale
+  # histograms. When disabled, no measurement is performed.
+  #
+  # @param enable True to enable
+  #
+  # @endif
+  # void enableExecutionProfile(bool enable)
+  def enableExecutionProfile(self, enable):
+    self._rtcout.RTC_TRACE("enableExecutionProfile(%s)", enable)
+    self._worker.setExecutionProfile(enable, self.getPeriod())
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTCμ¹Իַ¬̤
+  #
+  # 󥹥̾򥭡ȤʲͤļͤȤ뼭֤
+  # ֤ñ̤Ϥ٤äǤ롣
+  #
+  # - on_execute: on_execute  TimeHistogram
+  # - on_state_update: on_state_update  TimeHistogram
+  # - overrun: on_execute  on_state_update ιפĶ
+  #
+  # @return ¬
+  #
+  # @else
+  # @brief Get the execution time measurement of each RTC
+  #
+  # A dictionary keyed by the instance names is returned. Each value
+  # is a dictionary with the following entries.
+  #
+  # - on_execute: TimeHistogram of on_execute
+  # - on_state_update: TimeHistogram of on_state_update
+  # - overrun: Number of cycles in which the sum of on_execute and
+  #            on_state_update exceeded the period
+  #
+  # @return Measurement results
+  #
+  # @endif
+  # std::map<std::string, ...> getExecutionProfile()
+  def getExecutionProfile(self):
+    result_ = {}
+    for prof_ in self._worker.getComponentProfiles():
+      result_[prof_.getInstanceName()] = {"on_execute": prof_.execute,
+                                          "on_state_update": prof_.stateUpdate,
+                                          "overrun": prof_.overrun}
+    return result_
+
+
+  ##
+  # @if jp
+  # @brief ǥåɥ饤Ķƻͭ/̵ˤ
+  #
+  # ͭˤȡν¹ԼĶ᤹ˡACTIVE֤γ
+  # RTC EC_DEADLINE_MISS ꥹʤĶ [s] ȤȤ˸ƤӽФ롣
+  # ޤRTCȤν֤ error_limit Ϣ³Ƽ¹ԼĶᤷ
+  # 硢RTCERROR֤ܤ롣
+  #
+  # @param enable ͭˤ True
+  # @param error_limit ERROR֤ܤϢ³Ķ0 ξ
+  #                    ܤʤ
+  #
+  # @else
+  # @brief Enable/disable the deadline miss watchdog
+  #
+  # When enabled, the EC_DEADLINE_MISS listeners of the RTCs in ACTIVE
+  # state are called with the overrun time [s] each time a cycle
+  # overruns the period. An RTC whose own execution time exceeds the
+  # period error_limit times in a row is moved to ERROR state.
+  #
+  # @param enable True to enable
+  # @param error_limit Number of consecutive overruns to move an RTC
+  #                    to ERROR state. 0 to never move
+  #
+  # @endif
+  # void enableDeadlineWatchdog(bool enable, int error_limit)
+  def enableDeadlineWatchdog(self, enable, error_limit=0):
+    self._rtcout.RTC_TRACE("enableDeadlineWatchdog(%s, %d)", (enable, error_limit))
+    if not enable:
+      self._worker.setDeadlineWatchdog(None)
+      return
+
+    watchdog_ = self._worker.getDeadlineWatchdog()
+    if watchdog_ is None:
+      watchdog_ = OpenRTM_aist.DeadlineWatchdog(error_limit)
+    else:
+      watchdog_.setErrorLimit(error_limit)
+    self._worker.setProfilePeriod(self.getPeriod())
+    self._worker.setDeadlineWatchdog(watchdog_)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǥåɥ饤ĶεϿ
+  #
+  # ʲͤļ֤֤ñ̤Ϥ٤äǤ롣ƻ뤬̵
+  # ξ None ֤
+  #
+  # - misses: ¹ԥƥȤĶ
+  # - cycles: ƻ뤷
+  # - max_overrun, total_overrun: 硦Ķ
+  # - components: 󥹥̾򥭡Ȥmissesmax_overrun
+  #               total_overrun ļͤȤRTCεϿ
+  #
+  # @return Ͽ
+  #
+  # @else
+  # @brief Get the records of deadline misses
+  #
+  # A dictionary with the following entries is returned. All times are
+  # in seconds. None is returned if the watchdog is disabled.
+  #
+  # - misses: Number of overruns of the execution context
+  # - cycles: Number of watched cycles
+  # - max_overrun, total_overrun: Maximum and total overrun
+  # - components: Records of each RTC keyed by the instance names,
+  #               each being a dictionary with misses, max_overrun and
+  #               total_overrun
+  #
+  # @return Records
+  #
+  # @endif
+  # std::map<std::string, ...> getDeadlineMisses()
+  def getDeadlineMisses(self):
+    watchdog_ = self._worker.getDeadlineWatchdog()
+    if watchdog_ is None:
+      return None
+
+    toSec_ = lambda ns: float(ns) / OpenRTM_aist.nsec_per_sec
+    misses_, cycles_ = watchdog_.getMissCount()
+    max_, total_ = watchdog_.getOverrun()
+    comps_ = {}
+    for comp, stat_ in watchdog_.getComponentStats().items():
+      name_ = self._worker.getComponentProfile(comp).getInstanceName()
+      comps_[name_] = {"misses": stat_.misses,
+                       "max_overrun": toSec_(stat_.max_overrun),
+                       "total_overrun": toSec_(stat_.total_overrun)}
+    return {"misses": misses_,
+            "cycles": cycles_,
+            "max_overrun": toSec_(max_),
+            "total_overrun": toSec_(total_),
+            "components": comps_}
+
+
+  ##
+  # @if jp
+  # @brief RTCμ¹Իַ¬̤򥯥ꥢ
+  # @else
+  # @brief Clear the execution time measurement of each RTC
+  # @endif
+  # void resetExecutionProfile()
+  def resetExecutionProfile(self):
+    self._worker.resetExecutionProfile()
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTCμ¹Իַ¬̤ NVList Ѵ
+  #
+  # ExecutionContextProfile  properties ɲä뤿ᡢʲΥ
+  # Ƿ¬̤֤֤ñ̤äǤ롣
+  #
+  # - execution_profile.<instance_name>.<callback>.count
+  # - execution_profile.<instance_name>.<callback>.p50
+  # - execution_profile.<instance_name>.<callback>.p99
+  # - execution_profile.<instance_name>.<callback>.max
+  # - execution_profile.<instance_name>.overrun
+  #
+  # <callback>  on_execute ޤ on_state_update Ǥ롣
+  #
+  # @return NVList
+  #
+  # @else
+  # @brief Convert the execution time measurement of each RTC to NVList
+  #
+  # The results are returned with the following keys to be added to
+  # the properties of ExecutionContextProfile. Times are in seconds.
+  #
+  # - execution_profile.<instance_name>.<callback>.count
+  # - execution_profile.<instance_name>.<callback>.p50
+  # - execution_profile.<instance_name>.<callback>.p99
+  # - execution_profile.<instance_name>.<callback>.max
+  # - execution_profile.<instance_name>.overrun
+  #
+  # <callback> is on_execute or on_state_update.
+  #
+  # @return NVList
+  #
+  # @endif
+  # SDOPackage::NVList getExecutionProfileNVList()
+  def getExecutionProfileNVList(self):
+    nsec_ = float(OpenRTM_aist.nsec_per_sec)
+    nv_ = []
+    for name_, prof_ in self.getExecutionProfile().items():
+      base_ = "execution_profile." + name_
+      for cb_ in ["on_execute", "on_state_update"]:
+        hist_ = prof_[cb_]
+        key_ = base_ + "." + cb_
+        nv_.append(OpenRTM_aist.NVUtil.newNV(key_ + ".count",
+                                             str(hist_.count())))
+        nv_.append(OpenRTM_aist.NVUtil.newNV(key_ + ".p50",
+                                             str(hist_.percentile(50) / nsec_)))
+        nv_.append(OpenRTM_aist.NVUtil.newNV(key_ + ".p99",
+                                             str(hist_.percentile(99) / nsec_)))
+        nv_.append(OpenRTM_aist.NVUtil.newNV(key_ + ".max",
+                                             str(hist_.max() / nsec_)))
+      nv_.append(OpenRTM_aist.NVUtil.newNV(base_ + ".overrun",
+                                           str(prof_["overrun"])))
+    return nv_
+
   
 
   #============================================================
@@ -1493,6 +1732,62 @@ class ExecutionContextBase:
     self._rtcout.RTC_DEBUG("Configuration %s not found.", key)
     return False
 
+
+  ##
+  # @if jp
+  # @brief PropertiesRTCμ¹Իַ¬̵ͭ򥻥åȤ
+  # @else
+  # @brief Setting execution time measurement mode from given properties.
+  # @endif
+  # bool ExecutionContextBase::setExecutionProfileMode(coil::Properties& props)
+  def setExecutionProfileMode(self, props):
+    self._rtcout.RTC_TRACE("setExecutionProfileMode()")
+    if props.findNode("execution_profile"):
+      enable_ = OpenRTM_aist.toBool(props.getProperty("execution_profile"),
+                                    "YES", "NO", False)
+      self._rtcout.RTC_DEBUG("Execution profile: %s",
+                             "YES" if enable_ else "NO")
+      self.enableExecutionProfile(enable_)
+      return True
+    self._rtcout.RTC_DEBUG("Configuration execution_profile not found.")
+    return False
+
+
+  ##
+  # @if jp
+  # @brief Propertiesǥåɥ饤Ķƻ̵ͭ򥻥åȤ
+  #
+  # - deadline_watchdog: YES ޤ NO (ǥե)
+  # - deadline_miss_limit: ERROR֤ܤϢ³Ķ
+  #                        (ǥե: 0ܤʤ)
+  #
+  # @else
+  # @brief Setting the deadline miss watchdog from given properties.
+  #
+  # - deadline_watchdog: YES or NO (default)
+  # - deadline_miss_limit: Number of consecutive overruns to move an
+  #                        RTC to ERROR state (default: 0, never)
+  #
+  # @endif
+  # bool ExecutionContextBase::setDeadlineWatchdogMode(coil::Properties& props)
+  def setDeadlineWatchdogMode(self, props):
+    self._rtcout.RTC_TRACE("setDeadlineWatchdogMode()")
+    if not props.findNode("deadline_watchdog"):
+      self._rtcout.RTC_DEBUG("Configuration deadline_watchdog not found.")
+      return False
+
+    enable_ = OpenRTM_aist.toBool(props.getProperty("deadline_watchdog"),
+                                  "YES", "NO", False)
+    limit_ = [0]
+    if not OpenRTM_aist.stringTo(limit_, props.getProperty("deadline_miss_limit", "0")):
+      self._rtcout.RTC_ERROR("invalid deadline_miss_limit value: %s",
+                             props.getProperty("deadline_miss_limit"))
+      limit_ = [0]
+    self._rtcout.RTC_DEBUG("Deadline watchdog: %s, limit: %d",
+                           ("YES" if enable_ else "NO", limit_[0]))
+    self.enableDeadlineWatchdog(enable_, limit_[0])
+    return True
+
   def is_running(self):
     self._rtcout.RTC_TRACE("is_running()")
     return self.isRunning()
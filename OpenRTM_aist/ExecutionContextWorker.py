@@ -70,12 +70,21 @@ class ExecutionContextWorker:
     self._running = False
     self._rtcout.RTC_TRACE("ExecutionContextWorker.__init__")
     self._ref = None
-    self._comps = []
+    # immutable snapshot of the participants, replaced on add/remove
+    self._comps = ()
+    self._listChanged = False
     self._addedComps = []
     self._removedComps = []
     self._mutex = threading.RLock()
     self._addedMutex = threading.RLock()
     self._removedMutex = threading.RLock()
+    self._profiling = False
+    self._profilePeriod = 0
+    self._watchdog = None
+    # True if either the profile or the watchdog measures the RTCs
+    self._measuring = False
+    self._cycleStart = 0
+    self._execProfiles = {}
     return
 
 
@@ -529,6 +538,7 @@ class ExecutionContextWorker:
       ec_ = self.getECRef()
       id_ = comp.attach_context(ec_)
       self._addedComps.append(OpenRTM_aist.RTObjectStateMachine(id_, comp))
+      self._listChanged = True
       del guard
     except:
       del guard
@@ -579,7 +589,8 @@ class ExecutionContextWorker:
     # rtc is owner of this EC
     comp_ = rtc.getObjRef()
     #    RTObjectStateMachine o(id, comp);
-    self._comps.append(OpenRTM_aist.RTObjectStateMachine(id_, comp_))
+    self._comps = self._comps + (OpenRTM_aist.RTObjectStateMachine(id_, comp_),)
+    self._listChanged = True
     del guard
     self._rtcout.RTC_DEBUG("bindComponent() succeeded.")
     return RTC.RTC_OK
@@ -632,12 +643,26 @@ class ExecutionContextWorker:
 
     guard = OpenRTM_aist.ScopedLock(self._removedMutex)
     self._removedComps.append(rtobj_)
+    self._listChanged = True
     del guard
     if self._running == False:
       self.updateComponentList()
     return RTC.RTC_OK
 
 
+  ##
+  # @if jp
+  # @brief äƤRTCΥꥹȤ
+  # @return RTObjectStateMachine  tuple
+  # @else
+  # @brief Get the list of participants
+  # @return Tuple of RTObjectStateMachine
+  # @endif
+  # std::vector<RTObjectStateMachine*> getComponentList();
+  def getComponentList(self):
+    return self._comps
+
+
   # RTObjectStateMachine* findComponent(RTC::LightweightRTObject_ptr comp);
   def findComponent(self, comp):
     for comp_ in self._comps:
@@ -649,66 +674,60 @@ class ExecutionContextWorker:
 
   # bool isAllCurrentState(RTC::LifeCycleState state);
   def isAllCurrentState(self, state):
-    guard = OpenRTM_aist.ScopedLock(self._mutex)
     for comp in self._comps:
       if not comp.isCurrentState(state):
-        del guard
         return False
 
-    del guard
     return True
 
 
   # bool isAllNextState(RTC::LifeCycleState state);
   def isAllNextState(self, state):
-    guard = OpenRTM_aist.ScopedLock(self._mutex)
     for comp in self._comps:
       if not comp.isNextState(state):
-        del guard
         return False
 
-    del guard
     return True
 
 
   # bool isOneOfCurrentState(RTC::LifeCycleState state);
   def isOneOfCurrentState(self, state):
-    guard = OpenRTM_aist.ScopedLock(self._mutex)
     for comp in self._comps:
       if comp.isCurrentState(state):
-        del guard
         return True
     
-    del guard
     return False
 
 
   # bool isOneOfNextState(RTC::LifeCycleState state);
   def isOneOfNextState(self, state):
-    guard = OpenRTM_aist.ScopedLock(self._mutex)
     for comp in self._comps:
       if comp.isNextState(state):
-        del guard
         return True
 
-    del guard
     return False
 
 
   # void invokeWorker();
   def invokeWorker(self):
     self._rtcout.RTC_PARANOID("invokeWorker()")
-    # m_comps never changes its size here
-    len_ = len(self._comps)
+    # m_comps is an immutable snapshot
+    comps_ = self._comps
     
-    for i in range(len_):
-      self._comps[i].workerPreDo()
+    for comp in comps_:
+      comp.workerPreDo()
+
+    if self._measuring:
+      self.invokeProfiledWorkerDo()
+      self.invokeProfiledWorkerPostDo()
+      self.updateComponentList()
+      return
 
-    for i in range(len_):
-      self._comps[i].workerDo()
+    for comp in comps_:
+      comp.workerDo()
 
-    for i in range(len_):
-      self._comps[i].workerPostDo()
+    for comp in comps_:
+      comp.workerPostDo()
 
     self.updateComponentList()
     return
@@ -725,6 +744,9 @@ class ExecutionContextWorker:
   # void invokeWorkerDo();
   def invokeWorkerDo(self):
     self._rtcout.RTC_PARANOID("invokeWorkerDo()")
+    if self._measuring:
+      self.invokeProfiledWorkerDo()
+      return
     # m_comps never changes its size here
     for comp in self._comps:
       comp.workerDo()
@@ -733,40 +755,331 @@ class ExecutionContextWorker:
   # void invokeWorkerPostDo();
   def invokeWorkerPostDo(self):
     self._rtcout.RTC_PARANOID("invokeWorkerPostDo()")
-    # m_comps never changes its size here
-    for comp in self._comps:
-      comp.workerPostDo()
+    if self._measuring:
+      self.invokeProfiledWorkerPostDo()
+    else:
+      # m_comps never changes its size here
+      for comp in self._comps:
+        comp.workerPostDo()
     # m_comps might be changed here
     self.updateComponentList()
     return
+
+
+  ##
+  # @if jp
+  # @brief ¹Ի֤¬ʤ on_execute ¹Ԥ
+  #
+  # ACTIVE ֤γRTCˤĤơworkerDo() μ¹Ի֤ on_execute 
+  # ¹Ի֤Ȥƥҥȥ˵Ͽ롣
+  #
+  # @else
+  # @brief Invoke on_execute measuring the execution time
+  #
+  # For each RTC in ACTIVE state, the execution time of workerDo() is
+  # recorded into the histogram as the time of on_execute.
+  #
+  # @endif
+  # void invokeProfiledWorkerDo();
+  def invokeProfiledWorkerDo(self):
+    clock_ = OpenRTM_aist.monotonic_ns
+    self._cycleStart = clock_()
+    for comp in self._comps:
+      if not comp.isCurrentState(RTC.ACTIVE_STATE):
+        comp.workerDo()
+        continue
+      t0_ = clock_()
+      comp.workerDo()
+      self.getComponentProfile(comp).recordExecute(clock_() - t0_)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ¹Ի֤¬ʤ on_state_update ¹Ԥ
+  #
+  # ACTIVE ֤γRTCˤĤơworkerPostDo() μ¹Ի֤
+  # on_state_update μ¹Ի֤Ȥƥҥȥ˵Ͽ롣
+  # on_execute Ȥιפ¹ԼĶϼĶȤƿ롣
+  # DeadlineWatchdog ꤵƤϡRTCȼΤν
+  # ֤Τ롣
+  #
+  # @else
+  # @brief Invoke on_state_update measuring the execution time
+  #
+  # For each RTC in ACTIVE state, the execution time of workerPostDo()
+  # is recorded into the histogram as the time of on_state_update.
+  # If the sum with on_execute exceeds the period, it is counted as
+  # an overrun. If a DeadlineWatchdog is set, the execution times of
+  # each RTC and of the whole cycle are passed to it.
+  #
+  # @endif
+  # void invokeProfiledWorkerPostDo();
+  def invokeProfiledWorkerPostDo(self):
+    clock_ = OpenRTM_aist.monotonic_ns
+    period_ = self._profilePeriod
+    watchdog_ = self._watchdog
+    comps_ = self._comps
+    for comp in comps_:
+      if not comp.isCurrentState(RTC.ACTIVE_STATE):
+        comp.workerPostDo()
+        continue
+      t0_ = clock_()
+      comp.workerPostDo()
+      total_ = self.getComponentProfile(comp).recordStateUpdate(clock_() - t0_,
+                                                                period_)
+      if watchdog_:
+        watchdog_.checkComponent(comp, total_, period_)
+
+    if watchdog_:
+      watchdog_.checkCycle(comps_, clock_() - self._cycleStart, period_)
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTCμ¹Իַ¬ͭ/̵ˤ
+  #
+  # @param enable ͭˤ True
+  # @param period ĶȽѤ¹Լ
+  #
+  # @else
+  # @brief Enable/disable measurement of execution time of each RTC
+  #
+  # @param enable True to enable
+  # @param period Execution period used to detect overruns
+  #
+  # @endif
+  # void setExecutionProfile(bool enable, coil::TimeValue period);
+  def setExecutionProfile(self, enable, period=None):
+    if period is not None:
+      self.setProfilePeriod(period)
+    self._profiling = enable
+    self._measuring = enable or self._watchdog is not None
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǥåɥ饤Ķƻꤹ
+  #
+  # ꤹȡRTCμ¹Ի֤¬DeadlineWatchdog Τ롣
+  #
+  # @param watchdog DeadlineWatchdogNone ξϴƻߤ
+  #
+  # @else
+  # @brief Set the deadline miss watchdog
+  #
+  # When set, the execution time of each RTC is measured and passed to
+  # the DeadlineWatchdog.
+  #
+  # @param watchdog DeadlineWatchdog. None to stop watching
+  #
+  # @endif
+  # void setDeadlineWatchdog(DeadlineWatchdog* watchdog);
+  def setDeadlineWatchdog(self, watchdog):
+    self._watchdog = watchdog
+    self._measuring = self._profiling or watchdog is not None
+    return
+
+
+  # DeadlineWatchdog* getDeadlineWatchdog();
+  def getDeadlineWatchdog(self):
+    return self._watchdog
+
+
+  ##
+  # @if jp
+  # @brief ĶȽѤ¹Լꤹ
+  # @else
+  # @brief Set the execution period used to detect overruns
+  # @endif
+  # void setProfilePeriod(coil::TimeValue period);
+  def setProfilePeriod(self, period):
+    self._profilePeriod = period.sec() * OpenRTM_aist.nsec_per_sec + \
+                          period.usec() * 1000
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTCμ¹Իַ¬ͭɤ
+  # @else
+  # @brief Whether measurement of execution time of each RTC is enabled
+  # @endif
+  # bool isExecutionProfileEnabled();
+  def isExecutionProfileEnabled(self):
+    return self._profiling
+
+
+  ##
+  # @if jp
+  # @brief RTCμ¹Իַ¬̤
+  #
+  # ¬̤¸ߤʤϿ롣
+  #
+  # @param comp RTObjectStateMachine
+  # @return ComponentProfile
+  #
+  # @else
+  # @brief Get the execution time measurement of the RTC
+  #
+  # It is created if it does not exist.
+  #
+  # @param comp RTObjectStateMachine
+  # @return ComponentProfile
+  #
+  # @endif
+  # ComponentProfile* getComponentProfile(RTObjectStateMachine* comp);
+  def getComponentProfile(self, comp):
+    prof_ = self._execProfiles.get(comp)
+    if prof_ is None:
+      prof_ = self.ComponentProfile(comp)
+      self._execProfiles[comp] = prof_
+    return prof_
+
+
+  ##
+  # @if jp
+  # @brief äƤRTCμ¹Իַ¬̤
+  # @return ComponentProfile Υꥹ
+  # @else
+  # @brief Get the execution time measurement of all participants
+  # @return List of ComponentProfile
+  # @endif
+  # std::vector<ComponentProfile*> getComponentProfiles();
+  def getComponentProfiles(self):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    profs_ = [self.getComponentProfile(comp) for comp in self._comps]
+    del guard
+    return profs_
+
+
+  ##
+  # @if jp
+  # @brief RTCμ¹Իַ¬̤򥯥ꥢ
+  # @else
+  # @brief Clear the execution time measurement of all RTCs
+  # @endif
+  # void resetExecutionProfile();
+  def resetExecutionProfile(self):
+    for prof_ in self.getComponentProfiles():
+      prof_.reset()
+    return
     
+  ##
+  # @if jp
+  # @brief ɲá줿RTC򻲲üԥꥹȤȿǤ
+  #
+  # üԥꥹȤѹʤ tuple Ȥݻɲáä
+  # Τ߿ tuple ֤롣ɲáʤ
+  # ϥե饰ǧǡåϼʤ
+  #
+  # @else
+  # @brief Apply added and removed RTCs to the participant list
+  #
+  # The participant list is kept as an immutable tuple, and a new
+  # tuple replaces it only when RTCs were added or removed. In cycles
+  # without changes only the flag is checked and no lock is taken.
+  #
+  # @endif
   # void updateComponentList();
   def updateComponentList(self):
+    if not self._listChanged:
+      return
+
     guard = OpenRTM_aist.ScopedLock(self._mutex)
+    self._listChanged = False
+    comps_ = list(self._comps)
     # adding component
     guard_added = OpenRTM_aist.ScopedLock(self._addedMutex)
-    for comp in self._addedComps:
-      self._comps.append(comp)
-      self._rtcout.RTC_TRACE("Component added.")
-
+    added_ = self._addedComps
     self._addedComps = []
     del guard_added
 
+    for comp in added_:
+      comps_.append(comp)
+      self._rtcout.RTC_TRACE("Component added.")
+
     # removing component
     guard_removed = OpenRTM_aist.ScopedLock(self._removedMutex)
-    for comp in self._removedComps:
+    removed_ = self._removedComps
+    self._removedComps = []
+    del guard_removed
+
+    for comp in removed_:
       lwrtobj_ = comp.getRTObject()
       lwrtobj_.detach_context(comp.getExecutionContextHandle())
-      idx_ = -1
-      try:
-        idx_ = self._comps.index(comp)
-      except:
-        idx_ = -1
-
-      if idx_ >= 0:
-        del self._comps[idx_]
+      if comp in comps_:
+        comps_.remove(comp)
         self._rtcout.RTC_TRACE("Component deleted.")
+      self._execProfiles.pop(comp, None)
+      if self._watchdog:
+        self._watchdog.removeComponent(comp)
 
-    self._removedComps = []
+    self._comps = tuple(comps_)
+    del guard
     return
 
+
+  ##
+  # @if jp
+  # @class ComponentProfile
+  # @brief RTCμ¹Իַ¬
+  #
+  # on_execute  on_state_update μ¹Ի֤пΥҥȥ
+  # ˵ϿξԤιפ¹ԼĶ롣
+  #
+  # @else
+  # @class ComponentProfile
+  # @brief Execution time measurement of each RTC
+  #
+  # The execution times of on_execute and on_state_update are recorded
+  # into log-scale histograms, and the number of cycles in which their
+  # sum exceeds the period is counted.
+  #
+  # @endif
+  class ComponentProfile:
+    """
+    """
+
+    def __init__(self, rtobj):
+      self._rtobj = rtobj
+      self._name = None
+      self._lastExecute = 0
+      self.execute = OpenRTM_aist.TimeHistogram()
+      self.stateUpdate = OpenRTM_aist.TimeHistogram()
+      self.overrun = 0
+      return
+
+    def recordExecute(self, ns):
+      self._lastExecute = ns
+      self.execute.record(ns)
+      return
+
+    def recordStateUpdate(self, ns, period):
+      self.stateUpdate.record(ns)
+      total_ = self._lastExecute + ns
+      if period > 0 and total_ > period:
+        self.overrun += 1
+      self._lastExecute = 0
+      return total_
+
+    def reset(self):
+      self.execute.reset()
+      self.stateUpdate.reset()
+      self.overrun = 0
+      return
+
+    def getRTObject(self):
+      return self._rtobj.getRTObject()
+
+    def getInstanceName(self):
+      if self._name is None:
+        try:
+          obj_ = self._rtobj.getRTObject()._narrow(RTC.RTObject)
+          self._name = obj_.get_component_profile().instance_name
+        except:
+          return "ec_handle_%d" % self._rtobj.getExecutionContextHandle()
+      return self._name
+
@@ -16,44 +16,108 @@
 #
 
 import OpenRTM_aist
-from OpenRTM_aist.ext.sdo.observer import ComponentObserverConsumer
+
+
+##
+# @if jp
+# @brief ɬפˤʤäǽȥ󥹥ݡȤȥѥ֥å
+#
+# (եȥΥ饹̾, ̻, ؿ̾) Υꥹȡ
+# FactoryInit() Ϥץ졼ۥȤϿͥ
+# interface_type ޤ subscription_type Ǻǽ˻ꤷ
+# ⥸塼򥤥ݡȤƽؿƤӽФ
+#
+# @else
+# @brief Transports and publishers initialized when needed
+#
+# List of (factory class name, identifier, init function name).
+# FactoryInit() registers them as placeholders, and the module is
+# imported and the init function is called when a connector first
+# specifies the identifier as interface_type or subscription_type.
+#
+# @endif
+lazy_factories = [
+    # Publishers
+    ("PublisherFactory", "flush", "PublisherFlushInit"),
+    ("PublisherFactory", "block", "PublisherFlushInit"),
+    ("PublisherFactory", "new", "PublisherNewInit"),
+    ("PublisherFactory", "nonblock", "PublisherNewInit"),
+    ("PublisherFactory", "periodic", "PublisherPeriodicInit"),
+
+    # Providers/Consumer
+    ("InPortProviderFactory", "corba_cdr", "InPortCorbaCdrProviderInit"),
+    ("InPortConsumerFactory", "corba_cdr", "InPortCorbaCdrConsumerInit"),
+    ("OutPortConsumerFactory", "corba_cdr", "OutPortCorbaCdrConsumerInit"),
+    ("OutPortProviderFactory", "corba_cdr", "OutPortCorbaCdrProviderInit"),
+    ("InPortProviderFactory", "direct", "InPortDirectProviderInit"),
+    ("InPortConsumerFactory", "direct", "InPortDirectConsumerInit"),
+    ("OutPortProviderFactory", "direct", "OutPortDirectProviderInit"),
+    ("OutPortConsumerFactory", "direct", "OutPortDirectConsumerInit"),
+    ("InPortProviderFactory", "shared_memory", "InPortSHMProviderInit"),
+    ("InPortConsumerFactory", "shared_memory", "InPortSHMConsumerInit"),
+    ("OutPortProviderFactory", "shared_memory", "OutPortSHMProviderInit"),
+    ("OutPortConsumerFactory", "shared_memory", "OutPortSHMConsumerInit"),
+    ("OutPortProviderFactory", "data_service", "OutPortDSProviderInit"),
+    ("OutPortConsumerFactory", "data_service", "OutPortDSConsumerInit"),
+    ("InPortProviderFactory", "data_service", "InPortDSProviderInit"),
+    ("InPortConsumerFactory", "data_service", "InPortDSConsumerInit"),
+    ("InPortProviderFactory", "csp_channel", "InPortCSPProviderInit"),
+    ("InPortConsumerFactory", "csp_channel", "InPortCSPConsumerInit"),
+    ("OutPortProviderFactory", "csp_channel", "OutPortCSPProviderInit"),
+    ("OutPortConsumerFactory", "csp_channel", "OutPortCSPConsumerInit"),
+    ]
+
+
+##
+# @if jp
+# @brief ؿ̾ǸƤӽФؿ
+# @else
+# @brief Create a function calling an init function by name
+# @endif
+def initLoader(init):
+    def loader():
+        getattr(OpenRTM_aist, init)()
+    return loader
+
 
 def FactoryInit():
+    from OpenRTM_aist.ext.sdo.observer import ComponentObserverConsumer
+
     # Buffers
     OpenRTM_aist.CdrRingBufferInit()
 
     # Threads
     OpenRTM_aist.DefaultPeriodicTaskInit()
 
-    # Publishers
-    OpenRTM_aist.PublisherFlushInit()
-    OpenRTM_aist.PublisherNewInit()
-    OpenRTM_aist.PublisherPeriodicInit()
+    # Publishers, Providers/Consumer
+    for factory, id, init in lazy_factories:
+        getattr(OpenRTM_aist, factory).instance().addLazyFactory(id, initLoader(init))
 
-    # Providers/Consumer
-    OpenRTM_aist.InPortCorbaCdrProviderInit()
-    OpenRTM_aist.InPortCorbaCdrConsumerInit()
-    OpenRTM_aist.OutPortCorbaCdrConsumerInit()
-    OpenRTM_aist.OutPortCorbaCdrProviderInit()
-    OpenRTM_aist.InPortDirectProviderInit()
-    OpenRTM_aist.InPortDirectConsumerInit()
-    OpenRTM_aist.OutPortDirectProviderInit()
-    OpenRTM_aist.OutPortDirectConsumerInit()
-    OpenRTM_aist.InPortSHMProviderInit()
-    OpenRTM_aist.InPortSHMConsumerInit()
-    OpenRTM_aist.OutPortSHMProviderInit()
-    OpenRTM_aist.OutPortSHMConsumerInit()
     OpenRTM_aist.ProcessUniquePolicyInit()
     OpenRTM_aist.NodeNumberingPolicyInit()
     OpenRTM_aist.NamingServiceNumberingPolicyInit()
     OpenRTM_aist.LogstreamFileInit()
-    OpenRTM_aist.OutPortDSProviderInit()
-    OpenRTM_aist.OutPortDSConsumerInit()
-    OpenRTM_aist.InPortDSProviderInit()
-    OpenRTM_aist.InPortDSConsumerInit()
-    OpenRTM_aist.InPortCSPProviderInit()
-    OpenRTM_aist.InPortCSPConsumerInit()
-    OpenRTM_aist.OutPortCSPProviderInit()
-    OpenRTM_aist.OutPortCSPConsumerInit()
     OpenRTM_aist.CORBA_CdrMemoryStreamInit()
     ComponentObserverConsumer.ComponentObserverConsumerInit()
+
+
+##
+# @if jp
+# @brief ºݤ˽줿ȥ󥹥ݡȤȥѥ֥å
+#
+# @return եȥΥ饹̾򥭡줿̻ҤΥꥹȤͤ
+#         뼭
+#
+# @else
+# @brief Get the transports and publishers actually initialized
+#
+# @return Dictionary whose keys are the class names of the factories
+#         and whose values are the lists of initialized identifiers
+#
+# @endif
+def getMaterializedTransports():
+    ret = {}
+    for factory, id, init in lazy_factories:
+        if factory not in ret:
+            ret[factory] = getattr(OpenRTM_aist, factory).instance().getMaterializedIdentifiers()
+    return ret
@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file GCScheduler.py
+# @brief Garbage collection scheduler for execution contexts
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import gc
+import threading
+
+import OpenRTM_aist
+
+
+GC_AUTO = "auto"
+GC_SLACK = "slack"
+
+##
+# 自動ガベージコレクションを無効にしている実行コンテキストの数
+# Number of execution contexts disabling the automatic garbage collection
+gc_disabled = 0
+gc_disabled_mutex = threading.RLock()
+
+
+##
+# @if jp
+# @brief 自動ガベージコレクションを無効にする
+#
+# 無効化の回数を数え、同じ回数だけ enableAutoGC() が呼ばれるまで無効
+# のままとする。呼び出し前に無効にされていた場合は何もしない。
+#
+# @else
+# @brief Disable the automatic garbage collection
+#
+# The number of calls is counted, and the collection stays disabled
+# until enableAutoGC() is called the same number of times. Nothing is
+# done if it was disabled before the first call.
+#
+# @endif
+def disableAutoGC():
+  global gc_disabled
+  guard = OpenRTM_aist.ScopedLock(gc_disabled_mutex)
+  if gc_disabled == 0 and not gc.isenabled():
+    return False
+  if gc_disabled == 0:
+    gc.disable()
+  gc_disabled += 1
+  return True
+
+
+##
+# @if jp
+# @brief 自動ガベージコレクションを有効に戻す
+# @else
+# @brief Re-enable the automatic garbage collection
+# @endif
+def enableAutoGC():
+  global gc_disabled
+  guard = OpenRTM_aist.ScopedLock(gc_disabled_mutex)
+  if gc_disabled == 0:
+    return
+  gc_disabled -= 1
+  if gc_disabled == 0:
+    gc.enable()
+  return
+
+
+##
+# @if jp
+# @class GCScheduler
+# @brief 実行コンテキストの周期の空き時間にガベージコレクションを行う
+#
+# CPython の循環参照ガベージコレクタはオブジェクトの割り当て数に応じ
+# て任意の箇所で動作するため、RTCの on_execute 中に数ミリ秒の遅延が
+# 発生することがある。このクラスは実行コンテキストのワーカー処理中は
+# 自動ガベージコレクションを無効にし、次のデッドラインまでの空き時間
+# に gc.get_threshold() の閾値に従って世代別に gc.collect() を実行す
+# る。
+#
+# - 第0、第1世代は空き時間がある場合に実行する。空き時間がなくても第
+#   0世代の割り当て数が閾値の FORCE_FACTOR 倍を超えた場合は実行する。
+# - 第2世代 (全体) は空き時間が full_slack 以上の場合のみ実行する。
+#   full_slack が 0 の場合は直前の全体回収の所要時間を使用する (初回
+#   は周期の半分)。
+#
+# 開始時に全体回収を行い、gc.freeze() (Python 3.7 以降) により初期化
+# 済みのオブジェクトを回収対象から除外する。
+#
+# @since 2.0.0
+#
+# @else
+# @class GCScheduler
+# @brief Garbage collection in the idle slack of execution contexts
+#
+# The cyclic garbage collector of CPython runs at arbitrary points
+# depending on the number of allocations, which can delay on_execute
+# of RTCs by several milliseconds. This class disables the automatic
+# garbage collection during the worker phase of an execution context,
+# and runs gc.collect() per generation according to the thresholds of
+# gc.get_threshold() in the idle slack before the next deadline.
+#
+# - Generations 0 and 1 are collected if there is slack. Even without
+#   slack, generation 0 is collected when its allocation count exceeds
+#   FORCE_FACTOR times the threshold.
+# - Generation 2 (full collection) is run only if the slack is
+#   full_slack or more. If full_slack is 0, the duration of the last
+#   full collection is used (half the period for the first one).
+#
+# A full collection is done on start, and the initialized objects are
+# excluded from the collection by gc.freeze() (Python 3.7 or later).
+#
+# @since 2.0.0
+#
+# @endif
+class GCScheduler:
+  """
+  """
+  FORCE_FACTOR = 4
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @param full_slack 全体回収に必要な空き時間 [ns]。0 で自動
+  # @else
+  # @brief Constructor
+  # @param full_slack Slack required for a full collection [ns]. 0 for auto
+  # @endif
+  def __init__(self, full_slack=0):
+    self._fullSlack = full_slack
+    self._lastFull = 0
+    self._disabled = False
+    self._cycleStart = 0
+    self._frozen = False
+    self._histogram = OpenRTM_aist.TimeHistogram()
+    self.reset()
+    return
+
+
+  ##
+  # @if jp
+  # @brief 実行開始時の処理
+  #
+  # 全体回収を行った後、gc.freeze() が使用できる場合は生存している
+  # オブジェクトを永続世代に移す。
+  #
+  # @else
+  # @brief Processing on start
+  #
+  # After a full collection, the surviving objects are moved to the
+  # permanent generation by gc.freeze() if it is available.
+  #
+  # @endif
+  def start(self):
+    gc.collect()
+    if hasattr(gc, "freeze"):
+      gc.freeze()
+      self._frozen = True
+    return
+
+
+  ##
+  # @if jp
+  # @brief ワーカー処理の開始前に呼び出す
+  # @else
+  # @brief Called before the worker phase
+  # @endif
+  def beginWorker(self):
+    self._cycleStart = OpenRTM_aist.monotonic_ns()
+    self._disabled = disableAutoGC()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ワーカー処理の終了後に呼び出す
+  #
+  # 自動ガベージコレクションを有効に戻し、次のデッドラインまでの空き
+  # 時間に応じて回収を行う。
+  #
+  # @param period_ns 周期 [ns]
+  # @param deadline_ns 次のデッドライン (monotonic_ns)。None の場合は
+  #                    beginWorker() の時刻に周期を加えた時刻
+  # @return 回収に要した時間 [ns]
+  #
+  # @else
+  # @brief Called after the worker phase
+  #
+  # The automatic garbage collection is re-enabled, and collections
+  # are done according to the slack before the next deadline.
+  #
+  # @param period_ns Period [ns]
+  # @param deadline_ns Next deadline (monotonic_ns). If None, the time
+  #                    of beginWorker() plus the period
+  # @return Time spent for the collection [ns]
+  #
+  # @endif
+  def endWorker(self, period_ns, deadline_ns=None):
+    if self._disabled:
+      enableAutoGC()
+      self._disabled = False
+
+    now_ = OpenRTM_aist.monotonic_ns()
+    if deadline_ns is None:
+      deadline_ns = self._cycleStart + period_ns
+    return self.collect(deadline_ns - now_, period_ns)
+
+
+  ##
+  # @if jp
+  # @brief 空き時間に応じて回収を行う
+  # @param slack_ns 空き時間 [ns]
+  # @param period_ns 周期 [ns]
+  # @return 回収に要した時間 [ns]
+  # @else
+  # @brief Collect according to the slack
+  # @param slack_ns Slack [ns]
+  # @param period_ns Period [ns]
+  # @return Time spent for the collection [ns]
+  # @endif
+  def collect(self, slack_ns, period_ns):
+    self._cycles += 1
+    count_ = gc.get_count()
+    threshold_ = gc.get_threshold()
+    if threshold_[0] <= 0 or count_[0] < threshold_[0]:
+      return 0
+
+    if slack_ns <= 0 and count_[0] < threshold_[0] * self.FORCE_FACTOR:
+      self._deferred += 1
+      return 0
+
+    gen_ = 0
+    if count_[1] >= threshold_[1]:
+      gen_ = 1
+      if count_[2] >= threshold_[2]:
+        full_slack_ = self._fullSlack
+        if full_slack_ <= 0:
+          full_slack_ = self._lastFull or period_ns // 2
+        if slack_ns >= full_slack_:
+          gen_ = 2
+        else:
+          self._deferred += 1
+
+    t0_ = OpenRTM_aist.monotonic_ns()
+    gc.collect(gen_)
+    ns_ = OpenRTM_aist.monotonic_ns() - t0_
+
+    if gen_ == 2:
+      self._lastFull = ns_
+    self._collections[gen_] += 1
+    self._histogram.record(ns_)
+    self._total += ns_
+    if ns_ > self._max:
+      self._max = ns_
+    return ns_
+
+
+  ##
+  # @if jp
+  # @brief 統計情報を取得する
+  #
+  # - cycles: 周期数
+  # - collections: 世代毎の回収回数のリスト
+  # - deferred: 空き時間が不足して見送った回数
+  # - total: 合計回収時間 [ns]
+  # - max: 1周期の最大回収時間 [ns]
+  # - histogram: 回収を行った周期の回収時間の TimeHistogram
+  # - frozen: gc.freeze() を実行した場合 True
+  #
+  # @return 統計情報の dict
+  #
+  # @else
+  # @brief Get the statistics
+  #
+  # - cycles: Number of cycles
+  # - collections: List of the number of collections per generation
+  # - deferred: Number of collections postponed for lack of slack
+  # - total: Total collection time [ns]
+  # - max: Maximum collection time in a cycle [ns]
+  # - histogram: TimeHistogram of the collection time of the cycles
+  #              with a collection
+  # - frozen: True if gc.freeze() was executed
+  #
+  # @return dict of the statistics
+  #
+  # @endif
+  def getStatistics(self):
+    return {"cycles": self._cycles,
+            "collections": list(self._collections),
+            "deferred": self._deferred,
+            "total": self._total,
+            "max": self._max,
+            "histogram": self._histogram,
+            "frozen": self._frozen}
+
+
+  ##
+  # @if jp
+  # @brief 統計情報をクリアする
+  # @else
+  # @brief Clear the statistics
+  # @endif
+  def reset(self):
+    self._cycles = 0
+    self._collections = [0, 0, 0]
+    self._deferred = 0
+    self._total = 0
+    self._max = 0
+    self._histogram.reset()
+    return
@@ -17,6 +17,9 @@
 #
 
 
+import threading
+
+import OpenRTM_aist
 
 
 
@@ -56,6 +59,7 @@ class Factory:
     #
     # @param creator ꥨѥե󥯥
     # @param destructor ǥȥ饯ѥե󥯥
+    # @param loader ץ졼ۥξ硢ºݤΥեȥϿؿ
     #
     # @else
     #
@@ -65,19 +69,23 @@ class Factory:
     #
     # @param creator Functor for creator.
     # @param destructor Functor for destructor.
+    # @param loader Function registering the actual factory, for a
+    #               placeholder.
     #
     # @endif
     # FactoryEntry(Identifier id, Creator creator, Destructor destructor)
-    def __init__(self, id, creator, destructor):
+    def __init__(self, id, creator, destructor, loader=None):
       self.id_ = id
       self.creator_ = creator
       self.destructor_ = destructor
+      self.loader_ = loader
       return
 
 
   def __init__(self):
     self._creators = {}
     self._objects = {}
+    self._loaderMutex = threading.RLock()
 
 
   ## bool hasFactory(const Identifier& id)
@@ -104,13 +112,125 @@ class Factory:
     if not creator or not destructor:
       return self.INVALID_ARG
 
-    if id in self._creators:
+    if id in self._creators and self._creators[id].creator_:
       return self.ALREADY_EXISTS
     
     self._creators[id] = Factory.FactoryEntry(id, creator, destructor)
     return self.FACTORY_OK
 
 
+  ##
+  # @if jp
+  #
+  # @brief ץ졼ۥϿ
+  #
+  # ̻ҤΤߤϿºݤΥեȥϿ loader Ǥ롣
+  # getIdentifiers()  hasFactory() ̾ΥեȥƱͤ
+  # ̻Ҥ֤loader  createObject() ޤ materialize()
+  # ǺǽɬפˤʤäǸƤӽФ롣loader  addFactory()
+  # Ʊ̻ҤΥեȥϿʤФʤʤ
+  #
+  # @param id ̻
+  # @param loader ºݤΥեȥϿؿ
+  # @return ꥿󥳡
+  #
+  # @else
+  #
+  # @brief Register a placeholder
+  #
+  # Only the identifier is registered, and the registration of the
+  # actual factory is left to the loader. getIdentifiers() and
+  # hasFactory() report the identifier as a normal factory, but the
+  # loader is not called until createObject() or materialize() needs
+  # it. The loader must register the factory of the same identifier
+  # by addFactory().
+  #
+  # @param id Identifier
+  # @param loader Function registering the actual factory
+  # @return Return code
+  #
+  # @endif
+  def addLazyFactory(self, id, loader):
+    if not loader:
+      return self.INVALID_ARG
+
+    if id in self._creators:
+      return self.ALREADY_EXISTS
+
+    self._creators[id] = Factory.FactoryEntry(id, None, None, loader)
+    return self.FACTORY_OK
+
+
+  ##
+  # @if jp
+  #
+  # @brief ץ졼ۥºݤΥեȥ֤
+  #
+  # ץ졼ۥ loader ƤӽФloader Ԥ
+  # եȥϿʤäϥץ졼ۥ롣
+  #
+  # @param id ̻
+  # @return true: եȥ꤬ϿƤ
+  #         false: եȥ꤬ϿƤʤ
+  #
+  # @else
+  #
+  # @brief Replace a placeholder with the actual factory
+  #
+  # The loader of the placeholder is called. If the loader fails or
+  # does not register the factory, the placeholder is removed.
+  #
+  # @param id Identifier
+  # @return true: The factory is registered
+  #         false: The factory is not registered
+  #
+  # @endif
+  def materialize(self, id):
+    guard = OpenRTM_aist.ScopedLock(self._loaderMutex)
+    entry_ = self._creators.get(id)
+    if entry_ is None:
+      return False
+    if entry_.creator_:
+      return True
+
+    try:
+      entry_.loader_()
+    except:
+      print(OpenRTM_aist.Logger.print_exception())
+
+    if self._creators.get(id) is entry_:
+      print("Factory.materialize failed id: ", id)
+      del self._creators[id]
+      return False
+    return True
+
+
+  ##
+  # @if jp
+  #
+  # @brief ºݤϿ줿եȥμ̻ҥꥹȤ
+  #
+  # ץ졼ۥΤޤ޻ѤƤʤ̻Ҥϴޤޤʤ
+  #
+  # @return ̻ҥꥹ
+  #
+  # @else
+  #
+  # @brief Get the identifiers of the actually registered factories
+  #
+  # The identifiers of placeholders that have not been used are not
+  # included.
+  #
+  # @return List of identifiers
+  #
+  # @endif
+  # std::vector<Identifier> getMaterializedIdentifiers()
+  def getMaterializedIdentifiers(self):
+    idlist = [id for id, entry in self._creators.items() if entry.creator_]
+    idlist.sort()
+    return idlist
+
+
   ## ReturnCode removeFactory(const Identifier& id)
   def removeFactory(self, id):
     if not id in self._creators:
@@ -125,6 +245,8 @@ class Factory:
     if not id in self._creators:
       print("Factory.createObject return None id: ", id)
       return None
+    if not self._creators[id].creator_ and not self.materialize(id):
+      return None
     obj_ = self._creators[id].creator_()
     #assert(not obj_ in self._objects)
     self._objects[obj_] = self._creators[id]
@@ -22,6 +22,11 @@ import copy
 import OpenRTM_aist
 import threading
 
+try:
+  import asyncio
+except ImportError:
+  asyncio = None
+
 ##
 # @if jp
 #
@@ -37,6 +42,8 @@ import threading
 # getNewList(), getNewListReverse() Υ᥽åɤˤϥɥ󥰤뤳Ȥ
 # Ǥ롣
 #
+# asyncio ѤǤʤĶ (Python 2) Ǥ read_async() ʤ
+#
 # @since 0.2.0
 #
 # @else
@@ -52,6 +59,8 @@ import threading
 # value types. This value types are previously define RtComponent IDL.
 # ex. type T: TimedFload, TimedLong etc... 
 #
+# read_async() is not defined where asyncio is not available (Python 2).
+#
 # @since 0.2.0
 #
 # @endif
@@ -93,6 +102,9 @@ class InPort(OpenRTM_aist.InPortBase):
 
     self._directNewData = False
     self._valueMutex = threading.RLock()
+    self._dataWaiters = []
+    self._arrivalCallbacks = []
+    self._dataNotifier = None
 
     self.addConnectorDataListener(OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVED, OpenRTM_aist.Timestamp("on_received"))
     self.addConnectorDataListener(OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_READ, OpenRTM_aist.Timestamp("on_read"))
@@ -465,6 +477,186 @@ class InPort(OpenRTM_aist.InPortBase):
     self._value = data
     self._directNewData = True
     del guard
+    if self._dataWaiters or self._arrivalCallbacks:
+      self.notifyDataArrival()
+
+
+  if asyncio is not None:
+    ##
+    # @if jp
+    #
+    # @brief ǡԤäɤ߽Ф awaitable ֤
+    #
+    # ͥΥХåե˿ǡ񤭹ޤ줿ǡread() 
+    # ̤ͤȤƴλ asyncio  Future ֤ƤӽФ
+    # ̤ɤΥǡϴλ Future ֤롼
+    # "data = await self._inIn.read_async()" Τ褦˻Ѥ롣
+    #
+    # Future ϸƤӽФåɤΥ٥ȥ롼פ˴Ϣդ롣
+    #  Future ϴλޤϥ󥻥 (asyncio.wait_for() Υ
+    # ॢȤޤ) 줿ԵԤ롣
+    #
+    # @param self
+    # @param name ͥ̾ꤷʤƬΥͥ
+    # @return asyncio.Future
+    #
+    # @else
+    #
+    # @brief Return an awaitable reading the next data when it arrives
+    #
+    # This returns an asyncio Future which completes with the result
+    # of read() when new data is written to the buffer of the
+    # connector. If unread data exists at the time of the call, a
+    # completed Future is returned. Use it in a coroutine as
+    # "data = await self._inIn.read_async()".
+    #
+    # The Future is bound to the event loop of the calling thread. A
+    # waiting Future is removed from the waiters when it completes or
+    # is cancelled, including a timeout of asyncio.wait_for().
+    #
+    # @param self
+    # @param name Connector name. The first connector if omitted
+    # @return asyncio.Future
+    #
+    # @endif
+    def read_async(self, name=None):
+      loop_ = asyncio.get_event_loop()
+      future_ = loop_.create_future()
+      if self.isNew(name):
+        future_.set_result(self.read(name))
+        return future_
+
+      future_.add_done_callback(self.removeDataWaiter)
+      self.addDataWaiter(loop_, future_, name)
+      # Data may have arrived before the waiter was added
+      if self.isNew(name):
+        self.completeDataWaiter(future_, name)
+      return future_
+
+
+  def addDataWaiter(self, loop, future, name):
+    guard = OpenRTM_aist.ScopedLock(self._valueMutex)
+    self.installDataNotifier()
+    self._dataWaiters = self._dataWaiters + [(loop, future, name)]
+    del guard
+    return
+
+
+  def removeDataWaiter(self, future):
+    guard = OpenRTM_aist.ScopedLock(self._valueMutex)
+    self._dataWaiters = [waiter for waiter in self._dataWaiters
+                         if waiter[1] is not future]
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  #
+  # @brief ǡ˸ƤӽФХåɲä
+  #
+  # ͥΥХåեؤΥǡν񤭹 (ON_RECEIVED) ӥ
+  # žˤǡν񤭹ߤθˡʤǸƤӽФ롣
+  # Хåϥǡ񤭹åɤǸƤӽФ롣
+  #
+  # @param self
+  # @param callback Хåؿ
+  #
+  # @else
+  #
+  # @brief Add a callback invoked when new data arrives
+  #
+  # The callback is invoked without arguments after data is written to
+  # the buffer of a connector (ON_RECEIVED) and after data is written
+  # by direct transfer. It is invoked in the thread writing the data.
+  #
+  # @param self
+  # @param callback Callback function
+  #
+  # @endif
+  def addDataArrivalCallback(self, callback):
+    guard = OpenRTM_aist.ScopedLock(self._valueMutex)
+    self.installDataNotifier()
+    self._arrivalCallbacks = self._arrivalCallbacks + [callback]
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǡ˸ƤӽФХå
+  # @param self
+  # @param callback Хåؿ
+  # @else
+  # @brief Remove a callback invoked when new data arrives
+  # @param self
+  # @param callback Callback function
+  # @endif
+  def removeDataArrivalCallback(self, callback):
+    guard = OpenRTM_aist.ScopedLock(self._valueMutex)
+    self._arrivalCallbacks = [cb for cb in self._arrivalCallbacks if cb != callback]
+    del guard
+    return
+
+
+  def installDataNotifier(self):
+    if self._dataNotifier is None:
+      self._dataNotifier = InPort.DataNotifier(self)
+      self.addConnectorDataListener(OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVED,
+                                    self._dataNotifier)
+    return
+
+
+  def completeDataWaiter(self, future, name):
+    if future.done() or not self.isNew(name):
+      return
+    future.set_result(self.read(name))
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǡΤ
+  #
+  # read_async() ԵƤ Future ȡ
+  # addDataArrivalCallback() ɲä줿ХåΤ롣
+  #
+  # @else
+  # @brief Notify arrival of new data
+  #
+  # The Futures waiting in read_async() and the callbacks added by
+  # addDataArrivalCallback() are notified.
+  #
+  # @endif
+  def notifyDataArrival(self):
+    for callback_ in self._arrivalCallbacks:
+      callback_()
+    for loop_, future_, name_ in self._dataWaiters:
+      try:
+        loop_.call_soon_threadsafe(self.completeDataWaiter, future_, name_)
+      except RuntimeError:
+        # the event loop has been closed
+        self.removeDataWaiter(future_)
+    return
+
+
+  ##
+  # @if jp
+  # @class DataNotifier
+  # @brief ǡ notifyDataArrival() Τꥹ
+  # @else
+  # @class DataNotifier
+  # @brief Listener notifying data reception by notifyDataArrival()
+  # @endif
+  class DataNotifier:
+    def __init__(self, port):
+      self._port = port
+      return
+
+    def __call__(self, info, data):
+      if self._port._dataWaiters or self._port._arrivalCallbacks:
+        self._port.notifyDataArrival()
+      return OpenRTM_aist.ConnectorListenerStatus.NO_CHANGE
 
 
     
\ No newline at end of file
@@ -16,7 +16,6 @@
 #     All rights reserved.
 #
 
-import copy
 import threading
 import OpenRTM_aist
 import RTC
@@ -559,7 +558,7 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
     OpenRTM_aist.NVUtil.copyToProperties(prop, connector_profile.properties)
 
     node = prop.getNode("dataport.inport")
-    portprop = copy.deepcopy(self._properties)
+    portprop = self._properties.clone()
     portprop.mergeProperties(node)
     node.mergeProperties(portprop)
     OpenRTM_aist.NVUtil.copyFromProperties(connector_profile.properties, prop)
@@ -898,7 +897,7 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
       return retval
 
     # prop: [port.outport].
-    prop = copy.deepcopy(self._properties)
+    prop = self._properties.clone()
 
     conn_prop = OpenRTM_aist.Properties()
     OpenRTM_aist.NVUtil.copyToProperties(conn_prop, cprof.properties)
@@ -1000,7 +999,7 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
     self._rtcout.RTC_TRACE("subscribeInterfaces()")
 
     # prop: [port.outport].
-    prop = copy.deepcopy(self._properties)
+    prop = self._properties.clone()
     conn_prop = OpenRTM_aist.Properties()
     OpenRTM_aist.NVUtil.copyToProperties(conn_prop, cprof.properties)
     prop.mergeProperties(conn_prop.getNode("dataport")) # marge ConnectorProfile
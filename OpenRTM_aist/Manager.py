@@ -169,6 +169,7 @@ class Manager:
     signal.signal(signal.SIGINT, handler)
     self._rtcout = None
     self._mgrservant = None
+    self._configWatcher = None
     
     
     return
@@ -322,6 +323,8 @@ class Manager:
     self._listeners.manager_.preShutdown()
     self.shutdownTimer()
     self.shutdownComponents()
+    self._rtcout.RTC_DEBUG("Materialized transports: %s",
+                           str(OpenRTM_aist.getMaterializedTransports()))
     self.shutdownManagerServant()
     self.shutdownNaming()
     self.shutdownORB()
@@ -961,6 +964,17 @@ class Manager:
                     "corba.id",
                     "exec_cxt.periodic.type",
                     "exec_cxt.periodic.rate",
+                    "exec_cxt.periodic.isolation",
+                    "exec_cxt.periodic.sync_file",
+                    "exec_cxt.periodic.sync_index",
+                    "exec_cxt.periodic.sync_timeout",
+                    "exec_cxt.periodic.worker_threads",
+                    "exec_cxt.periodic.scheduler",
+                    "exec_cxt.periodic.callback_timeout",
+                    "exec_cxt.periodic.min_interval",
+                    "exec_cxt.periodic.max_interval",
+                    "exec_cxt.periodic.gc_mode",
+                    "exec_cxt.periodic.gc_full_slack",
                     "exec_cxt.event_driven.type",
                     "exec_cxt.sync_transition",
                     "exec_cxt.sync_activation",
@@ -971,6 +985,13 @@ class Manager:
                     "exec_cxt.deactivation_timeout",
                     "exec_cxt.reset_timeout",
                     "exec_cxt.cpu_affinity",
+                    "exec_cxt.sched_policy",
+                    "exec_cxt.sched_priority",
+                    "exec_cxt.schedule_mode",
+                    "exec_cxt.overrun_policy",
+                    "exec_cxt.execution_profile",
+                    "exec_cxt.deadline_watchdog",
+                    "exec_cxt.deadline_miss_limit",
                     "logger.enable",
                     "logger.log_level",
                     "naming.enable",
@@ -1111,6 +1132,8 @@ class Manager:
   def unregisterComponent(self, comp):
     self._rtcout.RTC_TRACE("Manager.unregisterComponent(%s)", comp.getInstanceName())
     self._compManager.unregisterObject(comp.getInstanceName())
+    if self._configWatcher:
+      self._configWatcher.unwatch(comp)
     names = comp.getNamingNames()
     
     self._listeners.naming_.preUnbind(comp, names)
@@ -1445,6 +1468,18 @@ class Manager:
                                       OpenRTM_aist.Manager.cleanupComponents,
                                       tm)
 
+    if self._timer and \
+          OpenRTM_aist.toBool(self._config.getProperty("manager.config_watch.enable"),
+                              "YES", "NO", False):
+      tm = OpenRTM_aist.TimeValue(1, 0)
+      intr = self._config.getProperty("manager.config_watch.interval")
+      if intr != "":
+        tm.set_time(float(intr))
+      self._configWatcher = OpenRTM_aist.ConfigWatcher(self)
+      self._timer.registerListenerObj(self._configWatcher,
+                                      OpenRTM_aist.ConfigWatcher.check,
+                                      tm)
+
 
     lmpm_ = [s.strip() for s in self._config.getProperty("manager.preload.modules").split(",")]
     for mpm_ in lmpm_:
@@ -2039,7 +2074,12 @@ class Manager:
     OpenRTM_aist.ExtTrigExecutionContextInit(self)
     OpenRTM_aist.OpenHRPExecutionContextInit(self)
     OpenRTM_aist.SimulatorExecutionContextInit(self)
+    OpenRTM_aist.DataflowExecutionContextInit(self)
+    OpenRTM_aist.MultirateExecutionContextInit(self)
+    OpenRTM_aist.AsyncioExecutionContextInit(self)
+    OpenRTM_aist.EventDrivenExecutionContextInit(self)
     OpenRTM_aist.MultilayerCompositeECInit(self)
+    OpenRTM_aist.MultilayerCompositeChildECInit(self)
     
     self.initCpuAffinity()
     return True
@@ -2569,6 +2609,58 @@ class Manager:
   # @endif
   # void configureComponent(RTObject_impl* comp, const coil::Properties& prop);
   def configureComponent(self, comp, prop):
+    config_fname = []
+    type_prop = self.loadComponentConfig(comp, config_fname)
+
+    comp.setProperties(prop)
+    type_prop.setProperty("config_file",OpenRTM_aist.flatten(OpenRTM_aist.unique_sv(config_fname)))
+    comp.setProperties(type_prop)
+    if self._configWatcher:
+      self._configWatcher.watch(comp, self.getComponentConfigFiles(comp))
+
+    comp_prop = OpenRTM_aist.Properties(prop=comp.getProperties())
+
+    naming_formats = self._config.getProperty("naming.formats")
+    if comp_prop.findNode("naming.formats"):
+      naming_formats = comp_prop.getProperty("naming.formats")
+    naming_formats = OpenRTM_aist.flatten(OpenRTM_aist.unique_sv(OpenRTM_aist.split(naming_formats, ",")))
+
+    naming_names = self.formatString(naming_formats, comp.getProperties())
+    comp.getProperties().setProperty("naming.formats",naming_formats)
+    comp.getProperties().setProperty("naming.names",naming_names)
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTݡͥȤեɤ߹
+  #
+  # RTݡͥȤηӥ󥹥եȡrtc.conf
+  # ˵ܤ줿ӥ󥹥ɤ߹ߡ󥹥
+  # ͥ褷ƥޡץѥƥ֤
+  #
+  # @param self
+  # @param comp оRTݡͥ
+  # @param config_fname ɤ߹ե̾ɲäꥹ
+  #
+  # @return Υץѥƥ
+  #
+  # @else
+  # @brief Load the configuration files of an RT-Component
+  #
+  # The configuration files of the type and the instance of the
+  # RT-Component and the type and instance configuration written in
+  # rtc.conf are loaded, and the properties merged with the instance
+  # configuration taking precedence are returned.
+  #
+  # @param self
+  # @param comp Target RT-Component
+  # @param config_fname List to which the loaded file names are appended
+  #
+  # @return Properties of the configuration
+  #
+  # @endif
+  def loadComponentConfig(self, comp, config_fname):
     category  = comp.getCategory()
     type_name = comp.getTypeName()
     inst_name = comp.getInstanceName()
@@ -2579,12 +2671,13 @@ class Manager:
     type_prop = OpenRTM_aist.Properties()
 
     name_prop = OpenRTM_aist.Properties()
-    config_fname = []
+    cache_dir_ = OpenRTM_aist.getConfigCacheDir(self._config)
 
     if self._config.getProperty(name_conf) != "":
       try:
-        conff = open(self._config.getProperty(name_conf))
-        name_prop.load(conff)
+        OpenRTM_aist.loadConfigFile(name_prop,
+                                    self._config.getProperty(name_conf),
+                                    cache_dir_)
         self._rtcout.RTC_INFO("Component instance conf file: %s loaded.",
                               self._config.getProperty(name_conf))
         self._rtcout.RTC_DEBUG(name_prop)
@@ -2592,8 +2685,6 @@ class Manager:
       except:
         print("Not found. : %s" % self._config.getProperty(name_conf))
         self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
-      else:
-        name_prop.load(conff)
 
     if self._config.findNode(category + "." + inst_name):
       temp_ = OpenRTM_aist.Properties(prop=self._config.getNode(category+"."+inst_name))
@@ -2607,8 +2698,9 @@ class Manager:
 
     if self._config.getProperty(type_conf) != "":
       try:
-        conff = open(self._config.getProperty(type_conf))
-        type_prop.load(conff)
+        OpenRTM_aist.loadConfigFile(type_prop,
+                                    self._config.getProperty(type_conf),
+                                    cache_dir_)
         self._rtcout.RTC_INFO("Component type conf file: %s loaded.",
                               self._config.getProperty(type_conf))
         self._rtcout.RTC_DEBUG(type_prop)
@@ -2616,8 +2708,6 @@ class Manager:
       except:
         print("Not found. : %s" % self._config.getProperty(type_conf))
         self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
-      else:
-        type_prop.load(conff)
 
     if self._config.findNode(category + "." + type_name):
       temp_ = OpenRTM_aist.Properties(prop=self._config.getNode(category+"."+type_name))
@@ -2629,22 +2719,41 @@ class Manager:
         if self._config.findNode("config_file"):
           config_fname.append(self._config.getProperty("config_file"))
     
-    comp.setProperties(prop)
     type_prop.mergeProperties(name_prop)
-    type_prop.setProperty("config_file",OpenRTM_aist.flatten(OpenRTM_aist.unique_sv(config_fname)))
-    comp.setProperties(type_prop)
+    return type_prop
 
-    comp_prop = OpenRTM_aist.Properties(prop=comp.getProperties())
-
-    naming_formats = self._config.getProperty("naming.formats")
-    if comp_prop.findNode("naming.formats"):
-      naming_formats = comp_prop.getProperty("naming.formats")
-    naming_formats = OpenRTM_aist.flatten(OpenRTM_aist.unique_sv(OpenRTM_aist.split(naming_formats, ",")))
 
-    naming_names = self.formatString(naming_formats, comp.getProperties())
-    comp.getProperties().setProperty("naming.formats",naming_formats)
-    comp.getProperties().setProperty("naming.names",naming_names)
-    return
+  ##
+  # @if jp
+  # @brief RTݡͥȤե̾
+  #
+  # rtc.conf ˵ܤ줿RTݡͥȤηӥ󥹥󥹤
+  # ե֤̾ꤵƤʤ϶ʸȤʤ롣
+  #
+  # @param self
+  # @param comp оRTݡͥ
+  #
+  # @return [ե̾, 󥹥󥹤ե̾]
+  #
+  # @else
+  # @brief Get the configuration file names of an RT-Component
+  #
+  # The configuration file names of the type and the instance of the
+  # RT-Component written in rtc.conf are returned. They are empty
+  # strings if not specified.
+  #
+  # @param self
+  # @param comp Target RT-Component
+  #
+  # @return [type configuration file, instance configuration file]
+  #
+  # @endif
+  def getComponentConfigFiles(self, comp):
+    category  = comp.getCategory()
+    type_conf = category + "." + comp.getTypeName() + ".config_file"
+    name_conf = category + "." + comp.getInstanceName() + ".config_file"
+    return [self._config.getProperty(type_conf),
+            self._config.getProperty(name_conf)]
 
 
   ##
@@ -2671,13 +2780,12 @@ class Manager:
     if file_name[0] != '\0':
       
       try:
-        conff = open(file_name)
+        OpenRTM_aist.loadConfigFile(prop, file_name,
+                                    OpenRTM_aist.getConfigCacheDir(self._config))
       except:
         print("Not found. : %s" % file_name)
         self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       else:
-        prop.load(conff)
-        conff.close()
         return True
   
     return False
@@ -200,9 +200,8 @@ class ManagerConfig :
     prop.setDefaults(OpenRTM_aist.default_config)
     if self.findConfigFile():
       #try:
-      with open(self._configFile,"r") as fd:
-        prop.load(fd)
-        fd.close()
+      OpenRTM_aist.loadConfigFile(prop, self._configFile,
+                                  OpenRTM_aist.getConfigCacheDir(self._argprop))
       #except:
       #  print(OpenRTM_aist.Logger.print_exception())
 
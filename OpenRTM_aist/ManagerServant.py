@@ -15,7 +15,6 @@
 #         Advanced Industrial Science and Technology (AIST), Japan
 #     All rights reserved.
 
-import copy
 import threading
 import time
 from omniORB import CORBA
@@ -200,7 +199,7 @@ class ManagerServant(RTM__POA.Manager):
     self._objref = RTM.Manager._nil
     
 
-    config = copy.deepcopy(self._mgr.getConfig())
+    config = self._mgr.getConfig().clone()
 
     if (not self.createINSManager()):
       self._rtcout.RTC_WARN("Manager CORBA servant creation failed.")
@@ -1133,7 +1132,7 @@ class ManagerServant(RTM__POA.Manager):
   def findManager(self, host_port):
     self._rtcout.RTC_TRACE("findManager(host_port = %s)", host_port)
     try:
-      config = copy.deepcopy(self._mgr.getConfig())
+      config = self._mgr.getConfig().clone()
       mgrloc = "corbaloc:iiop:"
       mgrloc += host_port
       mgrloc += "/" + config.getProperty("manager.name")
@@ -1378,7 +1377,7 @@ class ManagerServant(RTM__POA.Manager):
     
     if CORBA.is_nil(mgrobj):
       self._rtcout.RTC_WARN("%s cannot be found.", mgrstr)
-      config = copy.deepcopy(self._mgr.getConfig())
+      config = self._mgr.getConfig().clone()
       rtcd_cmd = config.getProperty("manager.modules."+comp_param.language()+".manager_cmd")
       
       if not rtcd_cmd:
@@ -1547,7 +1546,7 @@ class ManagerServant(RTM__POA.Manager):
 
 
     if CORBA.is_nil(mgrobj):
-      config = copy.deepcopy(self._mgr.getConfig())
+      config = self._mgr.getConfig().clone()
       rtcd_cmd = config.getProperty("manager.modules."+comp_param.language()+".manager_cmd")
       if not rtcd_cmd:
         rtcd_cmd = "rtcd_python"
@@ -35,6 +35,9 @@ ALLOW_URL     = "manager.modules.download_allowed"
 MOD_DWNDIR    = "manager.modules.download_dir"
 MOD_DELMOD    = "manager.modules.download_cleanup"
 MOD_PRELOAD   = "manager.modules.preload"
+MOD_PROFCACHE = "manager.modules.profile_cache.dir"
+MOD_SCANPROCS = "manager.modules.scan_processes"
+MOD_SCANTHRDS = "manager.modules.scan_threads"
 
 
 
@@ -105,6 +108,21 @@ class ModuleManager:
     self._modprofs = []
     self._loadfailmods = []
 
+    cache_dir_ = prop.getProperty(MOD_PROFCACHE)
+    if not cache_dir_:
+      cache_dir_ = OpenRTM_aist.getConfigCacheDir(prop)
+    self._profileCache = None
+    if cache_dir_:
+      self._profileCache = OpenRTM_aist.getModuleProfileCache(cache_dir_)
+    try:
+      self._scanProcesses = int(prop.getProperty(MOD_SCANPROCS, "0"))
+    except ValueError:
+      self._scanProcesses = 0
+    try:
+      self._scanThreads = int(prop.getProperty(MOD_SCANTHRDS, "0"))
+    except ValueError:
+      self._scanThreads = 0
+
   ##
   # @if jp
   #
@@ -470,38 +488,22 @@ class ModuleManager:
     return modules
 
 
-  def __getRtcProfile(self, fname):
+  def __getRtcProfile(self, fname, result):
     # file name with full path
     fullname  = fname
     # directory name
     dirname   = os.path.dirname(fullname)
     sys.path.append(dirname)
-    # basename
-    basename  = os.path.basename(fullname)
-    # classname
-    classname  = basename.split(".")[0].lower()
 
     # loaded profile = old profiles - new profiles
     # for old
     oldp = self._mgr.getFactoryProfiles()
 
     # for new
-    comp_spec_name = classname+"_spec"
-
-
-    
-        
-    try:
-      with open(str(fullname)) as f:
-        if f.read().find(comp_spec_name) == -1:
-          return None
-      imp_file = __import__(basename.split(".")[0])
-    except:
+    # result is (status, comp_spec) of OpenRTM_aist.scanPythonProfile()
+    if result[0] != OpenRTM_aist.PROFILE_FOUND:
       return None
-    comp_spec = getattr(imp_file,comp_spec_name,None)
-    if not comp_spec:
-      return None
-    newp = OpenRTM_aist.Properties(defaults_str=comp_spec)
+    newp = OpenRTM_aist.Properties(defaults_str=result[1])
 
     profs = []
     
@@ -636,56 +638,99 @@ class ModuleManager:
     l = "manager.modules." + lang
     lprop = self._properties.getNode(l)
 
-    paths = lprop.getProperty("load_paths").split(",")
-    
-    
+    if lang == "Python":
+      cmd = ""
+    else:
+      cmd = lprop.getProperty("profile_cmd")
+    results = self.scanModules(lang, modules, cmd)
 
-    for mod_ in modules:
+    for mod_, result in zip(modules, results):
       if lang == "Python":
-        prop = self.__getRtcProfile(mod_)
+        prop = self.__getRtcProfile(mod_, result)
         if prop:
           prop.setProperty("module_file_name",os.path.basename(mod_))
           prop.setProperty("module_file_path", mod_)
           modprops.append(prop)
       else:
-        prop = OpenRTM_aist.Properties()
-        cmd = lprop.getProperty("profile_cmd")
-        if os.name == "nt":
-          cmd = "cmd /c " + cmd
-        cmd = cmd + " \""+mod_+"\""
-        
-        try:
-          ret = OpenRTM_aist.popen(cmd).split(os.linesep)
-          count = 0
-          for r in ret:
-            pos = r.find(":")
-            if r.find(":") != -1:
-              count += 1
-              key = r[0:pos]
-              tmp = [key]
-              OpenRTM_aist.eraseHeadBlank(tmp)
-              key = tmp[0]
-              
-              value = r[pos+1:]
-              tmp = [value]
-              OpenRTM_aist.eraseHeadBlank(tmp)
-              value = tmp[0]
-
-              prop.setProperty(key, value)
-          if count > 0:
-            self._rtcout.RTC_DEBUG("rtcprof cmd sub process done.")
-            prop.setProperty("module_file_name",os.path.basename(mod_))
-            prop.setProperty("module_file_path", mod_)
-            modprops.append(prop)
-          else:
-            self._loadfailmods.append(mod_)
-              
-          
-        except:
-          self._rtcout.RTC_ERROR("popen faild")
+        if result[0] == OpenRTM_aist.PROFILE_FOUND:
+          prop = OpenRTM_aist.Properties()
+          for key, value in result[1]:
+            prop.setProperty(key, value)
+          self._rtcout.RTC_DEBUG("rtcprof cmd sub process done.")
+          prop.setProperty("module_file_name",os.path.basename(mod_))
+          prop.setProperty("module_file_path", mod_)
+          modprops.append(prop)
+        else:
+          if result[0] == OpenRTM_aist.PROFILE_ERROR:
+            self._rtcout.RTC_ERROR("popen faild")
           self._loadfailmods.append(mod_)
 
 
+  ##
+  # @if jp
+  # @brief ⥸塼
+  #
+  # ץե륭å夬ͭʾ硢ȹ郎פ
+  # ⥸塼ϥå夵줿̤Ѥ롣ʳΥ⥸塼
+  # ̤򥭥å¸롣profile_cmd 
+  # manager.modules.scan_threads Υåɿ (0: CPU ) ˼
+  # Ԥ롣Python ⥸塼 manager.modules.scan_processes 2
+  # ξΤߤΥץ롣
+  #
+  # @param self
+  # @param lang 
+  # @param modules ⥸塼ΥѥΥꥹ
+  # @param cmd profile_cmd
+  # @return modules Ʊ (, ǡ) Υꥹ
+  #
+  # @else
+  # @brief Scan modules
+  #
+  # If the profile cache is enabled, the cached results are used for
+  # the modules whose size and modification time match. The other
+  # modules are scanned and the results are stored in the cache.
+  # profile_cmd is run in parallel with the number of threads of
+  # manager.modules.scan_threads (0: number of CPUs). Python modules are
+  # scanned in parallel only if manager.modules.scan_processes is two
+  # or more, with that number of processes.
+  #
+  # @param self
+  # @param lang Language
+  # @param modules List of paths of the modules
+  # @param cmd profile_cmd
+  # @return List of (result, data) in the order of modules
+  #
+  # @endif
+  def scanModules(self, lang, modules, cmd):
+    results = [None] * len(modules)
+    keys = [None] * len(modules)
+    stamps = [None] * len(modules)
+    misses = []
+    for i, mod_ in enumerate(modules):
+      if self._profileCache:
+        keys[i] = (lang, cmd, os.path.abspath(mod_))
+        stamps[i] = OpenRTM_aist.getFileStamp(mod_)
+        results[i] = self._profileCache.get(keys[i], stamps[i])
+      if results[i] is None:
+        misses.append(i)
+
+    threads = OpenRTM_aist.getScanThreads(self._scanThreads)
+    self._rtcout.RTC_DEBUG("%s: %d cached, %d scanned (processes: %d, threads: %d)",
+                           (lang, len(modules) - len(misses), len(misses),
+                            self._scanProcesses, threads))
+    scanned = OpenRTM_aist.scanModuleProfiles([(lang, modules[i], cmd) for i in misses],
+                                              self._scanProcesses, threads)
+    for i, result in zip(misses, scanned):
+      results[i] = result
+      if self._profileCache:
+        self._profileCache.set(keys[i], stamps[i], result)
+
+    if self._profileCache and misses:
+      if not self._profileCache.save():
+        self._rtcout.RTC_WARN("Failed to write the module profile cache.")
+    return results
+
+
   ##
   # @if jp
   # @brief ̵ʥ⥸塼ץե
@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file ModuleProfileCache.py
+# @brief On-disk cache and parallel scanning of loadable module profiles
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import os
+import sys
+import threading
+import multiprocessing
+import multiprocessing.pool
+
+import OpenRTM_aist
+
+
+MODULE_PROFILE_CACHE_VERSION = 1
+
+##
+# @if jp
+# @brief モジュールの走査結果
+#
+# - found: プロファイルが見つかった
+# - not_found: プロファイルが見つからなかった (キャッシュする)
+# - error: インポートやコマンドの実行に失敗した (キャッシュしない)
+#
+# @else
+# @brief Results of scanning a module
+#
+# - found: The profile was found
+# - not_found: The profile was not found (cached)
+# - error: Importing or the command failed (not cached)
+#
+# @endif
+PROFILE_FOUND = "found"
+PROFILE_NOT_FOUND = "not_found"
+PROFILE_ERROR = "error"
+
+
+##
+# @if jp
+# @class ModuleProfileCache
+# @brief ロード可能モジュールのプロファイルのディスクキャッシュ
+#
+# ModuleManager.getLoadableModules() が各モジュールを走査した結果を、
+# (言語, profile_cmd, モジュールの絶対パス) をキーとして、モジュール
+# のサイズ、更新時刻とともにキャッシュディレクトリの1つのファイルに
+# pickle で保存する。Python モジュールについては *_spec の文字列リス
+# ト、それ以外の言語については profile_cmd の出力の (キー, 値) のリス
+# トを保存する。プロファイルはこれらから毎回作成するため、結果はキャッ
+# シュを使用しない場合と同じになる。
+#
+# キャッシュの読み書きに失敗した場合はキャッシュを使用せずに走査する。
+#
+# @since 2.0.0
+#
+# @else
+# @class ModuleProfileCache
+# @brief On-disk cache of the profiles of loadable modules
+#
+# The results of scanning modules by
+# ModuleManager.getLoadableModules() are pickled into one file in the
+# cache directory, keyed by (language, profile_cmd, absolute path of
+# the module) together with the size and modification time of the
+# module. For Python modules the string list of *_spec is stored, and
+# for the other languages the list of (key, value) of the output of
+# profile_cmd. Since profiles are created from them every time, the
+# result is the same as without the cache.
+#
+# If reading or writing the cache fails, modules are scanned without
+# the cache.
+#
+# @since 2.0.0
+#
+# @endif
+class ModuleProfileCache:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @param cache_dir キャッシュディレクトリ
+  # @else
+  # @brief Constructor
+  # @param cache_dir Cache directory
+  # @endif
+  def __init__(self, cache_dir):
+    self._cacheDir = cache_dir
+    self._cacheFile = os.path.join(cache_dir,
+                                   "module_profiles.py%d.cache" % sys.version_info[0])
+    self._entries = None
+    self._dirty = False
+    self._mutex = threading.RLock()
+    return
+
+
+  ##
+  # @if jp
+  # @brief キャッシュされた走査結果を取得する
+  # @param self
+  # @param key (言語, profile_cmd, モジュールの絶対パス)
+  # @param stamp モジュールの (サイズ, 更新時刻)
+  # @return (走査結果, データ)。キャッシュが無効な場合は None
+  # @else
+  # @brief Get the cached result of scanning
+  # @param self
+  # @param key (language, profile_cmd, absolute path of the module)
+  # @param stamp (size, modification time) of the module
+  # @return (result, data). None if the cache is not valid
+  # @endif
+  def get(self, key, stamp):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    entry_ = self.entries().get(key)
+    if entry_ is None or entry_[0] != stamp:
+      return None
+    return entry_[1]
+
+
+  ##
+  # @if jp
+  # @brief 走査結果をキャッシュする
+  #
+  # PROFILE_ERROR はキャッシュしない。ファイルには save() で書き込む。
+  #
+  # @param self
+  # @param key (言語, profile_cmd, モジュールの絶対パス)
+  # @param stamp モジュールの (サイズ, 更新時刻)
+  # @param result (走査結果, データ)
+  #
+  # @else
+  # @brief Cache the result of scanning
+  #
+  # PROFILE_ERROR is not cached. The file is written by save().
+  #
+  # @param self
+  # @param key (language, profile_cmd, absolute path of the module)
+  # @param stamp (size, modification time) of the module
+  # @param result (result, data)
+  #
+  # @endif
+  def set(self, key, stamp, result):
+    if stamp is None or result[0] == PROFILE_ERROR:
+      return
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    self.entries()[key] = (stamp, result)
+    self._dirty = True
+    return
+
+
+  ##
+  # @if jp
+  # @brief キャッシュの内容を取得する
+  #
+  # 最初の呼び出し時にキャッシュファイルを読み込む。
+  #
+  # @else
+  # @brief Get the contents of the cache
+  #
+  # The cache file is read on the first call.
+  #
+  # @endif
+  def entries(self):
+    if self._entries is None:
+      self._entries = {}
+      data_ = OpenRTM_aist.readPickleFile(self._cacheFile)
+      try:
+        if data_.get("version") == MODULE_PROFILE_CACHE_VERSION:
+          self._entries = data_["entries"]
+      except Exception:
+        pass
+    return self._entries
+
+
+  ##
+  # @if jp
+  # @brief キャッシュファイルを書き込む
+  #
+  # 変更がない場合は何もしない。
+  #
+  # @return 書き込みに成功した場合 True
+  #
+  # @else
+  # @brief Write the cache file
+  #
+  # Nothing is done if not changed.
+  #
+  # @return True if written successfully
+  #
+  # @endif
+  def save(self):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    if not self._dirty:
+      return True
+    if not OpenRTM_aist.writePickleFile(self._cacheFile,
+                                        {"version": MODULE_PROFILE_CACHE_VERSION,
+                                         "entries": self._entries}):
+      return False
+    self._dirty = False
+    return True
+
+
+
+module_profile_caches = {}
+module_profile_caches_mutex = threading.RLock()
+
+
+##
+# @if jp
+# @brief キャッシュディレクトリの ModuleProfileCache を取得する
+# @param cache_dir キャッシュディレクトリ
+# @return ModuleProfileCache
+# @else
+# @brief Get the ModuleProfileCache of a cache directory
+# @param cache_dir Cache directory
+# @return ModuleProfileCache
+# @endif
+def getModuleProfileCache(cache_dir):
+  guard = OpenRTM_aist.ScopedLock(module_profile_caches_mutex)
+  cache_ = module_profile_caches.get(cache_dir)
+  if cache_ is None:
+    cache_ = ModuleProfileCache(cache_dir)
+    module_profile_caches[cache_dir] = cache_
+  return cache_
+
+
+##
+# @if jp
+# @brief Python モジュールの *_spec を取得する
+#
+# ファイル名を小文字にした名前に _spec を付けた変数を
+# extractSpec() でモジュールを実行せずに取得する。リテラルでない場合
+# はモジュールをインポートして取得する。
+#
+# @param file_name モジュールのパス
+# @return (走査結果, *_spec の文字列リスト)
+#
+# @else
+# @brief Get *_spec of a Python module
+#
+# The variable named the lowercased file name with _spec is obtained
+# by extractSpec() without executing the module. If it is not a
+# literal, it is obtained by importing the module.
+#
+# @param file_name Path of the module
+# @return (result, string list of *_spec)
+#
+# @endif
+def scanPythonProfile(file_name):
+  spec_name_ = OpenRTM_aist.getSpecName(file_name)
+
+  try:
+    with open(str(file_name)) as f:
+      if f.read().find(spec_name_) == -1:
+        return (PROFILE_NOT_FOUND, None)
+    spec_ = OpenRTM_aist.extractSpec(file_name, spec_name_)
+    if spec_ is None:
+      spec_ = OpenRTM_aist.importSpec(file_name, spec_name_)
+  except:
+    return (PROFILE_ERROR, None)
+
+  if not spec_:
+    return (PROFILE_NOT_FOUND, None)
+  return (PROFILE_FOUND, list(spec_))
+
+
+##
+# @if jp
+# @brief profile_cmd でモジュールのプロファイルを取得する
+# @param file_name モジュールのパス
+# @param cmd profile_cmd
+# @return (走査結果, (キー, 値) のリスト)
+# @else
+# @brief Get the profile of a module by profile_cmd
+# @param file_name Path of the module
+# @param cmd profile_cmd
+# @return (result, list of (key, value))
+# @endif
+def scanCommandProfile(file_name, cmd):
+  if os.name == "nt":
+    cmd = "cmd /c " + cmd
+  cmd = cmd + " \"" + file_name + "\""
+
+  try:
+    out_ = OpenRTM_aist.popen(cmd)
+    if not isinstance(out_, str):
+      out_ = out_.decode("utf-8", "replace")
+  except:
+    return (PROFILE_ERROR, None)
+
+  entries_ = []
+  for r in out_.split(os.linesep):
+    pos = r.find(":")
+    if pos == -1:
+      continue
+    tmp = [r[0:pos]]
+    OpenRTM_aist.eraseHeadBlank(tmp)
+    key = tmp[0]
+    tmp = [r[pos+1:]]
+    OpenRTM_aist.eraseHeadBlank(tmp)
+    entries_.append((key, tmp[0]))
+
+  if not entries_:
+    return (PROFILE_NOT_FOUND, None)
+  return (PROFILE_FOUND, entries_)
+
+
+##
+# @if jp
+# @brief モジュールを走査する
+# @param target (言語, モジュールのパス, profile_cmd)
+# @return (走査結果, データ)
+# @else
+# @brief Scan a module
+# @param target (language, path of the module, profile_cmd)
+# @return (result, data)
+# @endif
+def scanModuleProfile(target):
+  lang_, file_name_, cmd_ = target
+  if lang_ == "Python":
+    return scanPythonProfile(file_name_)
+  return scanCommandProfile(file_name_, cmd_)
+
+
+##
+# @if jp
+# @brief 複数のモジュールを走査する
+#
+# profile_cmd で走査するモジュールは、コマンドが子プロセスで実行され
+# るため、threads のスレッド数の multiprocessing.pool.ThreadPool で
+# 並列に走査する。Python モジュールは processes が2以上の場合のみ
+# multiprocessing.Pool で並列に走査し、それ以外の場合は順に走査す
+# る。プロセスプールは開始方法が fork の場合は実行中のプロセスを、
+# spawn の場合は __main__ モジュールを子プロセスで再度実行するため、
+# 明示的に指定した場合のみ使用する。プールを使用できない場合は順に
+# 走査する。
+#
+# @param targets (言語, モジュールのパス, profile_cmd) のリスト
+# @param processes Python モジュールを走査するプロセス数
+# @param threads profile_cmd を実行するスレッド数
+# @return targets と同じ順序の (走査結果, データ) のリスト
+#
+# @else
+# @brief Scan modules
+#
+# Modules scanned by profile_cmd are scanned in parallel by
+# multiprocessing.pool.ThreadPool with the given number of threads,
+# since the command runs in a child process anyway. Python modules are
+# scanned in parallel by multiprocessing.Pool only if processes is two
+# or more, and one by one otherwise. The process pool is used only
+# when explicitly requested, since it forks the running process with
+# the fork start method and runs the __main__ module again in the
+# children with spawn. If a pool cannot be used, the modules are
+# scanned one by one.
+#
+# @param targets List of (language, path of the module, profile_cmd)
+# @param processes Number of processes scanning Python modules
+# @param threads Number of threads running profile_cmd
+# @return List of (result, data) in the order of targets
+#
+# @endif
+def scanModuleProfiles(targets, processes=1, threads=1):
+  python_ = [i for i, target in enumerate(targets) if target[0] == "Python"]
+  command_ = [i for i, target in enumerate(targets) if target[0] != "Python"]
+
+  results_ = [None] * len(targets)
+  for indices_, pool_type_, size_ in ((python_, multiprocessing.Pool, processes),
+                                      (command_, multiprocessing.pool.ThreadPool,
+                                       threads)):
+    scanned_ = mapPool(pool_type_, size_, scanModuleProfile,
+                       [targets[i] for i in indices_])
+    for i, result in zip(indices_, scanned_):
+      results_[i] = result
+  return results_
+
+
+##
+# @if jp
+# @brief プールで関数を並列に適用する
+#
+# size が2以上で要素が複数ある場合は pool_type のプールで map() を実
+# 行する。それ以外の場合やプールを使用できない場合は順に適用する。
+#
+# @param pool_type multiprocessing.Pool または ThreadPool
+# @param size プールの大きさ
+# @param func 関数
+# @param items 要素のリスト
+# @return 結果のリスト
+#
+# @else
+# @brief Apply a function in parallel with a pool
+#
+# If size is two or more and there are multiple items, map() is run
+# with a pool of pool_type. Otherwise, or if the pool cannot be used,
+# the function is applied one by one.
+#
+# @param pool_type multiprocessing.Pool or ThreadPool
+# @param size Size of the pool
+# @param func Function
+# @param items List of items
+# @return List of results
+#
+# @endif
+def mapPool(pool_type, size, func, items):
+  if size > 1 and len(items) > 1:
+    try:
+      pool_ = pool_type(min(size, len(items)))
+      try:
+        return pool_.map(func, items)
+      finally:
+        pool_.close()
+        pool_.join()
+    except:
+      pass
+  return [func(item) for item in items]
+
+
+##
+# @if jp
+# @brief profile_cmd を実行するスレッド数を取得する
+#
+# 0 以下の場合は CPU 数とする。
+#
+# @param threads 設定値
+# @return スレッド数
+#
+# @else
+# @brief Get the number of threads running profile_cmd
+#
+# If 0 or less, the number of CPUs is used.
+#
+# @param threads Configured value
+# @return Number of threads
+#
+# @endif
+def getScanThreads(threads):
+  if threads > 0:
+    return threads
+  try:
+    return multiprocessing.cpu_count()
+  except NotImplementedError:
+    return 1
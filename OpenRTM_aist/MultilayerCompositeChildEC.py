@@ -0,0 +1,391 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file MultilayerCompositeChildEC.py
+# @brief Execution context driven by MultilayerCompositeEC in a child process
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import os
+import threading
+
+import OpenRTM_aist
+import RTC, RTC__POA
+
+
+layerdrivers = {}
+layerdrivers_mutex = threading.RLock()
+
+
+##
+# @if jp
+# @class MultilayerCompositeChildEC
+# @brief 子プロセスで MultilayerCompositeEC に駆動される実行コンテキスト
+#
+# MultilayerCompositeEC を isolation: process で使用した場合に、各レ
+# イヤーの子プロセス内のRTCに割り当てられる実行コンテキスト。自身で
+# は周期処理を行わず、SharedMemoryBarrier を介して親プロセスの
+# MultilayerCompositeEC が周期の開始を通知する毎に1周期分の処理を実
+# 行する。同じプロセス内で同じバリアを共有する実行コンテキストは
+# 1つのスレッドで生成順に実行される。
+#
+# 以下のプロパティを使用する。
+#
+# - sync_file: バリアの共有メモリのファイルパス
+# - sync_index: バリアの参加者番号 (レイヤー番号)
+# - sync_timeout: 周期開始の待機タイムアウト [s] (デフォルト: 1.0)
+#
+# RTCの状態遷移も親プロセスの周期内で実行する。1周期分の処理を行う
+# tick() はバリアを駆動するスレッドのみが呼び出す。CORBA インター
+# フェースは RTC.ExecutionContextService であり、外部から tick() を呼
+# び出すことはできない。
+#
+# @since 2.0.0
+#
+# @else
+# @class MultilayerCompositeChildEC
+# @brief Execution context driven by MultilayerCompositeEC in a child process
+#
+# When MultilayerCompositeEC is used with isolation: process, this
+# execution context is attached to the RTCs in the child process of
+# each layer. It does not run periodically by itself, but executes
+# one cycle each time the MultilayerCompositeEC in the parent process
+# notifies the start of a cycle through SharedMemoryBarrier. The
+# execution contexts sharing the same barrier in a process are
+# executed in one thread in the order of creation.
+#
+# The following properties are used.
+#
+# - sync_file: File path of the shared memory of the barrier
+# - sync_index: Index of the party of the barrier (layer number)
+# - sync_timeout: Timeout of waiting for the cycle start [s]
+#                 (default: 1.0)
+#
+# The state transitions of the RTCs are also executed within the
+# cycles of the parent process. tick(), which executes one cycle, is
+# called only by the thread driving the barrier. The CORBA interface
+# is RTC.ExecutionContextService, so tick() cannot be called from
+# outside.
+#
+# @since 2.0.0
+#
+# @endif
+class MultilayerCompositeChildEC(OpenRTM_aist.ExecutionContextBase,
+                                 RTC__POA.ExecutionContextService):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @else
+  # @brief Constructor
+  # @endif
+  def __init__(self):
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("rtobject.multilayercomposite_child_ec")
+    self._rtcout.RTC_TRACE("MultilayerCompositeChildEC.__init__()")
+    self._driver = None
+    self._tickmutex = threading.RLock()
+    OpenRTM_aist.ExecutionContextBase.__init__(self, "multilayercomposite_child_ec")
+
+    self.setObjRef(self._this())
+    self.setKind(RTC.PERIODIC)
+    self.setRate(OpenRTM_aist.DEFAULT_EXECUTION_RATE)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 初期化関数
+  #
+  # sync_file で指定されたバリアを駆動するスレッドに登録する。
+  #
+  # @param self
+  # @param props プロパティ
+  #
+  # @else
+  # @brief Initialization
+  #
+  # This context is registered to the thread driving the barrier
+  # given by sync_file.
+  #
+  # @param self
+  # @param props Properties
+  #
+  # @endif
+  def init(self, props):
+    OpenRTM_aist.ExecutionContextBase.init(self, props)
+
+    path_ = props.getProperty("sync_file")
+    if not path_:
+      self._rtcout.RTC_ERROR("sync_file is not specified.")
+      return
+
+    index_ = [0]
+    if not OpenRTM_aist.stringTo(index_, props.getProperty("sync_index", "0")):
+      self._rtcout.RTC_ERROR("invalid sync_index value: %s",
+                             props.getProperty("sync_index"))
+      return
+
+    timeout_ = [1.0]
+    OpenRTM_aist.stringTo(timeout_, props.getProperty("sync_timeout", "1.0"))
+
+    self._driver = getLayerDriver(path_, index_[0], timeout_[0])
+    if self._driver:
+      self._driver.addContext(self)
+    else:
+      self._rtcout.RTC_ERROR("Opening the barrier failed: %s", path_)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 終了関数
+  # @else
+  # @brief Finalization
+  # @endif
+  def exit(self):
+    self._rtcout.RTC_TRACE("exit()")
+    if self._driver:
+      self._driver.removeContext(self)
+      self._driver = None
+    OpenRTM_aist.ExecutionContextBase.exit(self)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 1周期分の処理を実行する
+  #
+  # 周期の管理は親プロセスが行うため、待機は行わない。
+  #
+  # @else
+  # @brief Execute one cycle
+  #
+  # This does not sleep since the period is managed by the parent
+  # process.
+  #
+  # @endif
+  def tick(self):
+    if not self.isRunning():
+      return
+    guard = OpenRTM_aist.ScopedLock(self._tickmutex)
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerPreDo(self)
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerDo(self)
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerPostDo(self)
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTC.ExecutionContextService のオペレーション
+  # @else
+  # @brief Operations of RTC.ExecutionContextService
+  # @endif
+  def is_running(self):
+    return OpenRTM_aist.ExecutionContextBase.isRunning(self)
+
+
+  def start(self):
+    return OpenRTM_aist.ExecutionContextBase.start(self)
+
+
+  def stop(self):
+    return OpenRTM_aist.ExecutionContextBase.stop(self)
+
+
+  def get_rate(self):
+    return OpenRTM_aist.ExecutionContextBase.getRate(self)
+
+
+  def set_rate(self, rate):
+    return OpenRTM_aist.ExecutionContextBase.setRate(self, rate)
+
+
+  def add_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.addComponent(self, comp)
+
+
+  def remove_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.removeComponent(self, comp)
+
+
+  def activate_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.activateComponent(self, comp)
+
+
+  def deactivate_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.deactivateComponent(self, comp)
+
+
+  def reset_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.resetComponent(self, comp)
+
+
+  def get_component_state(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.getComponentState(self, comp)
+
+
+  def get_kind(self):
+    return OpenRTM_aist.ExecutionContextBase.getKind(self)
+
+
+  def get_profile(self):
+    return OpenRTM_aist.ExecutionContextBase.getProfile(self)
+
+
+  def onAddedComponent(self, rtobj):
+    guard = OpenRTM_aist.ScopedLock(self._tickmutex)
+    self._worker.updateComponentList()
+    return RTC.RTC_OK
+
+
+  def onRemovedComponent(self, rtobj):
+    guard = OpenRTM_aist.ScopedLock(self._tickmutex)
+    self._worker.updateComponentList()
+    return RTC.RTC_OK
+
+
+
+##
+# @if jp
+# @class LayerDriver
+# @brief バリアを待機して実行コンテキストを駆動するスレッド
+#
+# 親プロセスが終了を通知した場合、または親プロセスが存在しなくなった
+# 場合は、このプロセスのマネージャを終了する。
+#
+# @else
+# @class LayerDriver
+# @brief Thread waiting for the barrier and driving execution contexts
+#
+# When the parent process notifies termination or no longer exists,
+# the manager of this process is terminated.
+#
+# @endif
+class LayerDriver(OpenRTM_aist.Task):
+  """
+  """
+
+  def __init__(self, barrier, index, timeout):
+    OpenRTM_aist.Task.__init__(self)
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("rtobject.multilayercomposite_child_ec")
+    self._barrier = barrier
+    self._index = index
+    self._timeout = timeout
+    self._ecs = []
+    self._mutex = threading.RLock()
+    self._running = True
+    return
+
+
+  def addContext(self, ec):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    self._ecs.append(ec)
+    return
+
+
+  def removeContext(self, ec):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    if ec in self._ecs:
+      self._ecs.remove(ec)
+    return
+
+
+  def svc(self):
+    self._rtcout.RTC_DEBUG("Layer %d attached to %s",
+                           (self._index, self._barrier.getPath()))
+    seq_ = self._barrier.attach(self._index)
+    while self._running:
+      next_ = self._barrier.wait(seq_, self._timeout)
+      if next_ is None:
+        if self._barrier.isTerminated() or not self.isOwnerAlive():
+          break
+        continue
+      seq_ = next_
+
+      guard = OpenRTM_aist.ScopedLock(self._mutex)
+      ecs_ = self._ecs[:]
+      del guard
+      for ec in ecs_:
+        ec.tick()
+      self._barrier.done(self._index, seq_)
+
+    self._barrier.detach(self._index)
+    self._rtcout.RTC_INFO("Parent execution context terminated.")
+    threading.Thread(target=OpenRTM_aist.Manager.instance().terminate).start()
+    return 0
+
+
+  def isOwnerAlive(self):
+    if os.name == "nt":
+      return True
+    try:
+      os.kill(self._barrier.getOwnerPid(), 0)
+    except OSError:
+      return False
+    return True
+
+
+
+##
+# @if jp
+# @brief バリアを駆動するスレッドを取得する
+#
+# 同じバリアに対するスレッドはプロセス内で1つだけ生成される。
+#
+# @param path バリアの共有メモリのファイルパス
+# @param index 参加者番号
+# @param timeout 周期開始の待機タイムアウト [s]
+# @return LayerDriver。バリアを開けなかった場合は None
+#
+# @else
+# @brief Get the thread driving the barrier
+#
+# Only one thread is created for a barrier in a process.
+#
+# @param path File path of the shared memory of the barrier
+# @param index Index of the party
+# @param timeout Timeout of waiting for the cycle start [s]
+# @return LayerDriver. None if the barrier cannot be opened
+#
+# @endif
+def getLayerDriver(path, index, timeout):
+  global layerdrivers
+  guard = OpenRTM_aist.ScopedLock(layerdrivers_mutex)
+  driver_ = layerdrivers.get(path)
+  if driver_ is None:
+    barrier_ = OpenRTM_aist.SharedMemoryBarrier()
+    if not barrier_.open(path):
+      return None
+    driver_ = LayerDriver(barrier_, index, timeout)
+    driver_.activate()
+    layerdrivers[path] = driver_
+  return driver_
+
+
+
+##
+# @if jp
+# @brief ExecutionContext を初期化する
+#
+# ExecutionContext 起動用ファクトリを登録する。
+#
+# @param manager マネージャオブジェクト
+#
+# @else
+#
+# @endif
+def MultilayerCompositeChildECInit(manager):
+  OpenRTM_aist.ExecutionContextFactory.instance().addFactory("MultilayerCompositeChildEC",
+                                                             OpenRTM_aist.MultilayerCompositeChildEC,
+                                                             OpenRTM_aist.ECDelete)
+  return
@@ -15,6 +15,7 @@
 #     All rights reserved.
 
 
+import os
 import threading
 import time
 
@@ -35,11 +36,53 @@ DEFAULT_PERIOD = 0.000001
 #
 # Periodic Sampled Data Processing(¹)ExecutionContext饹
 #
+# ʲΥץѥƥѤ롣
+#
+# - isolation: 쥤䡼μ¹ˡ (thread ޤ processǥե: thread)
+# - sync_timeout: isolation  process ξγƼδλԤΥ
+#                 ॢ [s] (ǥե: 1.0)
+#
+# isolation  thread ξ硢conf.default.members  "|" Ƕڤ
+# ƥ쥤䡼RTC򡢤줾 PeriodicTask ΥåɤǼ¹Ԥ롣
+#
+# isolation  process ξ硢ƥ쥤䡼̤Υޥ͡ץ
+# (manager.modules.Python.manager_cmdǥե: rtcd_python) Ǽ
+# Ԥ롣ξ硢conf.default.members γǤ RTC ΰ
+# (: "ConsoleIn?instance_name=ConsoleIn0") Ȥưҥץ
+# ǳ⥸塼ΥɤRTCԤҥץRTC
+# ˤ MultilayerCompositeChildEC Ƥ졢SharedMemoryBarrier
+# ˤܼ¹ԥƥȤμƱƼ¹Ԥ롣ۤʤ쥤䡼
+# RTC֤Υǡ̿ˤ shared_memory 󥿡եѤ롣
+#
 # @since 0.4.0
 #
 # @else
 # @class MultilayerCompositeEC
 # @brief MultilayerCompositeEC class
+#
+# The following properties are used.
+#
+# - isolation: How the layers are executed (thread or process,
+#              default: thread)
+# - sync_timeout: Timeout of waiting for the completion of each cycle
+#                 when isolation is process [s] (default: 1.0)
+#
+# When isolation is thread, the RTCs of each layer separated by "|"
+# in conf.default.members are executed in a PeriodicTask thread.
+#
+# When isolation is process, each layer is executed in a separate
+# manager process (manager.modules.Python.manager_cmd, default:
+# rtcd_python), so that CPU-bound components in different layers are
+# not serialized by the interpreter lock. In this case, each element
+# of conf.default.members is treated as the argument of component
+# creation (e.g. "ConsoleIn?instance_name=ConsoleIn0"), and the
+# module is loaded, the component is created and activated in the
+# child process. The RTCs in the child processes are bound to
+# MultilayerCompositeChildEC, which is executed in synchronization
+# with the cycle of this context through SharedMemoryBarrier. The
+# shared_memory interface should be used for data ports connecting
+# RTCs in different layers.
+#
 # @endif
 class MultilayerCompositeEC(OpenRTM_aist.PeriodicExecutionContext):
   """
@@ -63,6 +106,9 @@ class MultilayerCompositeEC(OpenRTM_aist.PeriodicExecutionContext):
     
     self._tasklist = []
     self._ownersm = None
+    self._isolation = "thread"
+    self._syncTimeout = 1.0
+    self._barrier = None
 
     return
 
@@ -82,6 +128,10 @@ class MultilayerCompositeEC(OpenRTM_aist.PeriodicExecutionContext):
     OpenRTM_aist.PeriodicExecutionContext.exit(self)
     for task in self._tasklist:
       task.finalize()
+    if self._barrier:
+      self._barrier.terminate()
+      self._barrier.close()
+      self._barrier = None
     return
 
   ##
@@ -99,6 +149,16 @@ class MultilayerCompositeEC(OpenRTM_aist.PeriodicExecutionContext):
   def init(self, props):
     OpenRTM_aist.PeriodicExecutionContext.init(self, props)
     #prop.getProperty("thread_type", "default")
+
+    isolation_ = props.getProperty("isolation", "thread").strip().lower()
+    if isolation_ in ("thread", "process"):
+      self._isolation = isolation_
+    else:
+      self._rtcout.RTC_ERROR("invalid isolation value: %s", isolation_)
+
+    timeout_ = [1.0]
+    if OpenRTM_aist.stringTo(timeout_, props.getProperty("sync_timeout", "1.0")):
+      self._syncTimeout = timeout_[0]
     
 
 
@@ -124,6 +184,10 @@ class MultilayerCompositeEC(OpenRTM_aist.PeriodicExecutionContext):
     threads_str = rtc.getProperties().getProperty("conf.default.members")
     str = [threads_str]
     threads = str[0].split("|")
+    if self._isolation == "process":
+      self.launchLayers(rtc, threads)
+      return ret
+
     for thread in threads:
       rtcs = []
       members = thread.split(",")
@@ -456,6 +520,90 @@ class MultilayerCompositeEC(OpenRTM_aist.PeriodicExecutionContext):
 
 
 
+  ##
+  # @if jp
+  # @brief ƥ쥤䡼¹Ԥҥץư
+  #
+  # ҥץƱХꥢ쥤䡼˥ޥ͡ư
+  # 롣ҥץϥХꥢ˻äƱƼ¹Ԥ롣
+  #
+  # @param self
+  # @param rtc ʡRTC
+  # @param layers ƥ쥤䡼RTCΥꥹ
+  #
+  # @else
+  #
+  # @brief Launch the child processes executing the layers
+  #
+  # The barrier synchronizing the child processes is created and a
+  # manager is launched for each layer. A child process is executed
+  # in synchronization from the cycle in which it attaches to the
+  # barrier.
+  #
+  # @param self
+  # @param rtc Owner RTC
+  # @param layers List of component creation arguments of each layer
+  #
+  # @endif
+  def launchLayers(self, rtc, layers):
+    path_ = OpenRTM_aist.SharedMemoryBarrier.defaultPath(
+      "openrtm_mlec_%d_%s" % (os.getpid(), rtc.getInstanceName()))
+    self._barrier = OpenRTM_aist.SharedMemoryBarrier()
+    if not self._barrier.create(path_, len(layers)):
+      self._rtcout.RTC_ERROR("Barrier creation failed: %s", path_)
+      self._barrier = None
+      return
+
+    mgr = OpenRTM_aist.Manager.instance()
+    config_ = mgr.getConfig()
+    rtcd_cmd_ = config_.getProperty("manager.modules.Python.manager_cmd")
+    if not rtcd_cmd_:
+      rtcd_cmd_ = "rtcd_python"
+    load_path_ = config_.getProperty("manager.modules.load_path")
+    load_path_ += "," + config_.getProperty("manager.modules.Python.load_paths")
+    if os.name == "nt":
+      rtcd_cmd_ = "cmd /c " + rtcd_cmd_
+      load_path_ = load_path_.replace("\\","\\\\")
+
+    for i in range(len(layers)):
+      members_ = [m.strip() for m in layers[i].split(",") if m.strip()]
+      modules_ = []
+      names_ = []
+      for member in members_:
+        comp_id_ = OpenRTM_aist.Properties()
+        comp_prop_ = OpenRTM_aist.Properties()
+        if not mgr.procComponentArgs(member, comp_id_, comp_prop_):
+          self._rtcout.RTC_ERROR("invalid member: %s", member)
+          continue
+        module_ = comp_id_.getProperty("implementation_id") + ".py"
+        if module_ not in modules_:
+          modules_.append(module_)
+        if comp_prop_.getProperty("instance_name"):
+          names_.append(comp_prop_.getProperty("instance_name"))
+
+      cmd = rtcd_cmd_
+      cmd += " -o " + "manager.is_master:NO"
+      cmd += " -o " + "manager.corba_servant:YES"
+      cmd += " -o " + "corba.master_manager:" + config_.getProperty("corba.master_manager")
+      cmd += " -o " + "manager.name:" + config_.getProperty("manager.name")
+      cmd += " -o " + "manager.instance_name:" + rtc.getInstanceName() + "_layer" + str(i)
+      cmd += " -o " + "\"manager.modules.load_path:" + load_path_ + "\""
+      cmd += " -o " + "manager.supported_languages:Python"
+      cmd += " -o " + "manager.shutdown_auto:NO"
+      cmd += " -o " + "\"manager.modules.preload:" + ",".join(modules_) + "\""
+      cmd += " -o " + "\"manager.components.precreate:" + ",".join(members_) + "\""
+      cmd += " -o " + "\"manager.components.preactivation:" + ",".join(names_) + "\""
+      cmd += " -o " + "exec_cxt.periodic.type:MultilayerCompositeChildEC"
+      cmd += " -o " + "\"exec_cxt.periodic.sync_file:" + path_ + "\""
+      cmd += " -o " + "exec_cxt.periodic.sync_index:" + str(i)
+      cmd += " -o " + "exec_cxt.periodic.sync_timeout:" + str(self._syncTimeout)
+
+      self._rtcout.RTC_DEBUG("Invoking command: %s.", cmd)
+      if OpenRTM_aist.launch_shell(cmd) == -1:
+        self._rtcout.RTC_ERROR("Launching layer %d failed: %s", (i, cmd))
+    return
+
+
   ##
   # @if jp
   # @brief ݡͥõؿ
@@ -557,6 +705,11 @@ class MultilayerCompositeEC(OpenRTM_aist.PeriodicExecutionContext):
       self._ownersm.workerPostDo()
       
       
+      if self._barrier:
+        seq_ = self._barrier.signal()
+        if not self._barrier.join(seq_, self._syncTimeout):
+          self._rtcout.RTC_WARN("Layer processes did not complete cycle %d.", seq_)
+
       for task in self._tasklist:
         task.signal()
 
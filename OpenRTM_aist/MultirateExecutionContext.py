@@ -0,0 +1,627 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file MultirateExecutionContext.py
+# @brief Logical periodic execution contexts sharing one scheduler thread
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import heapq
+import threading
+
+import OpenRTM_aist
+import RTC, RTC__POA
+
+
+schedulers = {}
+schedulers_mutex = threading.RLock()
+
+
+##
+# @if jp
+# @class MultirateExecutionContext
+# @brief スケジューラスレッドを共有する論理的な周期実行コンテキスト
+#
+# 自身ではスレッドを持たず、同じ名前の MultirateScheduler に登録さ
+# れた他の MultirateExecutionContext と1つのスレッドを共有して周期実
+# 行を行う。各コンテキストは通常の RTC.ExecutionContext として振る舞
+# い、get_rate()/set_rate()/activate_component() 等はそのまま使用で
+# きる。
+#
+# 以下のプロパティを使用する。
+#
+# - scheduler: 共有するスケジューラの名前 (デフォルト: default)
+#
+# 1周期分の処理を行う tick() はスケジューラのみが呼び出す。CORBA イン
+# ターフェースは RTC.ExecutionContextService であり、外部から tick()
+# を呼び出すことはできない。
+#
+# @since 2.0.0
+#
+# @else
+# @class MultirateExecutionContext
+# @brief Logical periodic execution context sharing a scheduler thread
+#
+# This context has no thread of its own. It is executed periodically
+# by the one thread shared with the other MultirateExecutionContexts
+# registered to the MultirateScheduler of the same name. Each context
+# behaves as a normal RTC.ExecutionContext, and get_rate(),
+# set_rate(), activate_component() etc. work as usual.
+#
+# The following property is used.
+#
+# - scheduler: Name of the shared scheduler (default: default)
+#
+# tick(), which executes one cycle, is called only by the scheduler.
+# The CORBA interface is RTC.ExecutionContextService, so tick() cannot
+# be called from outside.
+#
+# @since 2.0.0
+#
+# @endif
+class MultirateExecutionContext(OpenRTM_aist.ExecutionContextBase,
+                                RTC__POA.ExecutionContextService):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @else
+  # @brief Constructor
+  # @endif
+  def __init__(self):
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("rtobject.multirate_ec")
+    self._rtcout.RTC_TRACE("MultirateExecutionContext.__init__()")
+    self._scheduler = None
+    self._periodNs = 0
+    self._tickmutex = threading.RLock()
+    OpenRTM_aist.ExecutionContextBase.__init__(self, "multirate_ec")
+
+    self.setObjRef(self._this())
+    self.setKind(RTC.PERIODIC)
+    self.setRate(OpenRTM_aist.DEFAULT_EXECUTION_RATE)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 初期化関数
+  #
+  # scheduler で指定されたスケジューラに登録する。
+  #
+  # @param self
+  # @param props プロパティ
+  #
+  # @else
+  # @brief Initialization
+  #
+  # This context is registered to the scheduler given by scheduler.
+  #
+  # @param self
+  # @param props Properties
+  #
+  # @endif
+  def init(self, props):
+    OpenRTM_aist.ExecutionContextBase.init(self, props)
+    name_ = props.getProperty("scheduler", "default")
+    self._scheduler = attachMultirateScheduler(name_, self)
+    self._rtcout.RTC_DEBUG("Attached to scheduler: %s", name_)
+    self.updatePeriodNs()
+    return
+
+
+  ##
+  # @if jp
+  # @brief 終了関数
+  # @else
+  # @brief Finalization
+  # @endif
+  def exit(self):
+    self._rtcout.RTC_TRACE("exit()")
+    if self._scheduler:
+      releaseMultirateScheduler(self._scheduler, self)
+      self._scheduler = None
+    OpenRTM_aist.ExecutionContextBase.exit(self)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 1周期分の処理を実行する
+  #
+  # 周期の管理はスケジューラが行うため、待機は行わない。
+  #
+  # @else
+  # @brief Execute one cycle
+  #
+  # This does not sleep since the period is managed by the scheduler.
+  #
+  # @endif
+  def tick(self):
+    if not self.isRunning():
+      return
+    guard = OpenRTM_aist.ScopedLock(self._tickmutex)
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerPreDo(self)
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerDo(self)
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerPostDo(self)
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  # @brief 周期を取得する [ns]
+  # @else
+  # @brief Get the period [ns]
+  # @endif
+  def getPeriodNs(self):
+    return self._periodNs
+
+
+  ##
+  # @if jp
+  # @brief getPeriod() の周期から周期 [ns] を更新する
+  # @else
+  # @brief Update the period [ns] from the period of getPeriod()
+  # @endif
+  def updatePeriodNs(self):
+    period_ = self.getPeriod()
+    self._periodNs = period_.sec() * OpenRTM_aist.nsec_per_sec + \
+                     period_.usec() * 1000
+    return
+
+
+  ##
+  # @if jp
+  # @brief RTC.ExecutionContextService のオペレーション
+  # @else
+  # @brief Operations of RTC.ExecutionContextService
+  # @endif
+  def is_running(self):
+    return OpenRTM_aist.ExecutionContextBase.isRunning(self)
+
+
+  def start(self):
+    return OpenRTM_aist.ExecutionContextBase.start(self)
+
+
+  def stop(self):
+    return OpenRTM_aist.ExecutionContextBase.stop(self)
+
+
+  def get_rate(self):
+    return OpenRTM_aist.ExecutionContextBase.getRate(self)
+
+
+  def set_rate(self, rate):
+    return OpenRTM_aist.ExecutionContextBase.setRate(self, rate)
+
+
+  def add_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.addComponent(self, comp)
+
+
+  def remove_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.removeComponent(self, comp)
+
+
+  def activate_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.activateComponent(self, comp)
+
+
+  def deactivate_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.deactivateComponent(self, comp)
+
+
+  def reset_component(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.resetComponent(self, comp)
+
+
+  def get_component_state(self, comp):
+    return OpenRTM_aist.ExecutionContextBase.getComponentState(self, comp)
+
+
+  def get_kind(self):
+    return OpenRTM_aist.ExecutionContextBase.getKind(self)
+
+
+  def get_profile(self):
+    return OpenRTM_aist.ExecutionContextBase.getProfile(self)
+
+
+  def onStarted(self):
+    if self._scheduler:
+      self._scheduler.schedule(self)
+    return RTC.RTC_OK
+
+
+  def onStopping(self):
+    if self._scheduler:
+      self._scheduler.unschedule(self)
+    return RTC.RTC_OK
+
+
+  def onSetRate(self, rate):
+    self.updatePeriodNs()
+    if self._scheduler and self.isRunning():
+      self._scheduler.schedule(self)
+    return RTC.RTC_OK
+
+
+  def onAddedComponent(self, rtobj):
+    guard = OpenRTM_aist.ScopedLock(self._tickmutex)
+    self._worker.updateComponentList()
+    return RTC.RTC_OK
+
+
+  def onRemovedComponent(self, rtobj):
+    guard = OpenRTM_aist.ScopedLock(self._tickmutex)
+    self._worker.updateComponentList()
+    return RTC.RTC_OK
+
+
+  # The state transitions are executed by the scheduler thread.
+  def onWaitingActivated(self, comp, count):
+    return RTC.RTC_OK
+
+
+  def onWaitingDeactivated(self, comp, count):
+    return RTC.RTC_OK
+
+
+  def onWaitingReset(self, comp, count):
+    return RTC.RTC_OK
+
+
+
+##
+# @if jp
+# @class MultirateScheduler
+# @brief 複数の周期実行コンテキストを1スレッドで実行するスケジューラ
+#
+# 登録された MultirateExecutionContext を earliest deadline first
+# (EDF) で実行する。各コンテキストは周期の格子上の時刻に起床可能と
+# なり、起床可能なコンテキストのうち次の起床時刻 (デッドライン) が最
+# も早いものから実行する。周期は実行毎にコンテキストから取得するため、
+# set_rate() による周期の変更は直ちに反映される。
+#
+# デッドラインを超過したコンテキストは、超過した周期を実行せずに次の
+# 格子上の時刻から再開する。
+#
+# @since 2.0.0
+#
+# @else
+# @class MultirateScheduler
+# @brief Scheduler executing periodic execution contexts on one thread
+#
+# The registered MultirateExecutionContexts are executed by earliest
+# deadline first (EDF). Each context is released at the times on its
+# period grid, and among the released contexts the one whose next
+# release time (deadline) is the earliest is executed first. Since
+# the period is taken from the context at each execution, a change of
+# the period by set_rate() takes effect immediately.
+#
+# A context that overran its deadline skips the missed cycles and is
+# resumed from the next time on its grid.
+#
+# @since 2.0.0
+#
+# @endif
+class MultirateScheduler(OpenRTM_aist.Task):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @param self
+  # @param name スケジューラ名
+  # @else
+  # @brief Constructor
+  # @param self
+  # @param name Name of the scheduler
+  # @endif
+  def __init__(self, name):
+    OpenRTM_aist.Task.__init__(self)
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("rtobject.multirate_ec")
+    self._name = name
+    self._cond = threading.Condition(threading.RLock())
+    self._contexts = []
+    self._entries = {}
+    self._queue = []
+    self._seq = 0
+    self._running = False
+    self._overrunCount = 0
+    return
+
+
+  def getName(self):
+    return self._name
+
+
+  ##
+  # @if jp
+  # @brief 登録されている実行コンテキストの一覧を取得する
+  # @else
+  # @brief Get the list of registered execution contexts
+  # @endif
+  def getContexts(self):
+    self._cond.acquire()
+    ret_ = self._contexts[:]
+    self._cond.release()
+    return ret_
+
+
+  ##
+  # @if jp
+  # @brief デッドライン超過回数を取得する
+  # @else
+  # @brief Get the number of overrun deadlines
+  # @endif
+  def getOverrunCount(self):
+    return self._overrunCount
+
+
+  ##
+  # @if jp
+  # @brief 実行コンテキストを登録する
+  # @else
+  # @brief Register an execution context
+  # @endif
+  def attach(self, ec):
+    self._cond.acquire()
+    if ec not in self._contexts:
+      self._contexts.append(ec)
+    if not self._running:
+      self._running = True
+      self.activate()
+    self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief 実行コンテキストの登録を解除する
+  # @return 登録されている実行コンテキストが無くなった場合 True
+  # @else
+  # @brief Unregister an execution context
+  # @return True if no execution context is registered
+  # @endif
+  def detach(self, ec):
+    self.unschedule(ec)
+    self._cond.acquire()
+    if ec in self._contexts:
+      self._contexts.remove(ec)
+    ret_ = len(self._contexts) == 0
+    self._cond.release()
+    return ret_
+
+
+  ##
+  # @if jp
+  # @brief 実行コンテキストの周期実行を開始する
+  #
+  # 既に実行中の場合は、現在時刻から新しい周期で再スケジュールする。
+  # 周期が正でない実行コンテキストはスケジュールしない。
+  #
+  # @else
+  # @brief Start periodic execution of an execution context
+  #
+  # If it is already scheduled, it is rescheduled from now with the
+  # new period. An execution context whose period is not positive is
+  # not scheduled.
+  #
+  # @endif
+  def schedule(self, ec):
+    self._cond.acquire()
+    self.unschedule(ec)
+    if ec.getPeriodNs() <= 0:
+      self._rtcout.RTC_ERROR("Invalid period: %d ns", ec.getPeriodNs())
+      self._cond.release()
+      return
+    entry_ = [OpenRTM_aist.monotonic_ns(), ec, True]
+    self._entries[ec] = entry_
+    self.push(entry_)
+    self._cond.notify()
+    self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief 実行コンテキストの周期実行を停止する
+  # @else
+  # @brief Stop periodic execution of an execution context
+  # @endif
+  def unschedule(self, ec):
+    self._cond.acquire()
+    entry_ = self._entries.pop(ec, None)
+    if entry_:
+      entry_[2] = False
+    self._cond.release()
+    return
+
+
+  def push(self, entry):
+    self._seq += 1
+    heapq.heappush(self._queue, (entry[0], self._seq, entry))
+    return
+
+
+  ##
+  # @if jp
+  # @brief スケジューラを終了する
+  # @else
+  # @brief Terminate the scheduler
+  # @endif
+  def terminate(self):
+    self._cond.acquire()
+    self._running = False
+    self._cond.notify()
+    self._cond.release()
+    self.wait()
+    return
+
+
+  def svc(self):
+    clock_ = OpenRTM_aist.monotonic_ns
+    nsec_ = float(OpenRTM_aist.nsec_per_sec)
+    ready_ = []
+    self._cond.acquire()
+    while self._running:
+      now_ = clock_()
+      while self._queue and self._queue[0][0] <= now_:
+        release_, seq_, entry_ = heapq.heappop(self._queue)
+        if entry_[2]:
+          heapq.heappush(ready_, (release_ + entry_[1].getPeriodNs(), seq_, entry_))
+
+      if not ready_:
+        if self._queue:
+          self._cond.wait((self._queue[0][0] - now_) / nsec_)
+        else:
+          self._cond.wait()
+        continue
+
+      deadline_, seq_, entry_ = heapq.heappop(ready_)
+      if not entry_[2]:
+        continue
+      self._cond.release()
+      try:
+        entry_[1].tick()
+      except:
+        self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+      self._cond.acquire()
+
+      if not entry_[2]:
+        continue
+      period_ = entry_[1].getPeriodNs()
+      if period_ <= 0:
+        self._rtcout.RTC_ERROR("Invalid period: %d ns", period_)
+        self.unschedule(entry_[1])
+        continue
+      entry_[0] = deadline_
+      now_ = clock_()
+      if entry_[0] < now_:
+        self._overrunCount += 1
+        entry_[0] += ((now_ - entry_[0]) // period_ + 1) * period_
+      self.push(entry_)
+    self._cond.release()
+    return 0
+
+
+
+##
+# @if jp
+# @brief 名前を指定してスケジューラを取得する
+#
+# 指定した名前のスケジューラが存在しない場合は生成する。
+#
+# @param name スケジューラ名
+# @return MultirateScheduler
+#
+# @else
+# @brief Get the scheduler of the given name
+#
+# The scheduler is created if it does not exist.
+#
+# @param name Name of the scheduler
+# @return MultirateScheduler
+#
+# @endif
+def getMultirateScheduler(name):
+  global schedulers
+  guard = OpenRTM_aist.ScopedLock(schedulers_mutex)
+  scheduler_ = schedulers.get(name)
+  if scheduler_ is None:
+    scheduler_ = MultirateScheduler(name)
+    schedulers[name] = scheduler_
+  return scheduler_
+
+
+##
+# @if jp
+# @brief 名前を指定してスケジューラに実行コンテキストを登録する
+#
+# 指定した名前のスケジューラが存在しない場合は生成する。スケジューラ
+# の取得と登録は schedulers_mutex のロック内で行うため、同時に呼ばれ
+# た releaseMultirateScheduler() によって取得したスケジューラが終了
+# されることはない。
+#
+# @param name スケジューラ名
+# @param ec 実行コンテキスト
+# @return MultirateScheduler
+#
+# @else
+# @brief Register an execution context to the scheduler of the given name
+#
+# The scheduler is created if it does not exist. Since the scheduler
+# is obtained and attached while schedulers_mutex is locked, a
+# concurrent releaseMultirateScheduler() cannot terminate it in
+# between.
+#
+# @param name Name of the scheduler
+# @param ec Execution context
+# @return MultirateScheduler
+#
+# @endif
+def attachMultirateScheduler(name, ec):
+  guard = OpenRTM_aist.ScopedLock(schedulers_mutex)
+  scheduler_ = getMultirateScheduler(name)
+  scheduler_.attach(ec)
+  return scheduler_
+
+
+##
+# @if jp
+# @brief スケジューラから実行コンテキストの登録を解除する
+#
+# 登録されている実行コンテキストが無くなった場合はスケジューラのス
+# レッドを終了する。
+#
+# @param scheduler MultirateScheduler
+# @param ec 実行コンテキスト
+#
+# @else
+# @brief Unregister an execution context from the scheduler
+#
+# The thread of the scheduler is terminated when no execution context
+# is registered.
+#
+# @param scheduler MultirateScheduler
+# @param ec Execution context
+#
+# @endif
+def releaseMultirateScheduler(scheduler, ec):
+  global schedulers
+  guard = OpenRTM_aist.ScopedLock(schedulers_mutex)
+  if scheduler.detach(ec):
+    schedulers.pop(scheduler.getName(), None)
+    scheduler.terminate()
+  return
+
+
+
+##
+# @if jp
+# @brief ExecutionContext を初期化する
+#
+# ExecutionContext 起動用ファクトリを登録する。
+#
+# @param manager マネージャオブジェクト
+#
+# @else
+#
+# @endif
+def MultirateExecutionContextInit(manager):
+  OpenRTM_aist.ExecutionContextFactory.instance().addFactory("MultirateExecutionContext",
+                                                             OpenRTM_aist.MultirateExecutionContext,
+                                                             OpenRTM_aist.ECDelete)
+  return
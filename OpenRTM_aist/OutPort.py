@@ -48,9 +48,7 @@ import threading
 # void setTimestamp(DataType& data)
 def setTimestamp(data):
   # set timestamp
-  tm = OpenRTM_aist.Time()
-  data.tm.sec  = tm.sec
-  data.tm.nsec = tm.usec * 1000
+  data.tm.sec, data.tm.nsec = divmod(OpenRTM_aist.time_ns(), OpenRTM_aist.nsec_per_sec)
 
 
 ##
@@ -14,7 +14,6 @@
 #         Advanced Industrial Science and Technology (AIST), Japan
 #     All rights reserved.
 
-import copy
 import threading
 import OpenRTM_aist
 import OpenRTM_aist.StringUtil
@@ -465,7 +464,7 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
 
 
     node = prop.getNode("dataport.outport")
-    portprop = copy.deepcopy(self._properties)
+    portprop = self._properties.clone()
     portprop.mergeProperties(node)
     node.mergeProperties(portprop)
     OpenRTM_aist.NVUtil.copyFromProperties(connector_profile.properties, prop)
@@ -963,7 +962,7 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
       return retval
 
     # prop: [port.outport].
-    prop = copy.deepcopy(self._properties)
+    prop = self._properties.clone()
 
     conn_prop = OpenRTM_aist.Properties()
 
@@ -1047,7 +1046,7 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
     self._rtcout.RTC_TRACE("subscribeInterfaces()")
 
     # prop: [port.outport].
-    prop = copy.deepcopy(self._properties)
+    prop = self._properties.clone()
 
     conn_prop = OpenRTM_aist.Properties()
     OpenRTM_aist.NVUtil.copyToProperties(conn_prop, cprof.properties)
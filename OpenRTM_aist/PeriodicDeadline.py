@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file PeriodicDeadline.py
+# @brief Absolute deadline scheduler for periodic loops
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import time
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @brief 周期ループのスケジューリングモード
+#
+# - relative: 実行時間を周期から差し引いた時間だけ待機する (従来動作)
+# - absolute: 単調増加クロック上の絶対デッドラインまで待機する
+#
+# @else
+# @brief Scheduling modes of periodic loops
+#
+# - relative: sleep for the period minus the execution time (legacy)
+# - absolute: sleep until the absolute deadline on the monotonic clock
+#
+# @endif
+SCHEDULE_RELATIVE = "relative"
+SCHEDULE_ABSOLUTE = "absolute"
+
+##
+# @if jp
+# @brief デッドライン超過時のポリシー
+#
+# - skip: 超過した周期は実行せず、次の周期のデッドラインに合わせる
+# - catchup: 待機せずに連続実行し、遅れた周期分を取り戻す
+#
+# @else
+# @brief Policies applied when a deadline is overrun
+#
+# - skip: missed cycles are dropped and the next deadline on the
+#         period grid is used
+# - catchup: cycles are executed back to back without sleeping until
+#            the schedule is caught up
+#
+# @endif
+OVERRUN_SKIP = "skip"
+OVERRUN_CATCHUP = "catchup"
+
+
+##
+# @if jp
+# @class PeriodicDeadline
+# @brief 絶対デッドラインによる周期待機クラス
+#
+# 単調増加クロック (time.monotonic_ns()) 上で次周期のデッドラインを
+# 保持し、デッドラインまで待機する。デッドラインは前回のデッドライン
+# に周期を加算して求めるため、スレッドの起床遅延やシステム時刻の変更
+# による周期のずれが累積しない。
+#
+# 使用手順は以下の通り。
+#
+# deadline = PeriodicDeadline(OVERRUN_SKIP)
+# while running:
+#   do_something()
+#   deadline.sleep(period_ns)
+#
+# @since 2.0.0
+#
+# @else
+# @class PeriodicDeadline
+# @brief Periodic sleeper based on absolute deadlines
+#
+# This class keeps the deadline of the next cycle on the monotonic
+# clock (time.monotonic_ns()) and sleeps until it. Since the next
+# deadline is obtained by adding the period to the previous deadline,
+# the wakeup latency of the thread and changes of the system time do
+# not accumulate as drift.
+#
+# @since 2.0.0
+#
+# @endif
+class PeriodicDeadline:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  #
+  # @param self
+  # @param policy デッドライン超過時のポリシー (skip または catchup)
+  #
+  # @else
+  # @brief Constructor
+  #
+  # @param self
+  # @param policy Overrun policy (skip or catchup)
+  #
+  # @endif
+  def __init__(self, policy=OVERRUN_SKIP):
+    self._policy = OVERRUN_SKIP
+    self.setOverrunPolicy(policy)
+    self._deadline = None
+    self._overrunCount = 0
+    self._missedCount = 0
+    self._lastOverrun = 0
+    return
+
+
+  ##
+  # @if jp
+  # @brief デッドライン超過時のポリシーを設定する
+  #
+  # @param self
+  # @param policy ポリシー (skip または catchup)
+  # @return 設定できた場合 True、不正な値の場合 False
+  #
+  # @else
+  # @brief Set the overrun policy
+  #
+  # @param self
+  # @param policy Policy (skip or catchup)
+  # @return True if the policy is set, False if it is invalid
+  #
+  # @endif
+  def setOverrunPolicy(self, policy):
+    policy = policy.strip().lower()
+    if policy not in (OVERRUN_SKIP, OVERRUN_CATCHUP):
+      return False
+    self._policy = policy
+    return True
+
+
+  ##
+  # @if jp
+  # @brief デッドライン超過時のポリシーを取得する
+  # @else
+  # @brief Get the overrun policy
+  # @endif
+  def getOverrunPolicy(self):
+    return self._policy
+
+
+  ##
+  # @if jp
+  # @brief デッドラインをリセットする
+  #
+  # 次回の sleep() 呼び出し時刻を起点として新たにデッドラインを計算
+  # する。ループを一時停止した後に再開する場合に呼び出す。
+  #
+  # @param self
+  #
+  # @else
+  # @brief Reset the deadline
+  #
+  # The deadline is restarted from the time of the next sleep()
+  # call. This should be called when a suspended loop is resumed.
+  #
+  # @param self
+  #
+  # @endif
+  def reset(self):
+    self._deadline = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief 次のデッドラインまで待機する
+  #
+  # 前回のデッドラインに周期を加算したデッドラインまで待機する。すで
+  # にデッドラインを過ぎている場合は待機せず、ポリシーに従って次のデッ
+  # ドラインを決定する。
+  #
+  # @param self
+  # @param period_ns 周期 [ns]
+  # @return デッドライン超過時の超過時間 [ns]、超過していない場合 0
+  #
+  # @else
+  # @brief Sleep until the next deadline
+  #
+  # This operation sleeps until the previous deadline plus the
+  # period. If the deadline has already passed, it returns without
+  # sleeping and decides the next deadline according to the policy.
+  #
+  # @param self
+  # @param period_ns Period [ns]
+  # @return Amount of overrun [ns] if the deadline was missed, 0 otherwise
+  #
+  # @endif
+  def sleep(self, period_ns):
+    now_ = OpenRTM_aist.monotonic_ns()
+    if self._deadline is None:
+      self._deadline = now_
+    self._deadline += period_ns
+
+    if self._deadline > now_:
+      time.sleep(float(self._deadline - now_) / OpenRTM_aist.nsec_per_sec)
+      return 0
+
+    overrun_ = now_ - self._deadline
+    self._overrunCount += 1
+    self._lastOverrun = overrun_
+    if self._policy == OVERRUN_SKIP and period_ns > 0:
+      missed_ = overrun_ // period_ns
+      self._missedCount += missed_
+      self._deadline += missed_ * period_ns
+    return overrun_
+
+
+  ##
+  # @if jp
+  # @brief 次の sleep() で待機するデッドラインを取得する
+  # @param self
+  # @param period_ns 周期 [ns]
+  # @return デッドライン (monotonic_ns)。リセット直後は None
+  # @else
+  # @brief Get the deadline the next sleep() waits for
+  # @param self
+  # @param period_ns Period [ns]
+  # @return Deadline (monotonic_ns). None right after a reset
+  # @endif
+  def getNextDeadline(self, period_ns):
+    if self._deadline is None:
+      return None
+    return self._deadline + period_ns
+
+
+  ##
+  # @if jp
+  # @brief デッドライン超過回数を取得する
+  # @else
+  # @brief Get the number of overrun deadlines
+  # @endif
+  def getOverrunCount(self):
+    return self._overrunCount
+
+
+  ##
+  # @if jp
+  # @brief skip ポリシーにより実行されなかった周期の数を取得する
+  # @else
+  # @brief Get the number of cycles dropped by the skip policy
+  # @endif
+  def getMissedCount(self):
+    return self._missedCount
+
+
+  ##
+  # @if jp
+  # @brief 直近のデッドライン超過時間を取得する [ns]
+  # @else
+  # @brief Get the amount of the last overrun [ns]
+  # @endif
+  def getLastOverrun(self):
+    return self._lastOverrun
@@ -75,6 +75,11 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
                            (self._profile.getPeriod().sec(), self._profile.getPeriod().usec()))    
 
     self._cpu = []
+    self._schedPolicy = ""
+    self._schedPriority = 0
+    self._scheduleMode = OpenRTM_aist.SCHEDULE_RELATIVE
+    self._deadline = OpenRTM_aist.PeriodicDeadline()
+    self._gc = None
 
     return
 
@@ -124,6 +129,9 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
   def init(self, props):
     OpenRTM_aist.ExecutionContextBase.init(self, props)
     self.setCpuAffinity(props)
+    self.setSchedPolicy(props)
+    self.setScheduleMode(props)
+    self.setGCMode(props)
     self._rtcout.RTC_DEBUG("init() done")
 
 
@@ -146,10 +154,7 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
     self._rtcout.RTC_TRACE("svc()")
     count_ = 0
 
-    if len(self._cpu) > 0:
-      ret = OpenRTM_aist.setThreadAffinity(self._cpu)
-      if ret == False:
-        self._rtcout.RTC_ERROR("CPU affinity mask setting failed")
+    self.applyThreadSettings()
     
     while self.threadRunning():
       OpenRTM_aist.ExecutionContextBase.invokeWorkerPreDo(self)
@@ -159,14 +164,27 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
       guard = OpenRTM_aist.ScopedLock(self._workerthread._mutex)
       while not self._workerthread._running:
         self._workerthread._cond.wait()
+        self._deadline.reset()
       del guard
 
+      if self._scheduleMode == OpenRTM_aist.SCHEDULE_ABSOLUTE:
+        self.svcAbsolute(count_ > 1000)
+        if count_ > 1000:
+          count_ = 0
+        count_ += 1
+        continue
+
       t0_ = OpenRTM_aist.Time()
+      if self._gc:
+        self._gc.beginWorker()
       OpenRTM_aist.ExecutionContextBase.invokeWorkerDo(self)
       OpenRTM_aist.ExecutionContextBase.invokeWorkerPostDo(self)
-      t1_ = OpenRTM_aist.Time()
 
       period_ = self.getPeriod()
+      if self._gc:
+        self._gc.endWorker(period_.sec() * OpenRTM_aist.nsec_per_sec +
+                           period_.usec() * 1000)
+      t1_ = OpenRTM_aist.Time()
 
       if count_ > 1000:
         exctm_ = (t1_ - t0_).getTime().toDouble()
@@ -194,6 +212,56 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
     return 0
 
 
+  ##
+  # @if jp
+  # @brief Хǥåɥ饤⡼ɤǤ1ʬν
+  #
+  # ݡͥȤν¹Ԥ塢ñĴååμ
+  # ǥåɥ饤ޤԵ롣ǥåɥ饤Ķᤷ
+  # overrun_policy ˽äƼΥǥåɥ饤ꤹ롣
+  #
+  # @param self
+  # @param verbose Ϥ True
+  #
+  # @else
+  # @brief One cycle of the absolute deadline mode
+  #
+  # After invoking the components, this sleeps until the deadline of
+  # the next cycle on the monotonic clock. If the deadline is overrun,
+  # the next deadline is decided according to overrun_policy.
+  #
+  # @param self
+  # @param verbose True to log the period information
+  #
+  # @endif
+  def svcAbsolute(self, verbose):
+    if self._gc:
+      self._gc.beginWorker()
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerDo(self)
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerPostDo(self)
+
+    period_ = self.getPeriod()
+    period_ns_ = period_.sec() * OpenRTM_aist.nsec_per_sec + \
+                 period_.usec() * 1000
+    if self._gc:
+      self._gc.endWorker(period_ns_, self._deadline.getNextDeadline(period_ns_))
+
+    if self._nowait:
+      return
+
+    overrun_ = self._deadline.sleep(period_ns_)
+
+    if overrun_ > 0:
+      self._rtcout.RTC_PARANOID("Deadline overrun: %f [s]",
+                                float(overrun_) / OpenRTM_aist.nsec_per_sec)
+    if verbose:
+      self._rtcout.RTC_PARANOID("Period:    %f [s]", period_.toDouble())
+      self._rtcout.RTC_PARANOID("Overruns:  %d (%d cycles skipped)",
+                                (self._deadline.getOverrunCount(),
+                                 self._deadline.getMissedCount()))
+    return
+
+
   ##
   # @if jp
   # @brief ExecutionContextѥƥӥƥåɤ
@@ -604,6 +672,8 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
     # change EC thread state
     guard = OpenRTM_aist.ScopedLock(self._svcmutex)
     if not self._svc:
+      if self._gc:
+        self._gc.start()
       self._svc = True
       self.open(0)
     del guard
@@ -778,6 +848,204 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
           self._rtcout.RTC_DEBUG("CPU affinity int value: %d added.",int(num))
         except ValueError:
           pass
+
+
+  ##
+  # @if jp
+  # @brief åɤΥ塼󥰥ݥꥷ
+  #
+  # ʲΥץѥƥɤ߹ࡣ
+  #
+  # - sched_policy: SCHED_OTHERSCHED_BATCHSCHED_FIFOSCHED_RR 
+  #                 줫ꤷʤѹʤ
+  # - sched_priority: ͥ (ǥե: 0)SCHED_FIFOSCHED_RR 
+  #                    199
+  #
+  # @param self
+  # @param props ץѥƥ
+  #
+  # @else
+  # @brief Setting the scheduling policy of the thread
+  #
+  # The following properties are read.
+  #
+  # - sched_policy: One of SCHED_OTHER, SCHED_BATCH, SCHED_FIFO and
+  #                 SCHED_RR. Unchanged if not specified.
+  # - sched_priority: Priority (default: 0). 1 to 99 for SCHED_FIFO
+  #                   and SCHED_RR
+  #
+  # @param self
+  # @param props Properties
+  #
+  # @endif
+  def setSchedPolicy(self, props):
+    self._rtcout.RTC_TRACE("setSchedPolicy()")
+
+    policy_ = props.getProperty("sched_policy")
+    if not policy_:
+      return
+
+    priority_ = [0]
+    if not OpenRTM_aist.stringTo(priority_, props.getProperty("sched_priority", "0")):
+      self._rtcout.RTC_ERROR("invalid sched_priority value: %s",
+                             props.getProperty("sched_priority"))
+      return
+
+    self._schedPolicy = policy_
+    self._schedPriority = priority_[0]
+    self._rtcout.RTC_DEBUG("Scheduling policy: %s, priority: %d",
+                           (policy_, priority_[0]))
+    return
+
+
+  ##
+  # @if jp
+  # @brief ƤӽФåɤCPUե˥ƥȥ塼󥰥ݥꥷ
+  #        ŬѤ
+  #
+  # ¹ԥƥȤΥåɤγϻ˸ƤӽФåɤ
+  # getThreadSettings() ǳǧǤ褦Ͽ롣
+  #
+  # @else
+  # @brief Apply the CPU affinity and the scheduling policy to the
+  #        calling thread
+  #
+  # This is called at the start of the thread of the execution
+  # context. The thread is registered so that it can be checked by
+  # getThreadSettings().
+  #
+  # @endif
+  def applyThreadSettings(self):
+    try:
+      name_ = self.getOwner().get_component_profile().instance_name
+    except:
+      name_ = ""
+    OpenRTM_aist.registerThread("%s(%s)" % (self.__class__.__name__, name_))
+
+    if len(self._cpu) > 0:
+      ret = OpenRTM_aist.setThreadAffinity(self._cpu)
+      if ret == False:
+        self._rtcout.RTC_ERROR("CPU affinity mask setting failed")
+
+    if self._schedPolicy:
+      if not OpenRTM_aist.setThreadScheduler(self._schedPolicy,
+                                             self._schedPriority):
+        self._rtcout.RTC_ERROR("Scheduling policy setting failed: %s (%d)",
+                               (self._schedPolicy, self._schedPriority))
+    return
+
+
+  ##
+  # @if jp
+  # @brief 塼󥰥⡼ɤ
+  #
+  # ʲΥץѥƥɤ߹ࡣ
+  #
+  # - schedule_mode: relative (ǥե) ޤ absolute
+  # - overrun_policy: skip (ǥե) ޤ catchup
+  #
+  # @param self
+  # @param props ץѥƥ
+  #
+  # @else
+  # @brief Setting the scheduling mode
+  #
+  # The following properties are read.
+  #
+  # - schedule_mode: relative (default) or absolute
+  # - overrun_policy: skip (default) or catchup
+  #
+  # @param self
+  # @param props Properties
+  #
+  # @endif
+  def setScheduleMode(self, props):
+    self._rtcout.RTC_TRACE("setScheduleMode()")
+
+    mode_ = props.getProperty("schedule_mode", OpenRTM_aist.SCHEDULE_RELATIVE)
+    mode_ = mode_.strip().lower()
+    if mode_ in (OpenRTM_aist.SCHEDULE_RELATIVE, OpenRTM_aist.SCHEDULE_ABSOLUTE):
+      self._scheduleMode = mode_
+    else:
+      self._rtcout.RTC_ERROR("invalid schedule_mode value: %s", mode_)
+
+    policy_ = props.getProperty("overrun_policy", OpenRTM_aist.OVERRUN_SKIP)
+    if not self._deadline.setOverrunPolicy(policy_):
+      self._rtcout.RTC_ERROR("invalid overrun_policy value: %s", policy_)
+
+    self._rtcout.RTC_DEBUG("Schedule mode: %s, overrun policy: %s",
+                           (self._scheduleMode,
+                            self._deadline.getOverrunPolicy()))
+    self._deadline.reset()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ١쥯μ¹ˡ
+  #
+  # ʲΥץѥƥɤ߹ࡣ
+  #
+  # - gc_mode: auto (ǥե) ޤ slackslack ξϥ
+  #            μư١쥯̵ˤζ
+  #            ֤ GCScheduler ˤԤ
+  # - gc_full_slack: βԤΤɬפʶ [s]0 (ǥե
+  #                  ) ξľβν׻֡
+  #
+  # @param self
+  # @param props ץѥƥ
+  #
+  # @else
+  # @brief Setting the garbage collection mode
+  #
+  # The following properties are read.
+  #
+  # - gc_mode: auto (default) or slack. In slack mode, the automatic
+  #            garbage collection is disabled during the worker phase,
+  #            and GCScheduler collects in the idle slack of the cycle.
+  # - gc_full_slack: Slack required for a full collection [s]. If 0
+  #                  (default), the duration of the last full
+  #                  collection.
+  #
+  # @param self
+  # @param props Properties
+  #
+  # @endif
+  def setGCMode(self, props):
+    self._rtcout.RTC_TRACE("setGCMode()")
+
+    mode_ = props.getProperty("gc_mode", OpenRTM_aist.GC_AUTO).strip().lower()
+    if mode_ == OpenRTM_aist.GC_AUTO:
+      self._gc = None
+      return
+    if mode_ != OpenRTM_aist.GC_SLACK:
+      self._rtcout.RTC_ERROR("invalid gc_mode value: %s", mode_)
+      return
+
+    slack_ = [0.0]
+    if not OpenRTM_aist.stringTo(slack_, props.getProperty("gc_full_slack", "0.0")):
+      self._rtcout.RTC_ERROR("invalid gc_full_slack value: %s",
+                             props.getProperty("gc_full_slack"))
+      slack_ = [0.0]
+    self._gc = OpenRTM_aist.GCScheduler(int(slack_[0] * OpenRTM_aist.nsec_per_sec))
+    self._rtcout.RTC_DEBUG("GC mode: slack, full collection slack: %f [s]",
+                           slack_[0])
+    return
+
+
+  ##
+  # @if jp
+  # @brief ١쥯׾
+  # @return GCScheduler.getStatistics()  dictgc_mode  auto ξ
+  #          None
+  # @else
+  # @brief Get the statistics of the garbage collection
+  # @return dict of GCScheduler.getStatistics(). None if gc_mode is auto
+  # @endif
+  def getGCStatistics(self):
+    if self._gc is None:
+      return None
+    return self._gc.getStatistics()
     
       
     
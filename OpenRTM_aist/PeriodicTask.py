@@ -77,6 +77,16 @@ class PeriodicTask(OpenRTM_aist.Task):
     self._periodStat     = self.statistics_t()
     self._periodTime     = OpenRTM_aist.TimeMeasure()
 
+    # variables for absolute deadline scheduling
+    self._scheduleMode   = OpenRTM_aist.SCHEDULE_RELATIVE
+    self._deadline       = OpenRTM_aist.PeriodicDeadline()
+
+    self._threadName     = ""
+    self._cpu            = []
+    self._schedPolicy    = ""
+    self._schedPriority  = 0
+
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("periodic_task")
     return
 
     
@@ -193,6 +203,7 @@ class PeriodicTask(OpenRTM_aist.Task):
   def resume(self):
     self._periodTime.reset()
     self._execTime.reset()
+    self._deadline.reset()
     self._suspend.cond.acquire()
     self._suspend.suspend = False
     self._suspend.cond.notify()
@@ -273,6 +284,99 @@ class PeriodicTask(OpenRTM_aist.Task):
     return
 
 
+  ##
+  # @if jp
+  # @brief Υ塼󥰥⡼ɤꤹ
+  #
+  # relative ξ硢¹Ի֤򺹤֤Ե롣
+  # absolute ξ硢ñĴååХǥåɥ饤ޤԵ
+  # 뤿ᡢΤ줬Ѥʤ
+  #
+  # @param mode 塼󥰥⡼ (relative ޤ absolute)
+  # @return Ǥ trueͤξ false
+  #
+  # @else
+  # @brief Setting the scheduling mode of the task
+  #
+  # In relative mode, the task sleeps for the period minus the
+  # execution time. In absolute mode, it sleeps until the absolute
+  # deadline on the monotonic clock so that drift does not accumulate.
+  #
+  # @param mode Scheduling mode (relative or absolute)
+  # @return true if the mode is set, false if it is invalid
+  #
+  # @endif
+  #
+  # virtual bool setScheduleMode(std::string mode);
+  def setScheduleMode(self, mode):
+    mode = mode.strip().lower()
+    if mode not in (OpenRTM_aist.SCHEDULE_RELATIVE,
+                    OpenRTM_aist.SCHEDULE_ABSOLUTE):
+      return False
+    self._scheduleMode = mode
+    self._deadline.reset()
+    return True
+
+
+  ##
+  # @if jp
+  # @brief ǥåɥ饤ĶΥݥꥷꤹ
+  #
+  # absolute ⡼ɤǥǥåɥ饤Ķᤷưꤹ롣
+  #
+  # @param policy ݥꥷ (skip ޤ catchup)
+  # @return Ǥ trueͤξ false
+  #
+  # @else
+  # @brief Setting the overrun policy
+  #
+  # This sets the behavior when a deadline is overrun in absolute mode.
+  #
+  # @param policy Policy (skip or catchup)
+  # @return true if the policy is set, false if it is invalid
+  #
+  # @endif
+  #
+  # virtual bool setOverrunPolicy(std::string policy);
+  def setOverrunPolicy(self, policy):
+    return self._deadline.setOverrunPolicy(policy)
+
+
+  ##
+  # @if jp
+  # @brief åɤԤ
+  #
+  # åɤγϻˡCPUե˥ƥȥ塼󥰥ݥꥷŬ
+  # Ѥ롣åɤϻꤷ̾ getThreadSettings() Ͽ롣
+  #
+  # @param name åɤ̾
+  # @param cpu CPUֹΥꥹȡξѹʤ
+  # @param policy 塼󥰥ݥꥷ̾ξѹʤ
+  # @param priority ͥ
+  #
+  # @else
+  # @brief Setting the thread
+  #
+  # The CPU affinity and the scheduling policy are applied when the
+  # thread starts. The thread is registered to getThreadSettings() with
+  # the given name.
+  #
+  # @param name Name of the thread
+  # @param cpu List of CPU numbers. Unchanged if empty
+  # @param policy Scheduling policy name. Unchanged if empty
+  # @param priority Priority
+  #
+  # @endif
+  #
+  # virtual void setThreadSettings(std::string name, ...);
+  def setThreadSettings(self, name, cpu=[], policy="", priority=0):
+    self._threadName = name
+    self._cpu = list(cpu)
+    self._schedPolicy = policy
+    self._schedPriority = priority
+    return
+
+
   ##
   # @if jp
   # @brief ؿ¹Իַ¬ͭˤ뤫
@@ -352,6 +456,7 @@ class PeriodicTask(OpenRTM_aist.Task):
 
   ## virtual int svc();
   def svc(self):
+    self.applyThreadSettings()
 
     while self._alive.value: # needs lock?
       if self._periodMeasure:
@@ -365,6 +470,7 @@ class PeriodicTask(OpenRTM_aist.Task):
         if not self._alive.value:
           self._suspend.cond.release()
           return 0
+        self._deadline.reset()
       self._suspend.cond.release()
           
       if self._periodMeasure:
@@ -387,17 +493,43 @@ class PeriodicTask(OpenRTM_aist.Task):
     return 0
         
         
+  ## void applyThreadSettings();
+  # The effective settings can be checked by getThreadSettings().
+  def applyThreadSettings(self):
+    if self._threadName:
+      OpenRTM_aist.registerThread(self._threadName)
+
+    if self._cpu:
+      if not OpenRTM_aist.setThreadAffinity(self._cpu):
+        self._rtcout.RTC_ERROR("CPU affinity mask setting failed: %s",
+                               self._threadName)
+
+    if self._schedPolicy:
+      if not OpenRTM_aist.setThreadScheduler(self._schedPolicy,
+                                             self._schedPriority):
+        self._rtcout.RTC_ERROR("Scheduling policy setting failed: %s: %s (%d)",
+                               (self._threadName, self._schedPolicy,
+                                self._schedPriority))
+    return
+
+
   ## virtual void sleep();
   def sleep(self):
     if self._nowait:
       return
 
-    sleep_sec = self._period - self._execTime.interval()
+    period_ns = self._period.sec() * OpenRTM_aist.nsec_per_sec + \
+                self._period.usec() * 1000
+    if self._scheduleMode == OpenRTM_aist.SCHEDULE_ABSOLUTE:
+      self._deadline.sleep(period_ns)
+      return
+
+    sleep_ns = period_ns - self._execTime.intervalNs()
 
-    if sleep_sec.toDouble() < 0:
+    if sleep_ns < 0:
       return
 
-    time.sleep(sleep_sec.toDouble())
+    time.sleep(float(sleep_ns) / OpenRTM_aist.nsec_per_sec)
     return
 
 
@@ -17,6 +17,8 @@
 
 
 import sys
+import threading
+import weakref
 
 if sys.version_info[0] == 2:
     maxint = sys.maxint
@@ -26,6 +28,15 @@ else:
 import OpenRTM_aist
 
 
+##
+# @if jp
+# @brief clone() ˤҥΡɤΥꥹȤζͭݸߥ塼ƥå
+# @else
+# @brief Mutex protecting the sharing of the child lists by clone()
+# @endif
+shared_properties_mutex = threading.RLock()
+
+
 ##
 # @if jp
 #
@@ -84,7 +95,7 @@ import OpenRTM_aist
 # encoded property file.
 #
 # @endif
-class Properties:
+class Properties(object):
   """
   """
 
@@ -166,10 +177,15 @@ class Properties:
   #
   # @endif
   def __init__(self, key=None, value=None, defaults_map=None, defaults_str=None, num=None, prop=None):
-    self.default_value = ""
+    self._name = ""
+    self._value = None
+    self._default_value = ""
     self.root = None
     self.empty = ""
     self.leaf = []
+    self._index = {}
+    self._shared = False
+    self._sharers = []
 
     # Properties::Properties(const Properties& prop)
     if prop:
@@ -188,13 +204,10 @@ class Properties:
 
     # Properties::Properties(const char* key, const char* value)
     if key:
-      self.name = key
-      self.value = value
+      self._name = key
+      self._value = value
       return
 
-    self.name  = ""
-    self.value = None
-
     # Properties::Properties(std::map<std::string, std::string>& defaults)
     if defaults_map:
       #for i in range(len(defaults_map.items())):
@@ -282,7 +295,38 @@ class Properties:
   #
   # @endif
   def getName(self):
-    return self.name
+    return self._name
+
+
+  ##
+  # @if jp
+  # @brief Name 
+  #
+  # ץѥƥ̾Τꤹ롣ƥΡɤλҥΡɤκ⹹롣
+  # clone() ˤꤳΥΡɤͭƤץѥƥˤȿǤʤ
+  #
+  # @param self
+  # @param name ץѥƥ̾
+  #
+  # @else
+  # @brief Set the name
+  #
+  # The name of the property is set. The index of the child nodes of
+  # the parent node is also updated. This is not reflected to the
+  # properties sharing this node by clone().
+  #
+  # @param self
+  # @param name Property name
+  #
+  # @endif
+  def setName(self, name):
+    self.own(False)
+    self._name = name
+    if self.root is not None:
+      self.root.updateIndex()
+    return
+
+  name = property(getName, setName)
 
 
   ##
@@ -299,7 +343,35 @@ class Properties:
   #
   # @endif
   def getValue(self):
-    return self.value
+    return self._value
+
+
+  ##
+  # @if jp
+  # @brief ͤ
+  #
+  # ץѥƥͤꤹ롣clone() ˤꤳΥΡɤͭƤ
+  # ץѥƥˤȿǤʤ
+  #
+  # @param self
+  # @param value ץѥƥ
+  #
+  # @else
+  # @brief Set the value
+  #
+  # The value of the property is set. This is not reflected to the
+  # properties sharing this node by clone().
+  #
+  # @param self
+  # @param value Property value
+  #
+  # @endif
+  def setValue(self, value):
+    self.own(False)
+    self._value = value
+    return
+
+  value = property(getValue, setValue)
 
 
   ##
@@ -316,7 +388,35 @@ class Properties:
   #
   # @endif
   def getDefaultValue(self):
-    return self.default_value
+    return self._default_value
+
+
+  ##
+  # @if jp
+  # @brief ǥեͤ
+  #
+  # ץѥƥΥǥեͤꤹ롣clone() ˤꤳΥΡɤ
+  # ͭƤץѥƥˤȿǤʤ
+  #
+  # @param self
+  # @param value ץѥƥǥե
+  #
+  # @else
+  # @brief Set the default value
+  #
+  # The default value of the property is set. This is not reflected to
+  # the properties sharing this node by clone().
+  #
+  # @param self
+  # @param value Property default value
+  #
+  # @endif
+  def setDefaultValue(self, value):
+    self.own(False)
+    self._default_value = value
+    return
+
+  default_value = property(getDefaultValue, setDefaultValue)
 
 
   ##
@@ -333,6 +433,7 @@ class Properties:
   #
   # @endif
   def getLeaf(self):
+    self.own()
     return self.leaf
 
 
@@ -465,11 +566,10 @@ class Properties:
       self.split(key, ".", keys)
       curr = self
       for _key in keys:
-        next = curr.hasKey(_key)
+        next = curr.own().hasKey(_key)
         if next is None:
           next = OpenRTM_aist.Properties(key=_key)
-          next.root = curr
-          curr.leaf.append(next)
+          curr.appendLeaf(next)
         curr = next
       retval = curr.value
       curr.value = value
@@ -503,11 +603,10 @@ class Properties:
 
     curr = self
     for _key in keys:
-      next = curr.hasKey(_key)
+      next = curr.own().hasKey(_key)
       if next is None:
         next = OpenRTM_aist.Properties(key=_key)
-        next.root = curr
-        curr.leaf.append(next)
+        curr.appendLeaf(next)
       curr = next
     if value != "" and value[-1] == "\n":
       value = value[0:len(value)-1]
@@ -749,6 +848,42 @@ class Properties:
   #
   # @endif
   def load(self, inStream):
+    for key, value in self.readEntries(inStream):
+      self.setProperty(key, value)
+    return
+
+
+  ##
+  # @if jp
+  #
+  # @brief ϥȥ꡼फ饭ͤΥڥΥꥹȤɤ߹
+  #
+  # load() Ʊϥȥ꡼Ϥץѥƥˤꤻ
+  #  (, ) ΥꥹȤ򵭽ҽ֤Ϸ̤򥭥å夹
+  #  (ConfigCache) ˻Ѥ롣
+  #
+  # @param self
+  # @param inStream ϥȥ꡼
+  #
+  # @return (, ) Υꥹ
+  #
+  # @else
+  #
+  # @brief Read a list of key and element pairs from the input stream
+  #
+  # The input stream is parsed in the same format as load(), and a
+  # list of (key, element) is returned in the order of appearance
+  # without setting the properties. This is used to cache the parsed
+  # result (ConfigCache).
+  #
+  # @param self
+  # @param inStream the input stream.
+  #
+  # @return List of (key, element)
+  #
+  # @endif
+  def readEntries(self, inStream):
+    entries = []
     pline = ""
     for readStr in inStream:
       if not readStr:
@@ -787,9 +922,11 @@ class Properties:
       value[0] = OpenRTM_aist.unescape(value[0])
       value[0] = value[0].strip()
 
-      self.setProperty(key[0], value[0])
+      entries.append((key[0], value[0]))
       pline = ""
 
+    return entries
+
 
   ##
   # @if jp
@@ -974,7 +1111,12 @@ class Properties:
 
     keys = []
     self.split(key, '.', keys)
-    return self._getNode(keys, 0, self)
+    curr = self
+    for _key in keys:
+      curr = curr.own().hasKey(_key)
+      if curr is None:
+        return None
+    return curr
 
 
   ##
@@ -1046,16 +1188,46 @@ class Properties:
   # @brief Get node of Properties
   # @endif
   def removeNode(self, leaf_name):
+    self.own()
     len_ = len(self.leaf)
     for i in range(len_):
       idx = (len_ - 1) - i
       if self.leaf[idx].name == leaf_name:
         prop = self.leaf[idx]
         del self.leaf[idx]
+        if self._index.get(leaf_name) is prop:
+          self.updateIndex()
         return prop
     return None
 
 
+  ##
+  # @if jp
+  # @brief ҥΡɤɲä
+  #
+  # ҥΡɤɲä̾ΤˤϿ롣
+  #
+  # @param self
+  # @param node ɲäץѥƥ
+  #
+  # @else
+  # @brief Append a child node
+  #
+  # The child node is appended at the end and registered to the index
+  # by name.
+  #
+  # @param self
+  # @param node Property to be appended
+  #
+  # @endif
+  def appendLeaf(self, node):
+    self.own()
+    node.root = self
+    self.leaf.append(node)
+    self._index.setdefault(node.name, node)
+    return
+
+
   ##
   # @if jp
   # @brief ҥΡɤkey뤫ɤ
@@ -1072,11 +1244,41 @@ class Properties:
   # @brief If key exists in the children
   # @endif
   def hasKey(self, key):
-    for leaf in self.leaf:
-      if leaf.name == key:
-        return leaf
+    return self._index.get(key)
 
-    return None
+
+  ##
+  # @if jp
+  # @brief ҥΡɤκľ
+  #
+  # ҥΡɤ̾Τ򥭡Ȥ dict Ǻդ졢ҥΡɤν
+  # leaf ΥꥹȤݻ롣 leaf ѹƤΥ᥽å
+  # ǹ뤿ᡢleaf ľѹƤϤʤʤҥΡɤΥꥹ
+  # ֤硢ҥΡɤ硢ӻҥΡɤ̾Τ
+  # ѹ˸ƤӽФ롣Ʊ̾ΤλҥΡɤƬ
+  # ΤϿ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Rebuild the index of the child nodes
+  #
+  # The child nodes are indexed by a dict keyed by name, and their
+  # order is kept in the list leaf. The index is updated by every
+  # method that modifies leaf, so leaf must not be modified directly.
+  # This is called when the list of the child nodes is replaced, when
+  # a child node is removed and when a child node is renamed. If child
+  # nodes have the same name, the first one is registered.
+  #
+  # @param self
+  #
+  # @endif
+  def updateIndex(self):
+    index_ = {}
+    for leaf in self.leaf:
+      index_.setdefault(leaf.name, leaf)
+    self._index = index_
+    return
 
 
   ##
@@ -1089,14 +1291,213 @@ class Properties:
   # @brief If key exists in the children
   # @endif
   def clear(self):
+    if self._shared:
+      self.own(False)
+      guard = OpenRTM_aist.ScopedLock(shared_properties_mutex)
+      self._unshare()
+      self.leaf = []
+      self._index = {}
+      self._shared = False
+      return
+
+    self.own()
     len_ = len(self.leaf)
     for i in range(len_):
       if self.leaf[-1]:
         del self.leaf[-1]
+    self._index = {}
+
+    return
+
+
+  ##
+  # @if jp
+  # @brief ץѥƥʣ
+  #
+  # ҥΡɤʣ˶ͭ Properties ֤ᡢڤ礭
+  # 餺 O(1) ʣǤ롣ʣʣΤɤ餫ѹ
+  # ϡѹϩΥΡɤλҥΡɤΥꥹȤΤߤʣ
+  #  (ԡ饤)ʣ˼줿Ρɤѹ
+  # ޤơʣѹϤ⤦ˤȿǤʤ
+  # copy.deepcopy() ˻Ѥ롣
+  #
+  # ͭϿȲ shared_properties_mutex ݸ뤿ᡢƱ
+  # ץѥƥʣΥåɤ clone() Ǥ롣
+  #
+  # @param self
+  #
+  # @return ʣץѥƥ
+  #
+  # @else
+  # @brief Clone the properties
+  #
+  # The returned Properties shares the child nodes instead of copying
+  # them, so cloning takes O(1) regardless of the size of the tree.
+  # When either the original or the clone is modified, only the lists
+  # of child nodes on the modified path are copied before the
+  # modification (copy-on-write). Modifications after cloning are not
+  # reflected to the other one, including modifications of nodes
+  # obtained before cloning. This is used instead of copy.deepcopy().
+  #
+  # Registering and releasing the sharing is protected by
+  # shared_properties_mutex, so the same properties can be cloned
+  # from multiple threads.
+  #
+  # @param self
+  #
+  # @return Cloned properties
+  #
+  # @endif
+  def clone(self):
+    guard = OpenRTM_aist.ScopedLock(shared_properties_mutex)
+    prop = OpenRTM_aist.Properties()
+    prop._name = self._name
+    prop._value = self._value
+    prop._default_value = self._default_value
+    prop.leaf = self.leaf
+    prop._index = self._index
+    prop._shared = True
+
+    if len(self._sharers) >= 16:
+      self._sharers = [ref for ref in self._sharers if ref() is not None]
+    self._sharers.append(weakref.ref(prop))
+    return prop
+
+
+  ##
+  # @if jp
+  # @brief ѹ˶ͭ
+  #
+  # ΥΡɤѹޤѹǽΤҥΡɤ
+  # ˸ƤӽФ
+  #
+  # - ΥΡɤ麬ޤǤγƥΡɤˤĤơ˶ᤤˡ
+  #   clone() ץѥƥ˻ҥΡɤΥꥹȤʣ롣ʣ
+  #   ҥΡɤϸλҥΡɤ clone() Ǥ뤿ᡢѹϩ
+  #   ΥΡɤʣ褫ڤΥ롣
+  # - copy_leaf  True ǡclone() ˤҥΡɤΥꥹȤͭ
+  #   ϡҥΡɤ clone() ꥹȤ֤롣
+  #
+  # ͤ̾ΤΤߤѹϻҥΡɤΥꥹȤѹʤᡢ
+  # copy_leaf  False ꤷΥΡɼȤζͭϲʤ
+  #
+  # @param self
+  # @param copy_leaf ΥΡɤλҥΡɤΥꥹȤͭ True
+  #
+  # @return self
+  #
+  # @else
+  # @brief Release the sharing before modification
+  #
+  # This is called before this node is modified, or before a child
+  # node that may be modified is returned.
+  #
+  # - For each node from the root to this node, the properties cloned
+  #   from it copy the list of the child nodes. Since the copied child
+  #   nodes are clone() of the original ones, every node on the
+  #   modified path is detached from the clones.
+  # - If copy_leaf is True and the list of the child nodes is shared
+  #   by clone(), it is replaced with a list of clone() of the child
+  #   nodes.
+  #
+  # When only the value or the name is modified, the list of the
+  # child nodes is not modified, so copy_leaf is False and the sharing
+  # of this node itself is kept.
+  #
+  # @param self
+  # @param copy_leaf True to also own the list of the child nodes of
+  #                  this node
+  #
+  # @return self
+  #
+  # @endif
+  def own(self, copy_leaf=True):
+    if copy_leaf:
+      node_ = self
+    else:
+      node_ = self.root
+    while node_ is not None and not node_._sharers:
+      node_ = node_.root
+    if node_ is None and not (copy_leaf and self._shared):
+      return self
+
+    guard = OpenRTM_aist.ScopedLock(shared_properties_mutex)
+    path_ = []
+    if copy_leaf:
+      node_ = self
+    else:
+      node_ = self.root
+    while node_ is not None:
+      path_.append(node_)
+      node_ = node_.root
+    for node_ in reversed(path_):
+      node_._unshare()
+
+    if copy_leaf and self._shared:
+      self._copyLeaf()
+    return self
+
 
+  ##
+  # @if jp
+  # @brief ΥΡɤ clone() ץѥƥ˻ҥΡɤΥꥹȤʣ
+  # @param self
+  # @else
+  # @brief Make the clones of this node copy the list of the child nodes
+  # @param self
+  # @endif
+  def _unshare(self):
+    if not self._sharers:
+      return
+    leaf_ = self.leaf
+    sharers_ = self._sharers
+    self._sharers = []
+    for ref in sharers_:
+      prop = ref()
+      if prop is not None and prop._shared and prop.leaf is leaf_:
+        prop._copyLeaf()
     return
 
 
+  ##
+  # @if jp
+  # @brief ͭƤҥΡɤΥꥹȤ clone() ꥹȤ֤
+  # @param self
+  # @else
+  # @brief Replace the shared list of the child nodes with their clones
+  # @param self
+  # @endif
+  def _copyLeaf(self):
+    self._unshare()
+    leaf_ = [node.clone() for node in self.leaf]
+    for node in leaf_:
+      node.root = self
+    self.leaf = leaf_
+    self.updateIndex()
+    self._shared = False
+    return
+
+
+  ##
+  # @if jp
+  # @brief pickle  copy.deepcopy() Ѥξ֤
+  #
+  # ʣؤμ廲Ȥϴޤʤʣ̤ϻҥΡɤΥꥹȤͭ롣
+  #
+  # @else
+  # @brief Get the state for pickle and copy.deepcopy()
+  #
+  # Weak references to the clones are not included. The copy owns the
+  # list of the child nodes.
+  #
+  # @endif
+  def __getstate__(self):
+    state = self.__dict__.copy()
+    state["_shared"] = False
+    state["_sharers"] = []
+    return state
+
+
   ##
   # @if jp
   # @brief Propertyޡ
@@ -1114,7 +1515,7 @@ class Properties:
   def mergeProperties(self, prop):
     keys = prop.propertyNames()
 
-    for i in range(prop.size()):
+    for i in range(len(keys)):
       self.setProperty(keys[i], prop.getProperty(keys[i]))
 
     return self
@@ -1189,6 +1590,11 @@ class Properties:
     if _str == "":
       return False
 
+    # Keys without escape characters are split by str.split()
+    if "\\" not in _str:
+      value.extend(_str.split(delim))
+      return True
+
     begin_it = end_it = 0
 
     length = len(_str)
@@ -1223,15 +1629,11 @@ class Properties:
   #
   # @endif
   def _getNode(self, keys, index, curr):
-    next = curr.hasKey(keys[index])
-    if next is None:
-      return None
-
-    if index < (len(keys) - 1):
-      index+=1
-      return next._getNode(keys, index, next)
-    else:
-      return next
+    for key in keys[index:]:
+      curr = curr.hasKey(key)
+      if curr is None:
+        return None
+    return curr
 
     
 
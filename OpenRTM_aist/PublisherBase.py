@@ -131,6 +131,61 @@ class PublisherBase(OpenRTM_aist.DataPortStatus):
     pass
 
 
+  ##
+  # @if jp
+  #
+  # @brief ѥΥåɤꤹ
+  #
+  # ʲΥץѥƥɤ߹ߡPeriodicTask.setThreadSettings() 
+  # ꤹ롣ͤϥ顼Ϥ̵뤹롣
+  #
+  # - publisher.cpu_affinity: CPUֹΥꥹ
+  # - publisher.sched_policy: 塼󥰥ݥꥷ̾
+  # - publisher.sched_priority: ͥ (ǥե: 0)
+  #
+  # @param task PeriodicTask
+  # @param name åɤ̾
+  # @param prop 
+  #
+  # @else
+  #
+  # @brief Set the thread of the task sending data
+  #
+  # The following properties are read and set by
+  # PeriodicTask.setThreadSettings(). Invalid values are reported as
+  # errors and ignored.
+  #
+  # - publisher.cpu_affinity: List of CPU numbers
+  # - publisher.sched_policy: Scheduling policy name
+  # - publisher.sched_priority: Priority (default: 0)
+  #
+  # @param task PeriodicTask
+  # @param name Name of the thread
+  # @param prop Properties
+  #
+  # @endif
+  def setTaskThreadSettings(self, task, name, prop):
+    cpu_ = []
+    affinity_str_ = prop.getProperty("publisher.cpu_affinity")
+    if affinity_str_:
+      for num in affinity_str_.split(","):
+        try:
+          cpu_.append(int(num))
+        except ValueError:
+          self._rtcout.RTC_ERROR("invalid cpu_affinity value: %s", num)
+
+    priority_ = [0]
+    if not OpenRTM_aist.stringTo(priority_, prop.getProperty("publisher.sched_priority", "0")):
+      self._rtcout.RTC_ERROR("invalid sched_priority value: %s",
+                             prop.getProperty("publisher.sched_priority"))
+      priority_ = [0]
+
+    task.setThreadSettings(name, cpu_,
+                           prop.getProperty("publisher.sched_policy"),
+                           priority_[0])
+    return
+
+
 publisherfactory = None
 
 class PublisherFactory(OpenRTM_aist.Factory,PublisherBase):
@@ -183,6 +183,8 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
 
     # setting task function
     self._task.setTask(self.svc)
+
+    self.setTaskThreadSettings(self._task, "PublisherNew", prop)
     self._task.setPeriod(0.0)
     self._task.executionMeasure(OpenRTM_aist.toBool(mprop.getProperty("exec_time"),
                                                     "enable", "disable", True))
@@ -186,6 +186,8 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
     # setting task function
     self._task.setTask(self.svc)
 
+    self.setTaskThreadSettings(self._task, "PublisherPeriodic", prop)
+
     # Task execution rate
     rate = prop.getProperty("publisher.push_rate")
 
@@ -198,6 +200,15 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
       hz = 1000.0
 
     self._task.setPeriod(1.0/hz)
+
+    # Scheduling mode
+    mode = prop.getProperty("publisher.schedule_mode")
+    if mode and not self._task.setScheduleMode(mode):
+      self._rtcout.RTC_ERROR("invalid schedule_mode value: %s", mode)
+
+    policy = prop.getProperty("publisher.overrun_policy")
+    if policy and not self._task.setOverrunPolicy(policy):
+      self._rtcout.RTC_ERROR("invalid overrun_policy value: %s", policy)
     
     # Measurement setting
     mprop = prop.getNode("measurement")
@@ -243,6 +254,8 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   # - publisher.push_rate: Publisher ()
   # - publisher.push_policy: Pushݥꥷ (all, fifo, skip, new)
   # - publisher.skip_count: 嵭ݥꥷ skip ΤȤΥå׿
+  # - publisher.schedule_mode: Υ塼 (relative, absolute)
+  # - publisher.overrun_policy: ǥåɥ饤ĶΥݥꥷ (skip, catchup)
   # - measurement.exec_time: ¹Իַ¬ (enable/disable)
   # - measurement.exec_count: ؿ¹Իַ¬ (, )
   # - measurement.period_time: ַ¬ (enable/disable)
@@ -271,6 +284,8 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   # - publisher.push_rate: Publisher sending period (numberical)
   # - publisher.push_policy: Push policy (all, fifo, skip, new)
   # - publisher.skip_count: The number of skip count in the "skip" policy
+  # - publisher.schedule_mode: Period scheduling (relative, absolute)
+  # - publisher.overrun_policy: Policy on deadline overrun (skip, catchup)
   # - measurement.exec_time: Task execution time measurement (enable/disable)
   # - measurement.exec_count: Task execution time measurement count
   #                           (numerical, number of times)
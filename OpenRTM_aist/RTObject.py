@@ -1168,7 +1168,7 @@ class RTObject_impl:
     try:
       self.preOnInitialize(0)
       self._rtcout.RTC_DEBUG("Calling onInitialize().")
-      ret = self.onInitialize()
+      ret = OpenRTM_aist.awaitCallback(self.onInitialize())
       if ret != RTC.RTC_OK:
         self._rtcout.RTC_ERROR("onInitialize() returns an ERROR (%d)", ret._v)
       else:
@@ -1225,7 +1225,7 @@ class RTObject_impl:
     ret = RTC.RTC_ERROR
     try:
       self.preOnFinalize(0)
-      ret = self.onFinalize()
+      ret = OpenRTM_aist.awaitCallback(self.onFinalize())
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       ret = RTC.RTC_ERROR
@@ -1265,7 +1265,7 @@ class RTObject_impl:
     ret = RTC.RTC_ERROR
     try:
       self.preOnStartup(ec_id)
-      ret = self.onStartup(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onStartup(ec_id))
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       ret = RTC.RTC_ERROR
@@ -1305,7 +1305,7 @@ class RTObject_impl:
     ret = RTC.RTC_ERROR
     try:
       self.preOnShutdown(ec_id)
-      ret = self.onShutdown(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onShutdown(ec_id))
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       ret = RTC.RTC_ERROR
@@ -1344,7 +1344,7 @@ class RTObject_impl:
     try:
       self.preOnActivated(ec_id)
       self._configsets.update()
-      ret = self.onActivated(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onActivated(ec_id))
       self._portAdmin.activatePorts()
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
@@ -1384,7 +1384,7 @@ class RTObject_impl:
     try:
       self.preOnDeactivated(ec_id)
       self._portAdmin.deactivatePorts()
-      ret = self.onDeactivated(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onDeactivated(ec_id))
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       ret = RTC.RTC_ERROR
@@ -1428,7 +1428,7 @@ class RTObject_impl:
     ret = RTC.RTC_ERROR
     try:
       self.preOnAborting(ec_id)
-      ret = self.onAborting(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onAborting(ec_id))
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       ret = RTC.RTC_ERROR
@@ -1483,7 +1483,7 @@ class RTObject_impl:
     ret = RTC.RTC_ERROR
     try:
       self.preOnError(ec_id)
-      ret = self.onError(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onError(ec_id))
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       ret = RTC.RTC_ERROR
@@ -1529,7 +1529,7 @@ class RTObject_impl:
     ret = RTC.RTC_ERROR
     try:
       self.preOnReset(ec_id)
-      ret = self.onReset(ec_id)
+      ret = OpenRTM_aist.awaitCallback(self.onReset(ec_id))
     except:
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       ret = RTC.RTC_ERROR
@@ -3817,12 +3817,15 @@ class RTObject_impl:
   #
   # - ATTACH_EC:    ExecutionContext å
   # - DETACH_EC:    ExecutionContext ǥå
+  # - DEADLINE_MISS: ExecutionContext μν¹ԼĶᤷ
   #
   # ꥹʤ ExecutionContextActionListener ѾʲΥ˥
   # operator() Ƥɬפ롣
   #
   # ExecutionContextActionListener::operator()(UniqueIdec_id)
   #
+  # DEADLINE_MISS Υꥹʤ2Ķ [s] 롣
+  #
   # ǥեȤǤϡδؿͿꥹʥ֥Ȥνͭ
   # RTObject˰ܤꡢRTObjectλ⤷ϡ
   # removeExecutionContextActionListener() ˤ˼ưŪ˲Τ롣
@@ -3842,11 +3845,15 @@ class RTObject_impl:
   #
   # - ADD_PORT:    At adding ExecutionContext
   # - REMOVE_PORT: At removing ExecutionContext
+  # - DEADLINE_MISS: When a cycle of the ExecutionContext overran the period
   #
   # Listeners should have the following function operator().
   #
   # ExecutionContextActionListener::operator()(UniqueId ec_id)
   #
+  # Listeners of DEADLINE_MISS take the overrun time [s] as the second
+  # argument.
+  #
   # The ownership of the given listener object is transferred to
   # this RTObject object in default.  The given listener object will
   # be destroied automatically in the RTObject's dtor or if the
@@ -3872,8 +3879,8 @@ class RTObject_impl:
         self._memfunc = memfunc
         return
 
-      def __call__(self, ec_id):
-        self._memfunc(ec_id)
+      def __call__(self, ec_id, *args):
+        self._memfunc(ec_id, *args)
         return
 
     listener = Noname(memfunc)
@@ -5023,6 +5030,12 @@ class RTObject_impl:
   def onDetachExecutionContext(self, ec_id):
     self._actionListeners.ecaction_[OpenRTM_aist.ExecutionContextActionListenerType.EC_DETACHED].notify(ec_id)
     return
+    
+    
+  # inline void onDeadlineMiss(UniqueId ec_id, double overrun)
+  def onDeadlineMiss(self, ec_id, overrun):
+    self._actionListeners.ecaction_[OpenRTM_aist.ExecutionContextActionListenerType.EC_DEADLINE_MISS].notify(ec_id, overrun)
+    return
 
 
 
@@ -5069,7 +5082,14 @@ class RTObject_impl:
                        "activation_timeout",
                        "deactivation_timeout",
                        "reset_timeout",
-                       "cpu_affinity"]
+                       "cpu_affinity",
+                       "sched_policy",
+                       "sched_priority",
+                       "schedule_mode",
+                       "overrun_policy",
+                       "execution_profile",
+                       "deadline_watchdog",
+                       "deadline_miss_limit"]
 
     p_ = self._properties.findNode("exec_cxt")
     if not p_:
@@ -5287,7 +5307,14 @@ class RTObject_impl:
                        "activation_timeout",
                        "deactivation_timeout",
                        "reset_timeout",
-                       "cpu_affinity"]
+                       "cpu_affinity",
+                       "sched_policy",
+                       "sched_priority",
+                       "schedule_mode",
+                       "overrun_policy",
+                       "execution_profile",
+                       "deadline_watchdog",
+                       "deadline_miss_limit"]
 
       p_ = self._properties.findNode("exec_cxt")
       
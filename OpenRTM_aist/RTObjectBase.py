@@ -5004,7 +5004,14 @@ class RTObjectBase:
                        "activation_timeout",
                        "deactivation_timeout",
                        "reset_timeout"
-                       "cpu_affinity"]
+                       "cpu_affinity",
+                       "sched_policy",
+                       "sched_priority",
+                       "schedule_mode",
+                       "overrun_policy",
+                       "execution_profile",
+                       "deadline_watchdog",
+                       "deadline_miss_limit"]
 
     p_ = self._properties.findNode("exec_cxt")
     if not p_:
@@ -5222,7 +5229,14 @@ class RTObjectBase:
                        "activation_timeout",
                        "deactivation_timeout",
                        "reset_timeout",
-                       "cpu_affinity"]
+                       "cpu_affinity",
+                       "sched_policy",
+                       "sched_priority",
+                       "schedule_mode",
+                       "overrun_policy",
+                       "execution_profile",
+                       "deadline_watchdog",
+                       "deadline_miss_limit"]
 
       p_ = self._properties.findNode("exec_cxt")
       
@@ -133,6 +133,13 @@ class RTObjectStateMachine:
     self._caVar.on_shutdown(self._id)
     return
 
+  # void onDeadlineMiss(double overrun);
+  # Only local RTCs are notified since ComponentAction has no such operation.
+  def onDeadlineMiss(self, overrun):
+    if self._rtObjPtr:
+      self._rtObjPtr.onDeadlineMiss(self._id, overrun)
+    return
+
   # void onActivated(const ExecContextStates& st);
   def onActivated(self, st):
     if self._rtObjPtr:
@@ -0,0 +1,438 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file SharedMemoryBarrier.py
+# @brief Cycle barrier between processes over shared memory
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import os
+import mmap
+import struct
+import tempfile
+import time
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @class SharedMemoryBarrier
+# @brief 共有メモリによるプロセス間の周期同期バリア
+#
+# 1つの駆動側プロセスと複数の参加プロセスとの間で、周期処理の開始と
+# 終了を同期するためのバリア。ファイルにマップした共有メモリ上に以下
+# の 64bit 整数を配置する。
+#
+# - ヘッダ: 参加者数、開始番号、終了フラグ、駆動側プロセスID
+# - 参加者毎: 参加フラグ、完了番号
+#
+# 駆動側は signal() で開始番号を進め、join() で参加中の全プロセスの
+# 完了番号が追いつくまで待つ。参加側は wait() で開始番号の更新を待ち、
+# 処理後に done() で完了番号を書き込む。各値の書き込み側は1プロセス
+# のみであるため、ロックは使用しない。待機はポーリングで行い、短いス
+# ピンの後はスリープ時間を MAX_POLL_INTERVAL まで指数的に延ばす。タイ
+# ムアウトは単調増加時計で判定する。
+#
+# @since 2.0.0
+#
+# @else
+# @class SharedMemoryBarrier
+# @brief Cycle barrier between processes over shared memory
+#
+# This barrier synchronizes the start and the end of each cycle
+# between one driving process and several participant processes.
+# The following 64bit integers are placed on file-mapped shared
+# memory.
+#
+# - header: number of parties, start sequence, terminate flag,
+#           process ID of the driver
+# - per party: attached flag, done sequence
+#
+# The driver advances the start sequence by signal() and waits in
+# join() until the done sequences of all attached parties catch up.
+# A participant waits for the start sequence in wait() and writes its
+# done sequence by done() after processing. Since each value has only
+# one writer process, no lock is used. Waiting is done by polling,
+# which spins for a while and then sleeps with an exponentially
+# growing interval up to MAX_POLL_INTERVAL. Timeouts are measured
+# with the monotonic clock.
+#
+# @since 2.0.0
+#
+# @endif
+class SharedMemoryBarrier:
+  """
+  """
+  HEADER_SIZE = 32
+  PARTY_SIZE = 16
+  SPIN_COUNT = 100
+  POLL_INTERVAL = 0.00005
+  MAX_POLL_INTERVAL = 0.001
+
+  _PARTIES = 0
+  _START = 8
+  _TERMINATE = 16
+  _OWNER = 24
+
+
+  ##
+  # @if jp
+  # @brief コンストラクタ
+  # @else
+  # @brief Constructor
+  # @endif
+  def __init__(self):
+    self._mem = None
+    self._path = ""
+    self._owner = False
+    return
+
+
+  ##
+  # @if jp
+  # @brief バリア用共有メモリのデフォルトのパスを生成する
+  #
+  # /dev/shm が存在する場合はその下に、存在しない場合は一時ディレク
+  # トリの下にファイルを作成する。
+  #
+  # @param name ファイル名
+  # @return パス
+  #
+  # @else
+  # @brief Create a default path of the shared memory for a barrier
+  #
+  # The file is created under /dev/shm if it exists, otherwise under
+  # the temporary directory.
+  #
+  # @param name File name
+  # @return Path
+  #
+  # @endif
+  def defaultPath(name):
+    if os.path.isdir("/dev/shm"):
+      return os.path.join("/dev/shm", name)
+    return os.path.join(tempfile.gettempdir(), name)
+  defaultPath = staticmethod(defaultPath)
+
+
+  ##
+  # @if jp
+  # @brief 駆動側としてバリアを生成する
+  #
+  # @param self
+  # @param path 共有メモリのファイルパス
+  # @param parties 参加者数
+  # @return 成功した場合 True
+  #
+  # @else
+  # @brief Create the barrier as the driver
+  #
+  # @param self
+  # @param path File path of the shared memory
+  # @param parties Number of parties
+  # @return True if succeeded
+  #
+  # @endif
+  def create(self, path, parties):
+    size_ = self.HEADER_SIZE + self.PARTY_SIZE * parties
+    try:
+      f_ = open(path, "w+b")
+      f_.write(b"\0" * size_)
+      f_.flush()
+      self._mem = mmap.mmap(f_.fileno(), size_)
+      f_.close()
+    except (IOError, OSError, mmap.error):
+      return False
+    self._path = path
+    self._owner = True
+    self.set(self._PARTIES, parties)
+    self.set(self._OWNER, os.getpid())
+    return True
+
+
+  ##
+  # @if jp
+  # @brief 参加側として既存のバリアを開く
+  #
+  # @param self
+  # @param path 共有メモリのファイルパス
+  # @return 成功した場合 True
+  #
+  # @else
+  # @brief Open an existing barrier as a participant
+  #
+  # @param self
+  # @param path File path of the shared memory
+  # @return True if succeeded
+  #
+  # @endif
+  def open(self, path):
+    try:
+      f_ = open(path, "r+b")
+      self._mem = mmap.mmap(f_.fileno(), os.path.getsize(path))
+      f_.close()
+    except (IOError, OSError, mmap.error):
+      return False
+    self._path = path
+    self._owner = False
+    return True
+
+
+  ##
+  # @if jp
+  # @brief バリアを閉じる
+  #
+  # 駆動側の場合は共有メモリのファイルも削除する。
+  #
+  # @else
+  # @brief Close the barrier
+  #
+  # The file of the shared memory is removed by the driver.
+  #
+  # @endif
+  def close(self):
+    if self._mem is None:
+      return
+    self._mem.close()
+    self._mem = None
+    if self._owner:
+      try:
+        os.remove(self._path)
+      except OSError:
+        pass
+    return
+
+
+  def getPath(self):
+    return self._path
+
+
+  def get(self, offset):
+    return struct.unpack_from("<Q", self._mem, offset)[0]
+
+
+  def set(self, offset, value):
+    struct.pack_into("<Q", self._mem, offset, value)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 参加者数を取得する
+  # @else
+  # @brief Get the number of parties
+  # @endif
+  def parties(self):
+    return self.get(self._PARTIES)
+
+
+  ##
+  # @if jp
+  # @brief 駆動側プロセスのIDを取得する
+  # @else
+  # @brief Get the process ID of the driver
+  # @endif
+  def getOwnerPid(self):
+    return self.get(self._OWNER)
+
+
+  ##
+  # @if jp
+  # @brief 終了を通知する
+  # @else
+  # @brief Notify termination
+  # @endif
+  def terminate(self):
+    self.set(self._TERMINATE, 1)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 終了が通知されているかどうか
+  # @else
+  # @brief Whether termination has been notified
+  # @endif
+  def isTerminated(self):
+    return self.get(self._TERMINATE) != 0
+
+
+  ##
+  # @if jp
+  # @brief 参加者が参加しているかどうか
+  # @param index 参加者番号
+  # @else
+  # @brief Whether the party is attached
+  # @param index Index of the party
+  # @endif
+  def isAttached(self, index):
+    return self.get(self.HEADER_SIZE + self.PARTY_SIZE * index) != 0
+
+
+  ##
+  # @if jp
+  # @brief 次の周期の開始を通知する (駆動側)
+  # @return 開始番号
+  # @else
+  # @brief Notify the start of the next cycle (driver)
+  # @return Start sequence
+  # @endif
+  def signal(self):
+    seq_ = self.get(self._START) + 1
+    self.set(self._START, seq_)
+    return seq_
+
+
+  ##
+  # @if jp
+  # @brief 参加中の全プロセスが周期を完了するまで待つ (駆動側)
+  #
+  # @param seq 待機する開始番号
+  # @param timeout タイムアウト [s]
+  # @return 全プロセスが完了した場合 True、タイムアウトした場合 False
+  #
+  # @else
+  # @brief Wait until all attached parties complete the cycle (driver)
+  #
+  # @param seq Start sequence to wait for
+  # @param timeout Timeout [s]
+  # @return True if all parties completed, False on timeout
+  #
+  # @endif
+  def join(self, seq, timeout):
+    deadline_ = OpenRTM_aist.monotonic_ns() + int(timeout * OpenRTM_aist.nsec_per_sec)
+    count_ = 0
+    for i in range(self.parties()):
+      offset_ = self.HEADER_SIZE + self.PARTY_SIZE * i
+      while self.get(offset_) and self.get(offset_ + 8) < seq:
+        count_ = self.pause(count_)
+        if count_ > self.SPIN_COUNT and OpenRTM_aist.monotonic_ns() > deadline_:
+          return False
+    return True
+
+
+  ##
+  # @if jp
+  # @brief バリアに参加する (参加側)
+  #
+  # 現在の開始番号を完了番号として書き込んでから参加するため、参加
+  # 直後の周期で駆動側を待たせることはない。
+  #
+  # @param index 参加者番号
+  # @return 現在の開始番号
+  #
+  # @else
+  # @brief Attach to the barrier (participant)
+  #
+  # Since the current start sequence is written as the done sequence
+  # before attaching, the driver never waits for the party in the
+  # cycle of attaching.
+  #
+  # @param index Index of the party
+  # @return Current start sequence
+  #
+  # @endif
+  def attach(self, index):
+    offset_ = self.HEADER_SIZE + self.PARTY_SIZE * index
+    seq_ = self.get(self._START)
+    self.set(offset_ + 8, seq_)
+    self.set(offset_, 1)
+    return seq_
+
+
+  ##
+  # @if jp
+  # @brief バリアから離脱する (参加側)
+  # @param index 参加者番号
+  # @else
+  # @brief Detach from the barrier (participant)
+  # @param index Index of the party
+  # @endif
+  def detach(self, index):
+    self.set(self.HEADER_SIZE + self.PARTY_SIZE * index, 0)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 次の周期の開始を待つ (参加側)
+  #
+  # @param seq 前回処理した開始番号
+  # @param timeout タイムアウト [s]
+  # @return 新しい開始番号。終了通知またはタイムアウトの場合 None
+  #
+  # @else
+  # @brief Wait for the start of the next cycle (participant)
+  #
+  # @param seq Start sequence processed last time
+  # @param timeout Timeout [s]
+  # @return New start sequence. None on termination or timeout
+  #
+  # @endif
+  def wait(self, seq, timeout):
+    deadline_ = OpenRTM_aist.monotonic_ns() + int(timeout * OpenRTM_aist.nsec_per_sec)
+    count_ = 0
+    while True:
+      if self.isTerminated():
+        return None
+      seq_ = self.get(self._START)
+      if seq_ > seq:
+        return seq_
+      count_ = self.pause(count_)
+      if count_ > self.SPIN_COUNT and OpenRTM_aist.monotonic_ns() > deadline_:
+        return None
+
+
+  ##
+  # @if jp
+  # @brief 周期の完了を通知する (参加側)
+  # @param index 参加者番号
+  # @param seq 完了した開始番号
+  # @else
+  # @brief Notify completion of the cycle (participant)
+  # @param index Index of the party
+  # @param seq Completed start sequence
+  # @endif
+  def done(self, index, seq):
+    self.set(self.HEADER_SIZE + self.PARTY_SIZE * index + 8, seq)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ポーリングの間隔だけ待機する
+  #
+  # SPIN_COUNT 回までは他のスレッドに実行を譲るのみとし、それ以降は
+  # POLL_INTERVAL から MAX_POLL_INTERVAL まで倍々に延ばした時間スリー
+  # プする。
+  #
+  # @param count これまでの待機回数
+  # @return 待機回数
+  #
+  # @else
+  # @brief Sleep for the polling interval
+  #
+  # Up to SPIN_COUNT times this only yields to other threads. After
+  # that it sleeps for an interval doubled from POLL_INTERVAL up to
+  # MAX_POLL_INTERVAL.
+  #
+  # @param count Number of waits so far
+  # @return Number of waits
+  #
+  # @endif
+  def pause(self, count):
+    if count < self.SPIN_COUNT:
+      time.sleep(0)
+    else:
+      shift_ = min(count - self.SPIN_COUNT, 16)
+      time.sleep(min(self.POLL_INTERVAL * (1 << shift_),
+                     self.MAX_POLL_INTERVAL))
+    return count + 1
@@ -188,6 +188,159 @@ class SimulatorExecutionContext(OpenRTM_aist.OpenHRPExecutionContext):
     return RTC.RTC_ERROR
 
 
+  ##
+  # @if jp
+  # @brief ꥹƥå׿ʤ
+  #
+  # n 1ξ OpenHRPExecutionContext.tick() ƱưȤʤ롣
+  # n 2ʾξ step_sync(n) Ʊͤ˸ƤӽФΥåɤǼ
+  # Եʤ˼¹Ԥ롣CORBAͳθƤӽФǤ n Ͼ1Ȥʤ롣
+  #
+  # @param self
+  # @param n ƥå׿
+  #
+  # @else
+  # @brief Move forward the given number of steps
+  #
+  # When n is 1, this behaves as OpenHRPExecutionContext.tick(). When
+  # n is 2 or more, the steps are executed on the calling thread
+  # without waiting for the period, as step_sync(n). Calls through
+  # CORBA always use n = 1.
+  #
+  # @param self
+  # @param n Number of steps
+  #
+  # @endif
+  #
+  def tick(self, n=1):
+    if n == 1:
+      OpenRTM_aist.OpenHRPExecutionContext.tick(self)
+    else:
+      self.step_sync(n)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ꥹƥå׿ʤᡢ̤֤
+  #
+  # ƤӽФΥåɤǡԵ䥹åɤڤؤʤ n
+  # ʬνϢ³Ƽ¹Ԥ롣ե饤Υߥ졼
+  # ֤®ʤ˻Ѥ롣¹ tick() Ʊͤ
+  # activate_component() ξܤԤ롣
+  #
+  # @param self
+  # @param n ƥå׿
+  # @param stop_on_error True ξ硢ERROR֤RTC¸ߤ
+  #                      ¹ԤǤ
+  # @return StepResult
+  #
+  # @else
+  # @brief Move forward the given number of steps and return the result
+  #
+  # n cycles are executed successively on the calling thread without
+  # waiting for the period and without thread switching. This is used
+  # to run an offline simulation faster than real time. Like tick(),
+  # state transitions such as activate_component() wait during the
+  # execution.
+  #
+  # @param self
+  # @param n Number of steps
+  # @param stop_on_error If True, the execution stops as soon as an
+  #                      RTC is in ERROR state
+  # @return StepResult
+  #
+  # @endif
+  #
+  def step_sync(self, n=1, stop_on_error=False):
+    self._rtcout.RTC_TRACE("step_sync(%d)", n)
+    result_ = self.StepResult()
+    if not self.isRunning():
+      result_.ret = RTC.PRECONDITION_NOT_MET
+      return result_
+
+    guard = OpenRTM_aist.ScopedLock(self._tickmutex)
+    worker_ = self._worker
+    clock_ = OpenRTM_aist.monotonic_ns
+    start_ = clock_()
+    prev_ = start_
+    for i in range(n):
+      worker_.invokeWorkerPreDo()
+      worker_.invokeWorkerDo()
+      worker_.invokeWorkerPostDo()
+      now_ = clock_()
+      result_.record(now_ - prev_)
+      prev_ = now_
+      if stop_on_error and worker_.isOneOfCurrentState(RTC.ERROR_STATE):
+        break
+
+    result_.elapsed = prev_ - start_
+    for comp in worker_.getComponentList():
+      if comp.isCurrentState(RTC.ERROR_STATE):
+        result_.errors.append(comp.getRTObject())
+    del guard
+
+    if result_.errors:
+      result_.ret = RTC.RTC_ERROR
+    self._rtcout.RTC_DEBUG("%d steps in %d [ns], %d RTCs in ERROR state.",
+                           (result_.steps, result_.elapsed, len(result_.errors)))
+    return result_
+
+
+  ##
+  # @if jp
+  # @class StepResult
+  # @brief step_sync() μ¹Է
+  #
+  # - ret: ERROR֤RTCʤ RTC_OK RTC_ERROR¹
+  #        ƥȤξ PRECONDITION_NOT_MET
+  # - steps: ¹Ԥƥå׿
+  # - errors: λERROR֤RTCΥꥹ
+  # - elapsed: Τμ¹Ի [ns]
+  # - min, max: 1ƥåפκǾ¹Ի [ns]
+  #
+  # @else
+  # @class StepResult
+  # @brief Result of step_sync()
+  #
+  # - ret: RTC_OK if no RTC is in ERROR state, RTC_ERROR otherwise,
+  #        PRECONDITION_NOT_MET if the context is not running
+  # - steps: Number of executed steps
+  # - errors: List of the RTCs in ERROR state at the end
+  # - elapsed: Total execution time [ns]
+  # - min, max: Minimum and maximum execution time of a step [ns]
+  #
+  # @endif
+  class StepResult:
+    def __init__(self):
+      self.ret = RTC.RTC_OK
+      self.steps = 0
+      self.errors = []
+      self.elapsed = 0
+      self.min = 0
+      self.max = 0
+      return
+
+    def record(self, ns):
+      if self.steps == 0 or ns < self.min:
+        self.min = ns
+      if ns > self.max:
+        self.max = ns
+      self.steps += 1
+      return
+
+    ##
+    # @if jp
+    # @brief 1ƥåפʿѼ¹Ի [ns]
+    # @else
+    # @brief Average execution time of a step [ns]
+    # @endif
+    def mean(self):
+      if self.steps == 0:
+        return 0.0
+      return float(self.elapsed) / self.steps
+
+
 ##
 # @if jp
 # @brief ECFactoryؤϿΤνؿ
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file SpecExtractor.py
+# @brief Static extraction of the profile of RT-Component modules
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import os
+import sys
+import ast
+
+
+##
+# @if jp
+# @brief モジュールの *_spec の変数名を取得する
+#
+# ファイル名から拡張子を除いて小文字にした名前に _spec を付けた名前
+# を返す。
+#
+# @param file_name モジュールのパス
+# @return 変数名
+#
+# @else
+# @brief Get the variable name of *_spec of a module
+#
+# The file name without the extension is lowercased and _spec is
+# appended.
+#
+# @param file_name Path of the module
+# @return Variable name
+#
+# @endif
+def getSpecName(file_name):
+  return os.path.basename(file_name).split(".")[0].lower() + "_spec"
+
+
+##
+# @if jp
+# @brief *_spec をモジュールを実行せずに取得する
+#
+# モジュールのソースを ast で解析し、モジュールのトップレベルで一度
+# だけ代入されている *_spec の値を ast.literal_eval() で評価する。以
+# 下の場合は、インポートしなければ値が決まらないため None を返す。
+#
+# - トップレベルの単純な代入がない (if 文の中、import など)
+# - 値がリテラルではない (変数、関数呼び出し、連結など)
+# - 他の場所で代入、削除、import、要素の変更、メソッドの呼び出しなどが
+#   ある
+# - ファイルを読めない、構文解析できない
+#
+# @param file_name モジュールのパス
+# @param spec_name 変数名。省略した場合はファイル名から求める
+# @return *_spec の値。静的に取得できない場合は None
+#
+# @else
+# @brief Get *_spec without executing the module
+#
+# The source of the module is parsed by ast, and the value of *_spec
+# assigned only once at the top level of the module is evaluated by
+# ast.literal_eval(). None is returned in the following cases since the
+# value cannot be determined without importing.
+#
+# - There is no simple assignment at the top level (in an if
+#   statement, by import, etc.)
+# - The value is not a literal (a variable, a function call, a
+#   concatenation, etc.)
+# - It is assigned, deleted, rebound by import, has its items modified
+#   or its methods called elsewhere
+# - The file cannot be read or parsed
+#
+# @param file_name Path of the module
+# @param spec_name Variable name. Obtained from the file name if omitted
+# @return Value of *_spec. None if it cannot be obtained statically
+#
+# @endif
+def extractSpec(file_name, spec_name=None):
+  if spec_name is None:
+    spec_name = getSpecName(file_name)
+
+  try:
+    with open(file_name, "rb") as f:
+      tree_ = ast.parse(f.read(), file_name)
+  except (IOError, OSError, SyntaxError, ValueError, TypeError):
+    return None
+
+  value_ = None
+  targets_ = []
+  for node_ in tree_.body:
+    if isinstance(node_, ast.Assign) and len(node_.targets) == 1 and \
+          isinstance(node_.targets[0], ast.Name) and \
+          node_.targets[0].id == spec_name:
+      value_ = node_.value
+      targets_.append(node_.targets[0])
+
+  if len(targets_) != 1:
+    return None
+
+  for node_ in ast.walk(tree_):
+    if isinstance(node_, ast.Name) and node_.id == spec_name:
+      if not isinstance(node_.ctx, ast.Load) and node_ is not targets_[0]:
+        return None
+    elif isinstance(node_, (ast.Attribute, ast.Subscript)):
+      if isinstance(node_.value, ast.Name) and node_.value.id == spec_name:
+        return None
+    elif isinstance(node_, ast.Global):
+      if spec_name in node_.names:
+        return None
+    elif isinstance(node_, (ast.Import, ast.ImportFrom)):
+      for alias_ in node_.names:
+        if (alias_.asname or alias_.name.split(".")[0]) == spec_name:
+          return None
+
+  try:
+    return ast.literal_eval(value_)
+  except (ValueError, TypeError, SyntaxError):
+    return None
+
+
+##
+# @if jp
+# @brief モジュールをインポートして *_spec を取得する
+#
+# モジュールのディレクトリを sys.path に追加してインポートする。
+#
+# @param file_name モジュールのパス
+# @param spec_name 変数名。省略した場合はファイル名から求める
+# @return *_spec の値。定義されていない場合は None
+#
+# @exception Exception インポートに失敗した場合
+#
+# @else
+# @brief Get *_spec by importing the module
+#
+# The directory of the module is added to sys.path and the module is
+# imported.
+#
+# @param file_name Path of the module
+# @param spec_name Variable name. Obtained from the file name if omitted
+# @return Value of *_spec. None if not defined
+#
+# @exception Exception Importing failed
+#
+# @endif
+def importSpec(file_name, spec_name=None):
+  if spec_name is None:
+    spec_name = getSpecName(file_name)
+  dirname_ = os.path.dirname(file_name)
+  if dirname_ not in sys.path:
+    sys.path.append(dirname_)
+  mod_ = __import__(os.path.basename(file_name).split(".")[0])
+  return getattr(mod_, spec_name, None)
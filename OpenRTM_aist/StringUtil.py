@@ -544,11 +544,72 @@ def _stringToList(_type, _str):
   return True
 
 
+##
+# @if jp
+# @brief Ϳ줿ʸ NumPy Ѵ
+#
+# Ѵ dtype ǡ,ޤ϶Ƕڤ줿ͤ礷
+# Ѵ롣Ѵ¿ξϡƬʳμη
+# Ĥ褦ѷ롣
+#
+# ʸ󤬎.npyǽϡΥѥ NumPy Хʥե
+# ɤ߹ߡѴ dtype Ѵ롣ξηϥեη
+# Ȥʤ롣
+#
+#  (ưʣǿ) ΤѴǤ롣
+#
+# @param _type Ѵ
+# @param _str Ѵʸ
+#
+# @return Ѵ
+#
+# @else
+# @brief Convert the given string to a NumPy array
+#
+# The numbers separated by "," or white spaces are converted at once
+# with the dtype of the destination array. If the destination array
+# is multidimensional, the result is reshaped to keep the shape of
+# the dimensions other than the first one.
+#
+# If the string ends with ".npy", the NumPy binary file of the path
+# is loaded and converted to the dtype of the destination array. The
+# shape is the one of the file in this case.
+#
+# Only arrays of numbers (integer, floating point and complex) can be
+# converted.
+#
+# @param _type The destination array
+# @param _str The source string
+#
+# @return Result of the conversion
+#
+# @endif
+def _stringToArray(_type, _str):
+  import numpy
+  dtype_ = _type[0].dtype
+  if dtype_.kind not in "iufc":
+    return False
+
+  str_ = _str.strip()
+  if str_.lower().endswith(".npy"):
+    array_ = numpy.load(str_, allow_pickle=False)
+    if array_.dtype != dtype_:
+      array_ = array_.astype(dtype_, casting="same_kind")
+  else:
+    array_ = numpy.array(str_.replace(",", " ").split(), dtype=dtype_)
+    if _type[0].ndim > 1:
+      array_ = array_.reshape((-1,) + _type[0].shape[1:])
+
+  _type[0] = array_
+  return True
+
+
 ##
 # @if jp
 # @brief Ϳ줿ʸ򥪥֥ȤѴ
 #
 # Ϳ줿ʸꤵ줿֥ȤѴ롣
+# Ѵ褬 NumPy ξ _stringToArray() Ѵ롣
 #
 # @param _type Ѵ襪֥
 # @param _str Ѵʸ
@@ -577,6 +638,11 @@ def stringTo(_type, _str):
     elif type(_type[0]) == str:
       _type[0] = str(_str)
       return True
+    else:
+      # An ndarray can only be given when numpy is already loaded.
+      numpy = sys.modules.get("numpy")
+      if numpy is not None and isinstance(_type[0], numpy.ndarray):
+        return _stringToArray(_type, _str)
 
   #except ValueError:
   #  return False
@@ -17,6 +17,8 @@
 
 import threading
 
+import OpenRTM_aist
+
 class Task:
   def __init__(self):
     self._count = 0
@@ -77,6 +79,10 @@ class Task:
     return
 
   def svc_run(self):
-    self.svc()
+    OpenRTM_aist.registerThread(self.__class__.__name__)
+    try:
+      self.svc()
+    finally:
+      OpenRTM_aist.unregisterThread()
     self.finalize()
     return
@@ -23,6 +23,7 @@ import sys
 import time
 import math
 import os
+from array import array
 
 import OpenRTM_aist
 
@@ -37,6 +38,103 @@ if sys.version_info[0] == 3:
 # @else
 # @endif
 usec_per_sec = 1000000
+nsec_per_sec = 1000000000
+
+
+##
+# @if jp
+# @brief ñĴååθͤ [ns]
+#
+# ƥѹ (NTPˤ) αƶʤå
+# ʥñ̤֤time.monotonic_ns() ѤǤʤĶ
+# Ǥ time.monotonic()ˤ̵ time.time() Ѥ
+# 롣ͤͤˤϰ̣ʤʬΤߤͭǤ롣
+#
+# @return ñĴåå [ns]
+#
+# @else
+# @brief Get the current value of the monotonic clock [ns]
+#
+# This function returns the value of a clock which is not affected
+# by system time changes (e.g. NTP adjustment) as an integer in
+# nanoseconds. If time.monotonic_ns() is not available,
+# time.monotonic() or time.time() is used instead. Only the
+# difference between two values is meaningful.
+#
+# @return Value of the monotonic clock [ns]
+#
+# @endif
+if hasattr(time, "monotonic_ns"):
+  monotonic_ns = time.monotonic_ns
+elif hasattr(time, "monotonic"):
+  def monotonic_ns():
+    return long(time.monotonic() * nsec_per_sec)
+else:
+  def monotonic_ns():
+    return long(time.time() * nsec_per_sec)
+
+
+##
+# @if jp
+# @brief ʬǽåθͤ [ns]
+#
+# ֤η¬˻Ѥ롣time.perf_counter_ns() ѤǤʤ
+# Ǥ time.perf_counter()ˤ̵ monotonic_ns()
+# Ѥ롣ͤͤˤϰ̣ʤʬΤߤͭǤ롣
+#
+# @return ʬǽå [ns]
+#
+# @else
+# @brief Get the current value of the high resolution clock [ns]
+#
+# This is used to measure execution times. If time.perf_counter_ns()
+# is not available, time.perf_counter() or monotonic_ns() is used
+# instead. Only the difference between two values is meaningful.
+#
+# @return Value of the high resolution clock [ns]
+#
+# @endif
+if hasattr(time, "perf_counter_ns"):
+  perf_counter_ns = time.perf_counter_ns
+elif hasattr(time, "perf_counter"):
+  def perf_counter_ns():
+    return long(time.perf_counter() * nsec_per_sec)
+else:
+  perf_counter_ns = monotonic_ns
+
+
+##
+# @if jp
+# @brief ƥθͤ [ns]
+#
+# 1970ǯ11ηв֤ʥñ̤֤
+# time.time_ns() ѤǤʤĶǤ time.time() Ѥ롣
+#
+# @return ƥ [ns]
+#
+# @else
+# @brief Get the current system time [ns]
+#
+# This function returns the time since the epoch as an integer in
+# nanoseconds. If time.time_ns() is not available, time.time() is
+# used instead.
+#
+# @return System time [ns]
+#
+# @endif
+if hasattr(time, "time_ns"):
+  time_ns = time.time_ns
+else:
+  def time_ns():
+    return long(time.time() * nsec_per_sec)
+
+
+# array('q') is not available before Python 3.3
+try:
+  array('q')
+  RECORD_TYPECODE = 'q'
+except ValueError:
+  RECORD_TYPECODE = 'd'
 
 ##
 # @if jp
@@ -50,9 +148,10 @@ usec_per_sec = 1000000
 # @else
 # 
 # @endif
-class Time:
+class Time(object):
   """
   """
+  __slots__ = ("sec", "usec")
 
   ##
   # @if jp
@@ -72,11 +171,7 @@ class Time:
   # @endif
   def __init__(self):
     global usec_per_sec
-    tm = time.time()
-    tm_f       = float(tm - long(tm))     # μФ
-    self.sec   = long(tm - tm_f)   # μФ
-    self.usec  = long(float(tm_f) * float(usec_per_sec)) # sec -> usec (micro second)
-    self._timevalue = OpenRTM_aist.TimeValue(self.sec,self.usec)
+    self.sec, self.usec = divmod(time_ns() // 1000, usec_per_sec)
     return
 
   ##
@@ -118,12 +213,7 @@ class Time:
     
   def gettimeofday(self):
     global usec_per_sec
-
-      
-    tm = time.time()
-    tm_f       = float(tm - long(tm))     # μФ
-    self.sec   = long(float(tm) - float(tm_f))   # μФ
-    self.usec  = long(float(tm_f) * float(usec_per_sec)) # sec -> usec (micro second)
+    self.sec, self.usec = divmod(time_ns() // 1000, usec_per_sec)
     return OpenRTM_aist.TimeValue(self.sec, self.usec)
 
 
@@ -187,9 +277,15 @@ class Time:
 # Using get_stat you can get maximum, minimum, mean and standard
 # deviation time for code execution.
 #
+# Intervals are measured by perf_counter_ns() and kept in nanoseconds
+# in a ring buffer of array('q'), so that tick() and tack() do not
+# allocate objects and the measurement can stay enabled in EC and
+# publisher threads.
+#
 class TimeMeasure:
   """
   """
+  PERCENTILES = (50.0, 90.0, 99.0)
 
   ##
   # @brief Time statictics object for profiling.
@@ -198,12 +294,12 @@ class TimeMeasure:
   #
   def __init__(self, buflen=100):
     self._countMax = buflen + 1
-    self._record = [OpenRTM_aist.TimeValue(0, 0) for i in range(self._countMax)]
-    self._begin  = Time().gettimeofday()
-    self._end  = Time().gettimeofday()
+    self._record = array(RECORD_TYPECODE, [0]) * self._countMax
+    self._begin  = perf_counter_ns()
+    self._end  = self._begin
     self._count = 0
     self._recurred = False
-    self._interval = OpenRTM_aist.TimeValue(0.0)
+    self._interval = 0
     return
 
   ##
@@ -212,7 +308,7 @@ class TimeMeasure:
   # Begin time measurement for time statistics
   #
   def tick(self):
-    self._begin = Time().gettimeofday()
+    self._begin = perf_counter_ns()
     return
 
   ##
@@ -221,11 +317,11 @@ class TimeMeasure:
   # End of time measurement for time statistics
   #
   def tack(self):
-    if self._begin.sec() == 0:
+    if self._begin is None:
       return
 
-    self._interval = Time().gettimeofday() - self._begin
-    self._end = Time().gettimeofday()
+    self._end = perf_counter_ns()
+    self._interval = self._end - self._begin
     self._record[self._count] = self._interval
     self._count += 1
     if self._count == self._countMax:
@@ -233,14 +329,24 @@ class TimeMeasure:
       self._recurred = True
     return
 
+  ##
+  # @brief Get the last interval as TimeValue.
+  #
   def interval(self):
+    return OpenRTM_aist.TimeValue(self._interval // nsec_per_sec,
+                                  (self._interval % nsec_per_sec) // 1000)
+
+  ##
+  # @brief Get the last interval [ns].
+  #
+  def intervalNs(self):
     return self._interval
 
 
   def reset(self):
     self._count = 0
     self._recurred = False
-    self._begin = OpenRTM_aist.TimeValue(0.0)
+    self._begin = None
     return
     
   ##
@@ -257,10 +363,23 @@ class TimeMeasure:
       return self._count
 
     
+  ##
+  # @brief Get the recorded intervals [ns].
+  #
+  # The intervals in the buffer are returned as an array. The order
+  # is not guaranteed after the buffer has wrapped around.
+  #
+  def getRecords(self):
+    return self._record[:self.count()]
+
   ##
   # @brief Get total statistics.
   # Get total statistics
-  # max_interval, min_interval, mean_interval [ns]
+  # max_interval, min_interval, mean_interval [s]
+  #
+  # If called without arguments, a Statistics object is returned
+  # which also has the percentiles of PERCENTILES and a TimeHistogram
+  # of the intervals in the buffer.
   #
   def getStatistics(self, max_interval=None, min_interval=None,
                     mean_interval=None, stddev=None):
@@ -273,38 +392,45 @@ class TimeMeasure:
       stdd   = [0.0]
       
       self.getStatistics(max_i, min_i, mean_i, stdd)
-      return self.Statistics(max_i[0], min_i[0], mean_i[0], stdd[0])
+      stat_ = self.Statistics(max_i[0], min_i[0], mean_i[0], stdd[0])
+
+      records_ = sorted(self.getRecords())
+      hist_ = TimeHistogram()
+      for ns_ in records_:
+        hist_.record(int(ns_))
+      stat_._histogram = hist_
+      stat_._records = records_
+      for p_ in self.PERCENTILES:
+        stat_.percentile(p_)
+      return stat_
 
     max_interval[0] = 0.0
     min_interval[0] = ULLONG_MAX
 
-    sum_ = 0.0
-    sq_sum_ = 0.0
     len_ = self.count()
         
     if len_ == 0:
       return False
 
-    for i in range(len_):
-      trecord_ = self._record[i].toDouble()
-      sum_ += trecord_
-      sq_sum_ += (trecord_ * trecord_)
-      
-      if trecord_ > max_interval[0]:
-        max_interval[0] = trecord_
-            
-      if trecord_ < min_interval[0]:
-        min_interval[0] = trecord_
-            
-                
-    mean_interval[0] = sum_ / len_
-    stddev[0] = math.sqrt(sq_sum_ / len_ - (mean_interval[0] * mean_interval[0]))
+    records_ = self._record[:len_]
+    sum_ = sum(records_)
+    sq_sum_ = sum([r * r for r in records_])
+    sec_ = float(nsec_per_sec)
+
+    max_interval[0] = max(records_) / sec_
+    min_interval[0] = min(records_) / sec_
+    mean_interval[0] = sum_ / sec_ / len_
+    var_ = float(sq_sum_ * len_ - sum_ * sum_) / (len_ * len_)
+    stddev[0] = math.sqrt(max(var_, 0.0)) / sec_
 
     return True
         
 
   class Statistics:
     def __init__(self, max=None, min=None, mean=None, stdd=None):
+      self._percentiles = {}
+      self._records = []
+      self._histogram = None
       if not max and not min and not mean and not stdd:
         self._max_interval  = 0.0
         self._min_interval  = 0.0
@@ -317,3 +443,223 @@ class TimeMeasure:
       self._mean_interval = mean
       self._std_deviation = stdd
       return
+
+    ##
+    # @brief Get a percentile [s].
+    #
+    # The percentiles of TimeMeasure.PERCENTILES are computed by
+    # getStatistics(). The others are computed from the intervals
+    # in the buffer when requested.
+    #
+    def percentile(self, p):
+      p_ = float(p)
+      if p_ not in self._percentiles:
+        self._percentiles[p_] = percentileOf(self._records, p_) / float(nsec_per_sec)
+      return self._percentiles[p_]
+
+    ##
+    # @brief Get the TimeHistogram of the intervals [ns].
+    #
+    def histogram(self):
+      return self._histogram
+
+
+##
+# @if jp
+# @brief 󤵤줿ͤɴʬ̿
+#
+# Ƕ˵ˡˤ롣
+#
+# @param values 󤵤줿ͤΥ
+# @param p ɴʬΨ (0.0 - 100.0)
+# @return ɴʬ̿ͤʤ 0
+#
+# @else
+# @brief Get a percentile of sorted values
+#
+# The nearest-rank method is used.
+#
+# @param values Sequence of values sorted in ascending order
+# @param p Percentage (0.0 - 100.0)
+# @return Percentile. 0 if there is no value
+#
+# @endif
+def percentileOf(values, p):
+  if not values:
+    return 0
+  rank_ = int(math.ceil(len(values) * p / 100.0))
+  return values[min(max(rank_, 1), len(values)) - 1]
+
+
+##
+# @if jp
+# @class TimeHistogram
+# @brief пθХåȤˤ֥ҥȥ
+#
+# ¬ [ns] пΥХåȤ˿ʬƵϿ롣 2
+# Τ٤֤򤵤 8 ĤΥХåȤʬ䤹뤿ᡢɴʬ̿Ϻ
+# 12.5% θǵ롣Ͽ O(1) ǥݤȼʤ
+# 1us ̤ͤϺǽΥХåȤˡ¤ĶͤϺǸΥХåȤ
+# Ͽ롣
+#
+# @since 2.0.0
+#
+# @else
+# @class TimeHistogram
+# @brief Time histogram with fixed log-scale buckets
+#
+# This class records measured times [ns] into log-scale buckets.
+# Each power-of-two range is divided into 8 buckets, so percentiles
+# are obtained with an error of at most 12.5%. Recording is O(1) and
+# does not allocate memory. Values below 1us are recorded in the
+# first bucket, and values beyond the upper limit in the last one.
+#
+# @since 2.0.0
+#
+# @endif
+class TimeHistogram:
+  """
+  """
+  SUB_BITS = 3
+  MIN_BITS = 10
+  MAX_BITS = 40
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  # @else
+  # @brief Constructor
+  # @endif
+  def __init__(self):
+    self._nsub = 1 << self.SUB_BITS
+    self._buckets = [0] * ((self.MAX_BITS - self.MIN_BITS) * self._nsub + 1)
+    self._count = 0
+    self._max = 0
+    self._sum = 0
+    return
+
+  ##
+  # @if jp
+  # @brief ¬֤Ͽ
+  # @param self
+  # @param ns ¬ [ns]
+  # @else
+  # @brief Record a measured time
+  # @param self
+  # @param ns Measured time [ns]
+  # @endif
+  def record(self, ns):
+    bits_ = int(ns).bit_length()
+    if bits_ <= self.MIN_BITS:
+      idx_ = 0
+    elif bits_ > self.MAX_BITS:
+      idx_ = len(self._buckets) - 1
+    else:
+      shift_ = bits_ - 1 - self.SUB_BITS
+      idx_ = (bits_ - self.MIN_BITS - 1) * self._nsub + \
+             (ns >> shift_) - self._nsub + 1
+    self._buckets[idx_] += 1
+    self._count += 1
+    self._sum += ns
+    if ns > self._max:
+      self._max = ns
+    return
+
+  ##
+  # @if jp
+  # @brief Ͽ򥯥ꥢ
+  # @else
+  # @brief Clear the records
+  # @endif
+  def reset(self):
+    self._buckets = [0] * len(self._buckets)
+    self._count = 0
+    self._max = 0
+    self._sum = 0
+    return
+
+  ##
+  # @if jp
+  # @brief Ͽ
+  # @else
+  # @brief Get the number of records
+  # @endif
+  def count(self):
+    return self._count
+
+  ##
+  # @if jp
+  # @brief ͤ [ns]
+  # @else
+  # @brief Get the maximum value [ns]
+  # @endif
+  def max(self):
+    return self._max
+
+  ##
+  # @if jp
+  # @brief ʿͤ [ns]
+  # @else
+  # @brief Get the mean value [ns]
+  # @endif
+  def mean(self):
+    if self._count == 0:
+      return 0
+    return self._sum // self._count
+
+  ##
+  # @if jp
+  # @brief ɴʬ̿ [ns]
+  #
+  # ХåȤξ֤ͤͤĶ뤳ȤϤʤ
+  #
+  # @param self
+  # @param p ɴʬΨ (0.0 - 100.0)
+  # @return ɴʬ̿ [ns]Ͽʤ 0
+  #
+  # @else
+  # @brief Get a percentile [ns]
+  #
+  # The upper bound of the corresponding bucket is returned, but it
+  # never exceeds the maximum value.
+  #
+  # @param self
+  # @param p Percentage (0.0 - 100.0)
+  # @return Percentile [ns]. 0 if nothing is recorded
+  #
+  # @endif
+  def percentile(self, p):
+    if self._count == 0:
+      return 0
+    rank_ = self._count * p / 100.0
+    acc_ = 0
+    for idx_, n_ in enumerate(self._buckets):
+      acc_ += n_
+      if n_ and acc_ >= rank_:
+        return min(self.upperBound(idx_), self._max)
+    return self._max
+
+  ##
+  # @if jp
+  # @brief ХåȤξͤ [ns]
+  # @else
+  # @brief Get the upper bound of a bucket [ns]
+  # @endif
+  def upperBound(self, idx):
+    if idx == 0:
+      return 1 << self.MIN_BITS
+    bits_ = (idx - 1) // self._nsub + self.MIN_BITS + 1
+    sub_ = (idx - 1) % self._nsub
+    shift_ = bits_ - 1 - self.SUB_BITS
+    return (self._nsub + sub_ + 1) << shift_
+
+  ##
+  # @if jp
+  # @brief ХåȤȤεϿ
+  # @return (ХåȤξ [ns], Ͽ) Υꥹ
+  # @else
+  # @brief Get the number of records of each bucket
+  # @return List of (upper bound of the bucket [ns], count)
+  # @endif
+  def buckets(self):
+    return [(self.upperBound(i), n) for i, n in enumerate(self._buckets) if n]
@@ -36,9 +36,10 @@ if sys.version_info[0] == 3:
 # @else
 #
 # @endif
-class TimeValue:
+class TimeValue(object):
   """
   """
+  __slots__ = ("tv_sec", "tv_usec")
 
 
 
@@ -213,6 +214,42 @@ class TimeValue:
     return float(self.tv_sec) + float(self.tv_usec / float(TIMEVALUE_ONE_SECOND_IN_USECS))
 
 
+  ##
+  # @if jp
+  # @brief ͤʥäǼ
+  # @else
+  # @brief Get the time value as an integer in nanoseconds
+  # @endif
+  def toNsec(self):
+    return (self.tv_sec * TIMEVALUE_ONE_SECOND_IN_USECS + self.tv_usec) * 1000
+
+
+  ##
+  # @if jp
+  # @brief ʥä TimeValue 
+  #
+  # ޥ̤ڤΤƤ롣
+  #
+  # @param ns  [ns]
+  # @return TimeValue
+  #
+  # @else
+  # @brief Create a TimeValue from an integer in nanoseconds
+  #
+  # The fraction below a microsecond is truncated.
+  #
+  # @param ns Time value [ns]
+  # @return TimeValue
+  #
+  # @endif
+  def fromNsec(ns):
+    tm = TimeValue()
+    tm.tv_sec, tm.tv_usec = divmod(long(ns) // 1000, TIMEVALUE_ONE_SECOND_IN_USECS)
+    tm.normalize()
+    return tm
+  fromNsec = staticmethod(fromNsec)
+
+
   ##
   # @if jp
   # @brief ֤Ϥ
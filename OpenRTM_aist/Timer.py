@@ -15,29 +15,71 @@
 #     All rights reserved.
 
 
-import time
+import heapq
 import threading
 
 import OpenRTM_aist
 
 
+##
+# @if jp
+# @brief TimeValue ʥäѴ
+# @else
+# @brief Convert a TimeValue to nanoseconds
+# @endif
+def timeValueToNsec(tm):
+  return tm.sec() * OpenRTM_aist.nsec_per_sec + tm.usec() * 1000
+
+
+##
+# @if jp
+# @brief ꥹʡϿ륭
+#
+# ꥹʡ __eq__ ƤƤ褤褦ˡ֥ȤƱ
+# 򥭡Ȥ롣
+#
+# @else
+# @brief Get the key to register a listener
+#
+# The identity of the object is used as the key so that listeners may
+# define __eq__.
+#
+# @endif
+def listenerKey(listener):
+  return id(listener)
+
+
 ##
 # @if jp
 # @class Timer
 # @brief Timer饹
-# 
+#
 # Ͽ줿ꥹʡΥХåؿꤵ줿Ū˸ƤӽФ
 #
+# ƥꥹʡμưñĴååΥǥåɥ饤Ȥ
+# ҡפǴǤᤤǥåɥ饤ޤǾѿԵ롣ꥹ
+# ʡϿϿ O(log n) ǹԤ졢ư٤ϥ
+# ư˰¸ʤ޵ưϥꥹʡưβ¤Ȥ
+# ƻѤ롣
+#
 # @since 0.4.0
 #
 # @else
 #
 # @class Timer
 # @brief Timer class
-# 
+#
 # Invoke the callback function of registered listener periodically
 # at the set cycle.
 #
+# The next invocation time of each listener is kept in a heap as a
+# deadline on the monotonic clock, and the timer thread waits on a
+# condition variable until the earliest deadline. Registration and
+# unregistration of listeners take O(log n), and the precision of the
+# invocation does not depend on the interval of the timer. The
+# interval of the timer is used as the lower limit of the invocation
+# interval of listeners.
+#
 # @since 0.4.0
 #
 # @endif
@@ -48,7 +90,7 @@ class Timer:
   ##
   # @if jp
   # @brief 󥹥ȥ饯
-  # 
+  #
   # 󥹥ȥ饯
   #
   # @param self
@@ -57,7 +99,7 @@ class Timer:
   # @else
   #
   # @brief Constructor
-  # 
+  #
   # Constructor
   #
   # @param interval The interval of timer
@@ -67,26 +109,30 @@ class Timer:
     self._interval = interval
     self._running  = False
     self._runningMutex = threading.RLock()
-    self._tasks = []
+    self._tasks = {}
+    self._heap = []
+    self._seq = 0
     self._taskMutex = threading.RLock()
+    self._cond = threading.Condition(self._taskMutex)
     self._thread = threading.Thread(target=self.run)
     return
 
   ##
   # @if jp
   # @brief ǥȥ饯
-  # 
+  #
   # ǥȥ饯
   #
   # @else
   # @brief Destructor
-  # 
+  #
   # Destructor
   #
   # @endif
   #
   def __del__(self):
     self._running = False
+    self.notify()
 
     self.join()
 
@@ -106,7 +152,8 @@ class Timer:
   # @brief Timer ѤΥåɼ¹Դؿ
   #
   # Timer ѤΥåɼ¹Դؿ
-  # Ͽ줿ꥹʡΥХåؿƤӽФ
+  # Ǥᤤǥåɥ饤ޤԵϿ줿ꥹʡΥХå
+  # ؿƤӽФ
   #
   # @return ¹Է
   #
@@ -114,7 +161,8 @@ class Timer:
   # @brief Thread execution function for Timer
   #
   # Thread execution function for Timer.
-  # Invoke the callback function of registered listener.
+  # Wait until the earliest deadline and invoke the callback function
+  # of registered listener.
   #
   # @return Execution result
   #
@@ -122,10 +170,6 @@ class Timer:
   def run(self):
     while self._running:
       self.invoke()
-      if self._interval.tv_sec != 0:
-        time.sleep(self._interval.tv_sec)
-      elif self._interval.tv_usec:
-        time.sleep(self._interval.tv_usec/1000000.0)
     return 0
 
 
@@ -148,6 +192,8 @@ class Timer:
     guard = OpenRTM_aist.ScopedLock(self._runningMutex)
     if not self._running:
       self._running = True
+      if self._thread.ident is not None:
+        self._thread = threading.Thread(target=self.run)
       self._thread.start()
     return
 
@@ -171,6 +217,7 @@ class Timer:
     guard = OpenRTM_aist.ScopedLock(self._runningMutex)
     if self._running:
       self._running = False
+      self.notify()
       self.join()
     return
 
@@ -181,28 +228,93 @@ class Timer:
   #
   # @param self
   #
-  # Ͽ줿ƥꥹʤεưԤ֤饿޵ư򸺻롣
-  # ưԤ֤Ȥʤäꥹʤ¸ߤϡ
-  # ХåؿƤӽФ
+  # Ǥᤤǥåɥ饤ޤԵǥåɥ饤ãꥹʡ
+  # ХåؿƤӽФƤӽФꥹʡμΥǥåɥ饤
+  # ϵưûȤǤ˲᤮Ƥϸ߻狼
+  # ưȤ롣ХåؿϥåƸƤӽФᡢ
+  # ХåΥꥹʡϿϿԤʤ
   #
   # @else
   #
   # @brief Invoke Timer task
   #
-  # Subtract the interval of timer from the waiting time for invocation
-  # of each registered listener.
-  # If the listener whose waiting time reached 0 exists, invoke the
-  # callback function.
+  # Wait until the earliest deadline and invoke the callback function
+  # of the listeners whose deadline has been reached. The next deadline
+  # of an invoked listener is the deadline plus the invocation
+  # interval, or the interval after the current time if it has already
+  # passed. Callback functions are invoked without holding the lock,
+  # so that registration and unregistration are not blocked by them.
   #
   # @endif
   def invoke(self):
-    guard = OpenRTM_aist.ScopedLock(self._taskMutex)
-    for i in range(len(self._tasks)):
-      self._tasks[i].remains = self._tasks[i].remains - self._interval
-      if self._tasks[i].remains.sign() <= 0.0:
-        self._tasks[i].remains = self._tasks[i].period
-        self._tasks[i].listener.invoke()
-    del guard
+    self._cond.acquire()
+    try:
+      due_ = []
+      while self._running and not due_:
+        now_ = OpenRTM_aist.monotonic_ns()
+        while self._heap:
+          deadline_, seq_, task_ = self._heap[0]
+          if task_.seq != seq_:
+            heapq.heappop(self._heap)
+            continue
+          if deadline_ > now_:
+            break
+          next_ = deadline_ + task_.period_ns
+          if next_ <= now_:
+            next_ = now_ + task_.period_ns
+          self.push(task_, next_)
+          due_.append(task_.listener)
+
+        if due_:
+          break
+        if self._heap:
+          self._cond.wait(float(self._heap[0][0] - now_) / OpenRTM_aist.nsec_per_sec)
+        else:
+          self._cond.wait()
+    finally:
+      self._cond.release()
+
+    for listener_ in due_:
+      listener_.invoke()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǥåɥ饤ȤȤ˥ҡפɲä
+  #
+  # Υҡ׾Ǥϥֹ椬פʤʤ뤿ᡢ
+  # ˴롣å֤ǸƤӽФȡ
+  #
+  # @else
+  # @brief Push a task with its deadline into the heap
+  #
+  # The previous entries of the task in the heap are discarded when
+  # popped since their sequence numbers no longer match. This must be
+  # called with the lock held.
+  #
+  # @endif
+  def push(self, task, deadline):
+    self._seq += 1
+    task.seq = self._seq
+    task.deadline = deadline
+    heapq.heappush(self._heap, (deadline, self._seq, task))
+    if len(self._heap) > 2 * len(self._tasks) + 16:
+      self._heap = [e for e in self._heap if e[2].seq == e[1]]
+      heapq.heapify(self._heap)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ޥåɤ򵯾
+  # @else
+  # @brief Wake up the timer thread
+  # @endif
+  def notify(self):
+    self._cond.acquire()
+    self._cond.notify_all()
+    self._cond.release()
     return
 
   ##
@@ -228,7 +340,7 @@ class Timer:
   # specifying the interval.
   # If the same listener has already been regiseterd, the value specified
   # the invocation interval of listener will be updated.
-  # 
+  #
   #
   # @param listener Listener for the registration
   # @param tm The invocation interval of listener
@@ -238,13 +350,20 @@ class Timer:
   # @endif
   # ListenerId registerListener(ListenerBase* listener, TimeValue tm);
   def registerListener(self, listener, tm):
-    guard = OpenRTM_aist.ScopedLock(self._taskMutex)
-    for i in range(len(self._tasks)):
-      if self._tasks[i].listener == listener:
-        self._tasks[i].period = tm
-        self._tasks[i].remains = tm
-        return listener
-    self._tasks.append(self.Task(listener, tm))
+    period_ns_ = max(timeValueToNsec(tm), timeValueToNsec(self._interval), 1)
+    self._cond.acquire()
+    try:
+      task_ = self._tasks.get(listenerKey(listener))
+      if task_ is None:
+        task_ = self.Task(listener, tm)
+        self._tasks[listenerKey(listener)] = task_
+      task_.period = tm
+      task_.period_ns = period_ns_
+      self.push(task_, OpenRTM_aist.monotonic_ns() + period_ns_)
+      if self._heap[0][2] is task_:
+        self._cond.notify_all()
+    finally:
+      self._cond.release()
     return listener
 
 
@@ -341,20 +460,27 @@ class Timer:
   # @endif
   # bool unregisterListener(ListenerId id);
   def unregisterListener(self, id):
-    guard = OpenRTM_aist.ScopedLock(self._taskMutex)
-    len_ = len(self._tasks)
-    for i in range(len_):
-      idx = (len_ - 1) - i
-      if self._tasks[idx].listener == id:
-        del self._tasks[idx]
-        return True
-    return False
+    self._cond.acquire()
+    try:
+      task_ = self._tasks.pop(listenerKey(id), None)
+      if task_ is None:
+        return False
+      task_.seq = 0
+      return True
+    finally:
+      self._cond.release()
 
 
   ##
   # @if jp
   # @class Task
   # @brief ѥ饹
+  #
+  # - period: ư (TimeValue)
+  # - period_ns: ư [ns]
+  # - deadline: Υǥåɥ饤 (monotonic_ns)
+  # - seq: ҡ׾ͭǤΥֹ档Ͽ 0
+  #
   # @else
   #
   # @endif
@@ -362,5 +488,7 @@ class Timer:
     def __init__(self, lb, tm):
       self.listener = lb
       self.period = tm
-      self.remains = tm
+      self.period_ns = 0
+      self.deadline = 0
+      self.seq = 0
       return
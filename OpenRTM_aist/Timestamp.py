@@ -13,27 +13,88 @@
 #         Advanced Industrial Science and Technology (AIST), Japan
 #     All rights reserved.
 
+import threading
+import weakref
+
 import OpenRTM_aist
 
 
+##
+# @if jp
+# @class Timestamp
+# @brief ॹפꤹꥹ
+#
+# ͥ timestamp_policy  ts_type Ȱפˡǡ
+# tm.sec, tm.nsec ˸߻ꤹ롣timestamp_policy ϥͥ
+# ˺ǽθƤӽФȽꤷʹߤϤη̤Ѥ롣Ƚ
+# ϥͥ˴Ⱥ롣
+#
+# @else
+# @class Timestamp
+# @brief Listener setting the timestamp
+#
+# If timestamp_policy of the connector matches ts_type, the current
+# time is set to tm.sec and tm.nsec of the data. timestamp_policy is
+# checked on the first call for each connector, and the result is
+# used afterwards. The result is removed when the connector
+# information is discarded.
+#
+# @endif
 class Timestamp(OpenRTM_aist.ConnectorDataListenerT):
   def __init__(self, ts_type):
     self._ts_type = ts_type
+    self._policies = weakref.WeakKeyDictionary()
+    self._mutex = threading.RLock()
   def __del__(self):
     pass
   def __call__(self, info, data):
-    if info.properties.getProperty("timestamp_policy") != self._ts_type:
+    match_ = self._policies.get(info)
+    if match_ is None:
+      match_ = self.resolvePolicy(info)
+    if not match_:
       return OpenRTM_aist.ConnectorListenerStatus.NO_CHANGE
-    tm = OpenRTM_aist.Time().gettimeofday()
-    data.tm.sec = tm.sec()
-    data.tm.nsec = tm.usec() * 1000
+    OpenRTM_aist.setTimestamp(data)
     return OpenRTM_aist.ConnectorListenerStatus.DATA_CHANGED
-    
-
-
-
-
-
-
 
+  ##
+  # @if jp
+  # @brief ͥ timestamp_policy ȽꤷƵϿ
+  # @param info ͥ
+  # @return timestamp_policy  ts_type Ȱפ True
+  # @else
+  # @brief Check and record timestamp_policy of the connector
+  # @param info Connector information
+  # @return True if timestamp_policy matches ts_type
+  # @endif
+  def resolvePolicy(self, info):
+    match_ = info.properties.getProperty("timestamp_policy") == self._ts_type
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    self._policies[info] = match_
+    del guard
+    return match_
 
+  ##
+  # @if jp
+  # @brief ͥȽ̤
+  #
+  # ͥ timestamp_policy ѹ˸ƤӽФ
+  #
+  # @param info ͥ󡣾άϤ٤ƺ
+  #
+  # @else
+  # @brief Remove the recorded result of the connector
+  #
+  # This should be called when timestamp_policy of the connector is
+  # changed.
+  #
+  # @param info Connector information. All results are removed if omitted
+  #
+  # @endif
+  def clearPolicy(self, info=None):
+    guard = OpenRTM_aist.ScopedLock(self._mutex)
+    if info is None:
+      self._policies = weakref.WeakKeyDictionary()
+    else:
+      self._policies.pop(info, None)
+    del guard
+    return
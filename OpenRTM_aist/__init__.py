@@ -5,6 +5,184 @@ if _openrtm_idl_path not in sys.path:
     sys.path.append(_openrtm_idl_path)
 del _openrtm_idl_path
 
+
+##
+# Modules imported on the first access to one of their names. With
+# Python 3.7 or later the access is hooked by the module __getattr__
+# (PEP 562), so "import OpenRTM_aist" does not import the transports,
+# the optional execution contexts, CSP, FSM and so on until they are
+# used. With older versions they are imported at the end of this file
+# in this order. Each entry is (module, names defined in the module).
+_lazy_modules = (
+  ("ConfigWatcher", ("ConfigWatcher",)),
+  ("ModuleProfileCache", ("MODULE_PROFILE_CACHE_VERSION", "PROFILE_FOUND",
+                          "PROFILE_NOT_FOUND", "PROFILE_ERROR",
+                          "ModuleProfileCache", "module_profile_caches",
+                          "module_profile_caches_mutex",
+                          "getModuleProfileCache",
+                          "scanPythonProfile", "scanCommandProfile",
+                          "scanModuleProfile", "scanModuleProfiles",
+                          "mapPool", "getScanThreads")),
+  ("SpecExtractor", ("getSpecName", "extractSpec", "importSpec")),
+  ("RingBuffer", ("RingBuffer",)),
+  ("CdrRingBuffer", ("CdrRingBuffer", "CdrRingBufferInit")),
+  ("OpenHRPExecutionContext", ("OpenHRPExecutionContext",
+                               "OpenHRPExecutionContextInit")),
+  ("PublisherFlush", ("PublisherFlush", "PublisherFlushInit")),
+  ("ExtTrigExecutionContext", ("ExtTrigExecutionContext",
+                               "ExtTrigExecutionContextInit")),
+  ("PeriodicECSharedComposite", ("periodicecsharedcomposite_spec",
+                                 "stringToStrVec", "setCallback",
+                                 "addCallback", "PeriodicECOrganization",
+                                 "PeriodicECSharedComposite",
+                                 "PeriodicECSharedCompositeInit")),
+  ("InPortCorbaCdrConsumer", ("InPortCorbaCdrConsumer",
+                              "InPortCorbaCdrConsumerInit")),
+  ("InPortCorbaCdrProvider", ("InPortCorbaCdrProvider",
+                              "InPortCorbaCdrProviderInit")),
+  ("InPortPullConnector", ("InPortPullConnector",)),
+  ("InPortPushConnector", ("InPortPushConnector",)),
+  ("OutPortCorbaCdrConsumer", ("OutPortCorbaCdrConsumer",
+                               "OutPortCorbaCdrConsumerInit")),
+  ("OutPortCorbaCdrProvider", ("OutPortCorbaCdrProvider",
+                               "OutPortCorbaCdrProviderInit")),
+  ("OutPortPullConnector", ("OutPortPullConnector",)),
+  ("OutPortPushConnector", ("OutPortPushConnector",)),
+  ("PublisherNew", ("PublisherNew", "PublisherNewInit")),
+  ("PublisherPeriodic", ("PublisherPeriodic", "PublisherPeriodicInit")),
+  ("InPortDirectConsumer", ("InPortDirectConsumer", "InPortDirectConsumerInit")),
+  ("InPortDirectProvider", ("InPortDirectProvider", "InPortDirectProviderInit")),
+  ("OutPortDirectConsumer", ("OutPortDirectConsumer",
+                             "OutPortDirectConsumerInit")),
+  ("OutPortDirectProvider", ("OutPortDirectProvider",
+                             "OutPortDirectProviderInit")),
+  ("SharedMemory", ("SharedMemory",)),
+  ("InPortSHMConsumer", ("InPortSHMConsumer", "InPortSHMConsumerInit")),
+  ("InPortSHMProvider", ("InPortSHMProvider", "InPortSHMProviderInit")),
+  ("OutPortSHMConsumer", ("OutPortSHMConsumer", "OutPortSHMConsumerInit")),
+  ("OutPortSHMProvider", ("OutPortSHMProvider", "OutPortSHMProviderInit")),
+  ("CORBA_RTCUtil", ("get_component_profile", "is_existing",
+                     "is_alive_in_default_ec", "get_actual_ec", "get_ec_id",
+                     "activate", "deactivate", "reset", "get_state",
+                     "is_in_inactive", "is_in_active", "is_in_error",
+                     "get_default_rate", "set_default_rate",
+                     "get_current_rate", "set_current_rate",
+                     "add_rtc_to_default_ec", "remove_rtc_to_default_ec",
+                     "get_participants_rtc", "get_port_names",
+                     "get_inport_names", "get_outport_names",
+                     "get_svcport_names", "get_port_by_name",
+                     "get_connector_names_by_portref", "get_connector_names",
+                     "get_connector_ids_by_portref", "get_connector_ids",
+                     "create_connector", "already_connected", "connect",
+                     "connect_multi", "find_port", "connect_by_name",
+                     "disconnect", "disconnect_by_portref_connector_name",
+                     "disconnect_by_portname_connector_name",
+                     "disconnect_by_portref_connector_id",
+                     "disconnect_by_portname_connector_id",
+                     "disconnect_all_by_ref", "disconnect_all_by_name",
+                     "get_port_by_url", "disconnect_by_port_name",
+                     "get_configuration", "get_parameter_by_key",
+                     "get_active_configuration_name",
+                     "get_active_configuration", "set_configuration",
+                     "set_active_configuration", "set_configuration_parameter")),
+  ("NodeNumberingPolicy", ("NodeNumberingPolicy", "NodeNumberingPolicyInit")),
+  ("NamingServiceNumberingPolicy", ("NamingServiceNumberingPolicy",
+                                    "NamingServiceNumberingPolicyInit")),
+  ("CPUAffinity", ("listToCUPNUM", "setProcessAffinity", "setThreadAffinity",
+                   "SCHED_POLICY_NAMES", "threads", "threads_mutex",
+                   "toSchedPolicy", "schedPolicyToString",
+                   "setThreadScheduler", "getThreadId", "registerThread",
+                   "unregisterThread", "getThreadSettings")),
+  ("LogstreamFile", ("LogstreamFile", "LogstreamFileInit")),
+  ("SimulatorExecutionContext", ("SimulatorExecutionContext",
+                                 "SimulatorExecutionContextInit")),
+  ("DataflowExecutionContext", ("DataflowWorkerPool",
+                                "DataflowExecutionContextWorker",
+                                "DataflowExecutionContext",
+                                "DataflowExecutionContextInit")),
+  ("MultirateExecutionContext", ("schedulers", "schedulers_mutex",
+                                 "MultirateExecutionContext",
+                                 "MultirateScheduler",
+                                 "getMultirateScheduler",
+                                 "attachMultirateScheduler",
+                                 "releaseMultirateScheduler",
+                                 "MultirateExecutionContextInit")),
+  ("AsyncioExecutionContext", ("current_ec", "awaitCallback",
+                               "AsyncioExecutionContext",
+                               "AsyncioExecutionContextInit")),
+  ("EventDrivenExecutionContext", ("EventDrivenExecutionContext",
+                                   "EventDrivenExecutionContextInit")),
+  ("StaticFSM", ("fsm_topstate", "fsm_substate", "FSM_TOPSTATE",
+                 "FSM_SUBSTATE", "Machine", "Link", "State", "deephistory",
+                 "Event")),
+  ("EventPort", ("Event0", "Event1", "EventBinder0", "EventBinder1",
+                 "EventConnListener", "EventInPort")),
+  ("Timestamp", ("Timestamp",)),
+  ("OutPortDSConsumer", ("OutPortDSConsumer", "OutPortDSConsumerInit")),
+  ("OutPortDSProvider", ("OutPortDSProvider", "OutPortDSProviderInit")),
+  ("InPortDSConsumer", ("InPortDSConsumer", "InPortDSConsumerInit")),
+  ("InPortDSProvider", ("InPortDSProvider", "InPortDSProviderInit")),
+  ("FsmObject", ("FsmObject_impl",)),
+  ("FiniteStateMachineComponent", ("FiniteStateMachineComponent_impl",)),
+  ("SharedMemoryBarrier", ("SharedMemoryBarrier",)),
+  ("MultilayerCompositeEC", ("MultilayerCompositeEC",
+                             "MultilayerCompositeECInit")),
+  ("MultilayerCompositeChildEC", ("layerdrivers", "layerdrivers_mutex",
+                                  "MultilayerCompositeChildEC", "LayerDriver",
+                                  "getLayerDriver",
+                                  "MultilayerCompositeChildECInit")),
+  ("CORBA_CdrMemoryStream", ("CORBA_CdrMemoryStream",
+                             "CORBA_CdrMemoryStreamInit")),
+  ("InPortCSPConsumer", ("InPortCSPConsumer", "InPortCSPConsumerInit")),
+  ("OutPortCSPConsumer", ("OutPortCSPConsumer", "OutPortCSPConsumerInit")),
+  ("InPortCSPProvider", ("InPortCSPProvider", "InPortCSPProviderInit")),
+  ("OutPortCSPProvider", ("OutPortCSPProvider", "OutPortCSPProviderInit")),
+  ("InPortDuplexConnector", ("InPortDuplexConnector", "WriteListenerBase",
+                             "IsWritableListenerBase")),
+  ("OutPortDuplexConnector", ("OutPortDuplexConnector", "ReadListenerBase",
+                              "IsReadableListenerBase")),
+  ("CSPInPort", ("CSPInPort",)),
+  ("CSPOutPort", ("CSPOutPort",)),
+  ("CSPManager", ("CSPManager",)),
+  )
+
+_lazy_submodules = ("Macho",)
+
+_lazy_names = {}
+for _mod, _names in _lazy_modules:
+    for _name in _names:
+        _lazy_names[_name] = _mod
+del _mod, _names, _name
+
+
+def _load_module(mod):
+    # same as "from <mod> import *" at the top level of this file
+    module_ = __import__(mod, globals(), None, ["*"])
+    names_ = getattr(module_, "__all__", None)
+    if names_ is None:
+        names_ = [n for n in module_.__dict__ if not n.startswith("_")]
+    globals_ = globals()
+    for name_ in names_:
+        if name_ not in globals_ or _lazy_names.get(name_) == mod:
+            globals_[name_] = getattr(module_, name_)
+    return module_
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        module_ = __import__(name, globals(), None, ["*"])
+        globals()[name] = module_
+        return module_
+    mod_ = _lazy_names.get(name)
+    if mod_ is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    _load_module(mod_)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names) | set(_lazy_submodules))
+
 from version import *
 from DefaultConfiguration import *
 import CORBA_SeqUtil
@@ -16,6 +194,7 @@ from CorbaNaming import *
 from ECFactory import *
 from StringUtil import *
 from Properties import *
+from ConfigCache import *
 from ObjectManager import *
 from SystemLogger import *
 from TimeValue import *
@@ -26,9 +205,7 @@ from Factory import *
 from GlobalFactory import *
 from BufferStatus import *
 from BufferBase import *
-from RingBuffer import *
 from CdrBufferBase import *
-from CdrRingBuffer import *
 from DataPortStatus import *
 from Listener import *
 from ListenerHolder import *
@@ -38,6 +215,9 @@ from ManagerActionListener import *
 from ComponentActionListener import *
 from Typename import *
 from Guard import *
+from PeriodicDeadline import *
+from DeadlineWatchdog import *
+from GCScheduler import *
 from PeriodicTask import *
 from DefaultPeriodicTask import *
 from PeriodicTaskFactory import *
@@ -54,7 +234,6 @@ from ExecutionContextWorker import *
 from ExecutionContextBase import *
 from StateMachine import *
 from PeriodicExecutionContext import *
-from OpenHRPExecutionContext import *
 from PortProfileHelper import *
 from PortAdmin import *
 from ConfigAdmin import *
@@ -66,8 +245,6 @@ from InPortConsumer import *
 from OutPortConsumer import *
 from OutPortProvider import *
 from PublisherBase import *
-from PublisherFlush import *
-from ExtTrigExecutionContext import *
 from uuid import *
 from SdoConfiguration import *
 from SdoOrganization import *
@@ -75,70 +252,27 @@ from SdoServiceConsumerBase import *
 from SdoServiceProviderBase import *
 from SdoServiceAdmin import *
 from ConfigurationListener import *
-from PeriodicECSharedComposite import *
 from RTCUtil import *
 from OutPortBase import *
 from InPort import *
 from InPortProvider import *
-from InPortCorbaCdrConsumer import *
-from InPortCorbaCdrProvider import *
 from ConnectorBase import *
 from ConnectorListener import *
 from InPortConnector import *
-from InPortPullConnector import *
-from InPortPushConnector import *
 from OutPort import *
 from PortCallBack import *
 from PortConnectListener import *
 from CorbaPort import *
 from OutPortConnector import *
-from OutPortCorbaCdrConsumer import *
-from OutPortCorbaCdrProvider import *
-from OutPortPullConnector import *
-from OutPortPushConnector import *
-from PublisherNew import *
-from PublisherPeriodic import *
 from FactoryInit import *
-from InPortDirectConsumer import *
-from InPortDirectProvider import *
-from OutPortDirectConsumer import *
-from OutPortDirectProvider import *
-from SharedMemory import *
-from InPortSHMConsumer import *
-from InPortSHMProvider import *
-from OutPortSHMConsumer import *
-from OutPortSHMProvider import *
-from CORBA_RTCUtil import *
 from NumberingPolicyBase import *
 from NumberingPolicy import *
-from NodeNumberingPolicy import *
-from NamingServiceNumberingPolicy import *
-from CPUAffinity import *
 from LogstreamBase import *
-from LogstreamFile import *
-from SimulatorExecutionContext import *
 from FsmActionListener import *
-from StaticFSM import *
-from EventPort import *
-from Timestamp import *
-from OutPortDSConsumer import *
-from OutPortDSProvider import *
-from InPortDSConsumer import *
-from InPortDSProvider import *
-from FsmObject import *
-from FiniteStateMachineComponent import *
-import Macho
-from Timestamp import *
-from MultilayerCompositeEC import *
-#from MultilayerCompositeChildEC import *
 from ByteDataStreamBase import *
-from CORBA_CdrMemoryStream import *
-from InPortCSPConsumer import *
-from OutPortCSPConsumer import *
-from InPortCSPProvider import *
-from OutPortCSPProvider import *
-from InPortDuplexConnector import *
-from OutPortDuplexConnector import *
-from CSPInPort import *
-from CSPOutPort import *
-from CSPManager import *
+
+if sys.version_info < (3, 7):
+    for _mod, _names in _lazy_modules:
+        _load_module(_mod)
+    del _mod, _names
+    import Macho
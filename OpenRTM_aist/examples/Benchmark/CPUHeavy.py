@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# -*- Python -*-
+
+#
+# @file CPUHeavy.py
+# @brief CPU-bound component for MultilayerScaling.py
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+# Each onExecute() runs a pure Python loop of "work" iterations. When
+# the environment variable BENCHMARK_RESULT_DIR is set, the number of
+# executions and the time since the first one are written to the file
+# of the instance name in that directory about twice a second, so that
+# the counts of components in other processes can be collected.
+#
+
+from __future__ import print_function
+import sys
+import os
+import time
+
+import RTC
+import OpenRTM_aist
+
+cpuheavy_spec = ["implementation_id", "CPUHeavy",
+                 "type_name",         "CPUHeavy",
+                 "description",       "CPU-bound benchmark component",
+                 "version",           "1.0",
+                 "vendor",            "AIST",
+                 "category",          "example",
+                 "activity_type",     "DataFlowComponent",
+                 "max_instance",      "0",
+                 "language",          "Python",
+                 "lang_type",         "script",
+                 "conf.default.work", "200000",
+                 ""]
+
+
+class CPUHeavy(OpenRTM_aist.DataFlowComponentBase):
+  def __init__(self, manager):
+    OpenRTM_aist.DataFlowComponentBase.__init__(self, manager)
+    self._work = [200000]
+    self._count = 0
+    self._start = None
+    self._written = 0.0
+    self._resultDir = os.environ.get("BENCHMARK_RESULT_DIR")
+    return
+
+  def onInitialize(self):
+    self.bindParameter("work", self._work, "200000")
+    return RTC.RTC_OK
+
+  def onActivated(self, ec_id):
+    self._count = 0
+    self._start = None
+    return RTC.RTC_OK
+
+  def onExecute(self, ec_id):
+    x_ = 0
+    for i in range(self._work[0]):
+      x_ += i * i
+
+    now_ = time.time()
+    if self._start is None:
+      self._start = now_
+    self._count += 1
+    if self._resultDir and now_ - self._written > 0.5:
+      self._written = now_
+      self.writeResult(now_ - self._start)
+    return RTC.RTC_OK
+
+  def writeResult(self, elapsed):
+    path_ = os.path.join(self._resultDir, self.getInstanceName())
+    f_ = open(path_ + ".tmp", "w")
+    f_.write("%d %f\n" % (self._count, elapsed))
+    f_.close()
+    # os.replace() is not available on Python 2
+    getattr(os, "replace", os.rename)(path_ + ".tmp", path_)
+    return
+
+
+def CPUHeavyInit(manager):
+  profile = OpenRTM_aist.Properties(defaults_str=cpuheavy_spec)
+  manager.registerFactory(profile,
+                          CPUHeavy,
+                          OpenRTM_aist.Delete)
+
+
+def MyModuleInit(manager):
+  CPUHeavyInit(manager)
+  comp = manager.createComponent("CPUHeavy")
+
+
+def main():
+  mgr = OpenRTM_aist.Manager.init(sys.argv)
+  mgr.setModuleInitProc(MyModuleInit)
+  mgr.activateManager()
+  mgr.runManager()
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# -*- Python -*-
+
+#
+# @file ConfigStartup.py
+# @brief Loading time of configuration files with and without the cache
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+# Generates an rtc.conf of 5k lines and 50 component configuration
+# files in a temporary directory, and measures the time to load all of
+# them with loadConfigFile() in the same way as the manager does at
+# start-up:
+#
+# - parse: without the configuration cache
+# - cold:  with an empty cache directory (parse and write the cache)
+# - warm:  with the cache written by the previous run
+#
+# usage: python ConfigStartup.py [--lines 5000] [--components 50]
+#                                [--component-lines 200] [--repeat 5]
+#
+
+from __future__ import print_function
+import sys
+import os
+import shutil
+import tempfile
+import argparse
+import timeit
+
+import OpenRTM_aist
+
+
+def write_rtc_conf(path, lines, components):
+  f_ = open(path, "w")
+  f_.write("# generated by ConfigStartup.py\n")
+  f_.write("corba.nameservers: localhost\n")
+  f_.write("naming.formats: %n.rtc\n")
+  f_.write("logger.enable: NO\n")
+  for i in range(components):
+    f_.write("example.Comp%d.config_file: comp%d.conf\n" % (i, i))
+  n_ = components + 4
+  i = 0
+  while n_ < lines:
+    if i % 10 == 0:
+      f_.write("\n# section %d\n" % (i // 10))
+      n_ += 2
+    elif i % 10 == 5:
+      # a value continued on the next line
+      f_.write("manager.section%d.list%d: a, b, c, \\\n  d, e, f\n" % (i // 10, i))
+      n_ += 2
+    else:
+      f_.write("manager.section%d.param%d: value%d\n" % (i // 10, i, i))
+      n_ += 1
+    i += 1
+  f_.close()
+  return
+
+
+def write_component_conf(path, lines):
+  f_ = open(path, "w")
+  f_.write("# generated by ConfigStartup.py\n")
+  for i in range(lines - 1):
+    f_.write("conf.default.param%d: %d\n" % (i, i))
+  f_.close()
+  return
+
+
+def load_all(files, cache_dir):
+  t0_ = timeit.default_timer()
+  for file_name in files:
+    prop_ = OpenRTM_aist.Properties()
+    OpenRTM_aist.loadConfigFile(prop_, file_name, cache_dir)
+  return timeit.default_timer() - t0_
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Configuration loading time")
+  parser.add_argument("--lines", type=int, default=5000,
+                      help="lines of rtc.conf (default: 5000)")
+  parser.add_argument("--components", type=int, default=50,
+                      help="number of component conf files (default: 50)")
+  parser.add_argument("--component-lines", type=int, default=200,
+                      help="lines of each component conf file (default: 200)")
+  parser.add_argument("--repeat", type=int, default=5,
+                      help="repetitions, the best is reported (default: 5)")
+  args = parser.parse_args()
+
+  work_dir_ = tempfile.mkdtemp(prefix="openrtm_confbench_")
+  try:
+    files_ = [os.path.join(work_dir_, "rtc.conf")]
+    write_rtc_conf(files_[0], args.lines, args.components)
+    for i in range(args.components):
+      files_.append(os.path.join(work_dir_, "comp%d.conf" % i))
+      write_component_conf(files_[-1], args.component_lines)
+
+    parse_ = []
+    cold_ = []
+    warm_ = []
+    for i in range(args.repeat):
+      parse_.append(load_all(files_, ""))
+      cache_dir_ = os.path.join(work_dir_, "cache%d" % i)
+      cold_.append(load_all(files_, cache_dir_))
+      warm_.append(load_all(files_, cache_dir_))
+
+    print("rtc.conf: %d lines, %d component conf files of %d lines" %
+          (args.lines, args.components, args.component_lines))
+    print("%-6s %10s" % ("load", "time [ms]"))
+    for name, times in (("parse", parse_), ("cold", cold_), ("warm", warm_)):
+      print("%-6s %10.1f" % (name, min(times) * 1e3))
+  finally:
+    shutil.rmtree(work_dir_, True)
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# -*- Python -*-
+
+#
+# @file ECOverhead.py
+# @brief Execution context overhead per cycle with trivial components
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+# 1, 10 and 100 components whose onExecute() does nothing are
+# activated in an execution context, and invokeWorker() is called
+# repeatedly without sleeping. The time per cycle is the overhead of
+# the execution context worker and the component state machines.
+#
+# usage: python ECOverhead.py [--cycles 10000] [--components 1,10,100]
+#
+
+from __future__ import print_function
+import sys
+import argparse
+import timeit
+
+import RTC
+import OpenRTM_aist
+
+
+class Trivial(OpenRTM_aist.DataFlowComponentBase):
+  def __init__(self, manager):
+    OpenRTM_aist.DataFlowComponentBase.__init__(self, manager)
+    return
+
+  def onExecute(self, ec_id):
+    return RTC.RTC_OK
+
+
+def measure(mgr, num, cycles):
+  ec_ = OpenRTM_aist.OpenHRPExecutionContext()
+  ec_.init(OpenRTM_aist.Properties())
+  comps_ = [Trivial(mgr) for i in range(num)]
+  for comp in comps_:
+    ec_.add_component(comp.getObjRef())
+  ec_.start()
+  for comp in comps_:
+    ec_.activate_component(comp.getObjRef())
+
+  for i in range(cycles // 10):
+    ec_.invokeWorker()
+  t0_ = timeit.default_timer()
+  for i in range(cycles):
+    ec_.invokeWorker()
+  t1_ = timeit.default_timer()
+
+  ec_.stop()
+  ec_.exit()
+  for comp in comps_:
+    comp.exit()
+  return (t1_ - t0_) / cycles
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Execution context overhead")
+  parser.add_argument("--cycles", type=int, default=10000,
+                      help="measured cycles per case (default: 10000)")
+  parser.add_argument("--components", default="1,10,100",
+                      help="numbers of components (default: 1,10,100)")
+  args = parser.parse_args()
+
+  mgr = OpenRTM_aist.Manager.init([sys.argv[0],
+                                   "-o", "logger.enable:NO",
+                                   "-o", "naming.enable:NO"])
+  mgr.activateManager()
+
+  print("%-11s %14s %16s" % ("components", "us/cycle", "us/component"))
+  for num in [int(n) for n in args.components.split(",")]:
+    sec_ = measure(mgr, num, args.cycles)
+    print("%-11d %14.2f %16.3f" % (num, sec_ * 1e6, sec_ * 1e6 / num))
+
+  mgr.shutdownManager()
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
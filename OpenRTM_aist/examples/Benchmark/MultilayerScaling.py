@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# -*- Python -*-
+
+#
+# @file MultilayerScaling.py
+# @brief Scaling of MultilayerCompositeEC with CPU-bound components
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+# A PeriodicECSharedComposite driven by MultilayerCompositeEC executes
+# 1 to 8 layers, each with one CPUHeavy component, with isolation:
+# thread and isolation: process. The cycle rate achieved by the
+# components is reported for each case. With isolation: thread the
+# layers share the interpreter lock, so the rate falls with the number
+# of layers. With isolation: process it should stay flat up to the
+# number of CPU cores.
+#
+# Each case runs in its own manager process. isolation: process needs
+# rtcd_python (or the command given by --manager-cmd) on the PATH.
+#
+# usage: python MultilayerScaling.py [--layers 8] [--duration 10]
+#                                    [--work 200000]
+#                                    [--isolation thread,process]
+#                                    [--manager-cmd rtcd_python]
+#
+
+from __future__ import print_function
+import sys
+import os
+import time
+import shutil
+import tempfile
+import threading
+import subprocess
+import argparse
+import multiprocessing
+
+import OpenRTM_aist
+
+COMPOSITE = "MultilayerScaling0"
+
+
+def read_results(result_dir, names):
+  ret_ = {}
+  for name in names:
+    try:
+      f_ = open(os.path.join(result_dir, name))
+      count_, elapsed_ = f_.read().split()
+      f_.close()
+      ret_[name] = (int(count_), float(elapsed_))
+    except (IOError, OSError, ValueError):
+      pass
+  return ret_
+
+
+def format_rates(rates):
+  if not rates or rates[0] == "-":
+    return "-"
+  return "%.1f / %.1f" % (float(rates[0]), float(rates[1]))
+
+
+def run_case(args):
+  here_ = os.path.dirname(os.path.abspath(__file__))
+  result_dir_ = tempfile.mkdtemp(prefix="openrtm_mlscaling_")
+  os.environ["BENCHMARK_RESULT_DIR"] = result_dir_
+  # The log files of the layer processes go to the result directory.
+  os.chdir(result_dir_)
+
+  names_ = ["CPUHeavy%d" % i for i in range(args.layers)]
+  args_ = ["CPUHeavy?instance_name=%s&conf.default.work=%d" % (name, args.work)
+           for name in names_]
+  if args.run == "process":
+    members_ = "|,".join(args_)
+  else:
+    members_ = "|,".join(names_)
+
+  prefix_ = "composite.PeriodicECShared." + COMPOSITE + "."
+  argv_ = [sys.argv[0],
+           "-o", "logger.enable:NO",
+           "-o", "naming.enable:NO",
+           "-o", "manager.modules.load_path:" + here_,
+           "-o", "manager.modules.Python.manager_cmd:" + args.manager_cmd,
+           "-o", prefix_ + "exec_cxt.periodic.type:MultilayerCompositeEC",
+           "-o", prefix_ + "exec_cxt.periodic.isolation:" + args.run,
+           "-o", prefix_ + "exec_cxt.periodic.rate:1000",
+           "-o", prefix_ + "conf.default.members:" + members_]
+
+  mgr = OpenRTM_aist.Manager.init(argv_)
+  mgr.activateManager()
+  mgr.runManager(True)
+
+  sys.path.append(here_)
+  import CPUHeavy
+  CPUHeavy.CPUHeavyInit(mgr)
+  if args.run == "thread":
+    for arg in args_:
+      mgr.createComponent(arg)
+
+  comp_ = mgr.createComponent("PeriodicECSharedComposite?instance_name=" + COMPOSITE)
+  ec_ = comp_.get_owned_contexts()[0]
+  ec_.activate_component(comp_.getObjRef())
+
+  # Wait for all the components, including the layer processes.
+  timeout_ = time.time() + 60.0
+  while len(read_results(result_dir_, names_)) < len(names_):
+    if time.time() > timeout_:
+      break
+    time.sleep(0.5)
+  else:
+    time.sleep(1.0)
+    begin_ = read_results(result_dir_, names_)
+    time.sleep(args.duration)
+    end_ = read_results(result_dir_, names_)
+
+    rates_ = []
+    for name in names_:
+      count_ = end_[name][0] - begin_[name][0]
+      elapsed_ = end_[name][1] - begin_[name][1]
+      rates_.append(count_ / elapsed_ if elapsed_ > 0 else 0.0)
+    print("RESULT %s %d %f %f" % (args.run, args.layers,
+                                  sum(rates_) / len(rates_), min(rates_)))
+    sys.stdout.flush()
+
+  # Do not wait forever for the layer processes to exit.
+  timer_ = threading.Timer(30.0, os._exit, (0,))
+  timer_.daemon = True
+  timer_.start()
+  mgr.shutdown()
+  shutil.rmtree(result_dir_, True)
+  return 0
+
+
+def main():
+  parser = argparse.ArgumentParser(description="MultilayerCompositeEC scaling")
+  parser.add_argument("--layers", type=int, default=8,
+                      help="maximum number of layers (default: 8)")
+  parser.add_argument("--duration", type=float, default=10.0,
+                      help="measurement time of each case [s] (default: 10)")
+  parser.add_argument("--work", type=int, default=200000,
+                      help="loop iterations per onExecute (default: 200000)")
+  parser.add_argument("--isolation", default="thread,process",
+                      help="isolation modes to measure (default: thread,process)")
+  parser.add_argument("--manager-cmd", default="rtcd_python",
+                      help="command launching a layer process (default: rtcd_python)")
+  parser.add_argument("--run", choices=("thread", "process"),
+                      help=argparse.SUPPRESS)
+  args = parser.parse_args()
+
+  if args.run:
+    return run_case(args)
+
+  modes_ = [m.strip() for m in args.isolation.split(",") if m.strip()]
+  results_ = {}
+  for mode in modes_:
+    for layers in range(1, args.layers + 1):
+      cmd_ = [sys.executable, os.path.abspath(__file__),
+              "--run", mode, "--layers", str(layers),
+              "--duration", str(args.duration), "--work", str(args.work),
+              "--manager-cmd", args.manager_cmd]
+      out_ = subprocess.Popen(cmd_, stdout=subprocess.PIPE).communicate()[0]
+      for line in out_.decode().splitlines():
+        if line.startswith("RESULT "):
+          results_[(mode, layers)] = line.split()[3:]
+      print("%s, %d layer(s): %s" %
+            (mode, layers, format_rates(results_.get((mode, layers)))))
+
+  print()
+  print("CPU cores: %d, work: %d iterations" %
+        (multiprocessing.cpu_count(), args.work))
+  print("cycle rate [Hz] (mean / slowest component)")
+  print("%-7s" % "layers" + "".join(["%24s" % m for m in modes_]))
+  for layers in range(1, args.layers + 1):
+    line_ = "%-7d" % layers
+    for mode in modes_:
+      line_ += "%24s" % format_rates(results_.get((mode, layers)))
+    print(line_)
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
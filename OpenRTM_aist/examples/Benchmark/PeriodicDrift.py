@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# -*- Python -*-
+
+#
+# @file PeriodicDrift.py
+# @brief Drift of the relative and absolute periodic schedules
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+# Runs a periodic loop with the relative schedule (sleep for period
+# minus execution time, measured with the wall clock) and with the
+# absolute schedule of PeriodicDeadline, and reports how far the last
+# cycle is from the ideal time.
+#
+# usage: python PeriodicDrift.py [--rate 1000] [--duration 600]
+#                                [--mode relative|absolute|both]
+#
+
+from __future__ import print_function
+import sys
+import time
+import argparse
+
+import OpenRTM_aist
+
+
+def run_relative(period_ns, cycles):
+  period_ = period_ns / 1e9
+  start_ = OpenRTM_aist.monotonic_ns()
+  for i in range(cycles):
+    t0_ = time.time()
+    # no work: only the scheduling is measured
+    slptm_ = period_ - (time.time() - t0_)
+    if slptm_ > 0:
+      time.sleep(slptm_)
+  return OpenRTM_aist.monotonic_ns() - start_, 0, 0
+
+
+def run_absolute(period_ns, cycles):
+  deadline_ = OpenRTM_aist.PeriodicDeadline(OpenRTM_aist.OVERRUN_SKIP)
+  start_ = OpenRTM_aist.monotonic_ns()
+  for i in range(cycles):
+    deadline_.sleep(period_ns)
+  return (OpenRTM_aist.monotonic_ns() - start_,
+          deadline_.getOverrunCount(), deadline_.getMissedCount())
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Periodic schedule drift")
+  parser.add_argument("--rate", type=float, default=1000.0,
+                      help="rate [Hz] (default: 1000)")
+  parser.add_argument("--duration", type=float, default=600.0,
+                      help="duration of each run [s] (default: 600)")
+  parser.add_argument("--mode", default="both",
+                      choices=("relative", "absolute", "both"))
+  args = parser.parse_args()
+
+  period_ns = int(1e9 / args.rate)
+  cycles = int(args.duration * args.rate)
+  modes = ("relative", "absolute") if args.mode == "both" else (args.mode,)
+
+  print("rate: %g Hz, cycles: %d" % (args.rate, cycles))
+  print("%-9s %12s %12s %14s %9s %9s" %
+        ("mode", "elapsed[s]", "drift[ms]", "drift[ms/min]", "overrun", "missed"))
+  for mode in modes:
+    if mode == "relative":
+      elapsed_, overrun_, missed_ = run_relative(period_ns, cycles)
+    else:
+      elapsed_, overrun_, missed_ = run_absolute(period_ns, cycles)
+    # Skipped cycles are not counted as drift.
+    drift_ = elapsed_ - (cycles + missed_) * period_ns
+    print("%-9s %12.3f %12.3f %14.3f %9d %9d" %
+          (mode, elapsed_ / 1e9, drift_ / 1e6,
+           drift_ / 1e6 / (elapsed_ / 60e9), overrun_, missed_))
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# -*- Python -*-
+
+#
+# @file PropertiesAccess.py
+# @brief get/set time of Properties with 10k keys
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+# Sets and gets 10k keys on a nested tree like a merged manager
+# configuration (mgr.secN.subM.keyK) and on a flat tree
+# (conf.default.paramK), and repeats getProperty() on one key of the
+# full tree.
+#
+# usage: python PropertiesAccess.py [--keys 10000] [--repeat 20000]
+#
+
+from __future__ import print_function
+import sys
+import argparse
+import timeit
+
+import OpenRTM_aist
+
+
+def measure(keys, repeat):
+  prop_ = OpenRTM_aist.Properties()
+  t0_ = timeit.default_timer()
+  for key in keys:
+    prop_.setProperty(key, "value")
+  t1_ = timeit.default_timer()
+  for key in keys:
+    prop_.getProperty(key)
+  t2_ = timeit.default_timer()
+  hot_ = keys[-1]
+  for i in range(repeat):
+    prop_.getProperty(hot_)
+  t3_ = timeit.default_timer()
+
+  if prop_.propertyNames() != keys:
+    raise RuntimeError("propertyNames() is not in insertion order")
+  return (t1_ - t0_, t2_ - t1_, (t3_ - t2_) / repeat)
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Properties get/set")
+  parser.add_argument("--keys", type=int, default=10000,
+                      help="number of keys (default: 10000)")
+  parser.add_argument("--repeat", type=int, default=20000,
+                      help="repetitions of the single key get (default: 20000)")
+  args = parser.parse_args()
+
+  trees_ = [("nested", ["mgr.sec%d.sub%d.key%d" % (i // 1000, (i // 50) % 20, i)
+                        for i in range(args.keys)]),
+            ("flat", ["conf.default.param%d" % i for i in range(args.keys)])]
+
+  print("%-7s %12s %12s %18s" % ("tree", "set [ms]", "get [ms]", "get one key [us]"))
+  for name, keys in trees_:
+    set_, get_, one_ = measure(keys, args.repeat)
+    print("%-7s %12.1f %12.1f %18.2f" % (name, set_ * 1e3, get_ * 1e3, one_ * 1e6))
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
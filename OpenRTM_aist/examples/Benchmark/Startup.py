@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# -*- Python -*-
+
+#
+# @file Startup.py
+# @brief Start-up time of a process with one component
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+# Measures, in fresh processes, the time of "import OpenRTM_aist" and
+# the time from Manager.init() to the first onExecute() of a component
+# activated in its periodic execution context.
+#
+# - lazy:  the package as it is (modules are loaded on first use)
+# - eager: all the modules loaded lazily by OpenRTM_aist/__init__.py
+#          and the SDO observer are imported right after
+#          "import OpenRTM_aist", as the package did before
+#
+# usage: python Startup.py [--repeat 5] [--mode lazy,eager]
+#
+
+from __future__ import print_function
+import sys
+import os
+import threading
+import subprocess
+import argparse
+import timeit
+
+
+def run_case(mode):
+  t0_ = timeit.default_timer()
+  import RTC
+  import OpenRTM_aist
+  if mode == "eager":
+    for mod_, names_ in OpenRTM_aist._lazy_modules:
+      OpenRTM_aist._load_module(mod_)
+    for name_ in OpenRTM_aist._lazy_submodules:
+      getattr(OpenRTM_aist, name_)
+    from OpenRTM_aist.ext.sdo.observer import ComponentObserverConsumer
+  t1_ = timeit.default_timer()
+  modules_ = len(sys.modules)
+
+  executed_ = threading.Event()
+  first_ = []
+
+  class StartupProbe(OpenRTM_aist.DataFlowComponentBase):
+    def onExecute(self, ec_id):
+      if not first_:
+        first_.append(timeit.default_timer())
+        executed_.set()
+      return RTC.RTC_OK
+
+  spec_ = ["implementation_id", "StartupProbe",
+           "type_name",         "StartupProbe",
+           "description",       "Start-up time probe",
+           "version",           "1.0",
+           "vendor",            "AIST",
+           "category",          "example",
+           "activity_type",     "DataFlowComponent",
+           "max_instance",      "1",
+           "language",          "Python",
+           "lang_type",         "script",
+           ""]
+
+  t2_ = timeit.default_timer()
+  mgr = OpenRTM_aist.Manager.init([sys.argv[0],
+                                   "-o", "logger.enable:NO",
+                                   "-o", "naming.enable:NO"])
+  mgr.activateManager()
+  mgr.runManager(True)
+  mgr.registerFactory(OpenRTM_aist.Properties(defaults_str=spec_),
+                      StartupProbe, OpenRTM_aist.Delete)
+  comp_ = mgr.createComponent("StartupProbe")
+  comp_.get_owned_contexts()[0].activate_component(comp_.getObjRef())
+
+  if executed_.wait(30.0):
+    print("RESULT %f %f %d" % (t1_ - t0_, first_[0] - t2_, modules_))
+  sys.stdout.flush()
+
+  timer_ = threading.Timer(10.0, os._exit, (0,))
+  timer_.daemon = True
+  timer_.start()
+  mgr.shutdown()
+  return 0
+
+
+def median(values):
+  values_ = sorted(values)
+  return values_[len(values_) // 2]
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Start-up time")
+  parser.add_argument("--repeat", type=int, default=5,
+                      help="processes per mode, the median is reported (default: 5)")
+  parser.add_argument("--mode", default="lazy,eager",
+                      help="modes to measure (default: lazy,eager)")
+  parser.add_argument("--run", choices=("lazy", "eager"),
+                      help=argparse.SUPPRESS)
+  args = parser.parse_args()
+
+  if args.run:
+    return run_case(args.run)
+
+  print("%-6s %12s %22s %9s %10s" %
+        ("mode", "import [ms]", "init->onExecute [ms]", "modules", "total [ms]"))
+  for mode in [m.strip() for m in args.mode.split(",") if m.strip()]:
+    results_ = []
+    for i in range(args.repeat):
+      t0_ = timeit.default_timer()
+      out_ = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                               "--run", mode],
+                              stdout=subprocess.PIPE).communicate()[0]
+      total_ = timeit.default_timer() - t0_
+      for line in out_.decode().splitlines():
+        if line.startswith("RESULT "):
+          import_, init_, modules_ = line.split()[1:]
+          results_.append((float(import_), float(init_), int(modules_), total_))
+    if not results_:
+      print("%-6s failed" % mode)
+      continue
+    print("%-6s %12.1f %22.1f %9d %10.1f" %
+          (mode,
+           median([r[0] for r in results_]) * 1e3,
+           median([r[1] for r in results_]) * 1e3,
+           median([r[2] for r in results_]),
+           median([r[3] for r in results_]) * 1e3))
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main())
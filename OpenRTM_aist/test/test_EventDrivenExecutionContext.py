@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file test_EventDrivenExecutionContext.py
+# @brief test for EventDrivenExecutionContext class
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+import time
+
+import RTC
+import OpenRTM_aist
+
+
+class DFP(OpenRTM_aist.DataFlowComponentBase):
+  def __init__(self, manager):
+    OpenRTM_aist.DataFlowComponentBase.__init__(self, manager)
+    self._count = 0
+    return
+
+  def onExecute(self, ec_id):
+    self._count += 1
+    return RTC.RTC_OK
+
+
+class TestEventDrivenExecutionContext(unittest.TestCase):
+
+  def setUp(self):
+    self._mgr = OpenRTM_aist.Manager.init(sys.argv)
+    self._mgr.activateManager()
+    self._comp = DFP(self._mgr)
+    self._ec = OpenRTM_aist.EventDrivenExecutionContext()
+    return
+
+
+  def tearDown(self):
+    self._ec.stop()
+    self._ec.exit()
+    self._comp.exit()
+    time.sleep(0.1)
+    self._mgr.shutdownManager()
+    return
+
+
+  def start(self, sync):
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("sync_transition", sync)
+    self._ec.init(prop)
+    self.assertEqual(self._ec.bindComponent(self._comp), RTC.RTC_OK)
+    self.assertEqual(self._ec.start(), RTC.RTC_OK)
+    return
+
+
+  def check_transitions(self):
+    ref_ = self._comp.getObjRef()
+    self.assertEqual(self._ec.activate_component(ref_), RTC.RTC_OK)
+    time.sleep(0.1)
+    self.assertEqual(self._ec.get_component_state(ref_), RTC.ACTIVE_STATE)
+    self.assertTrue(self._comp._count > 0)
+
+    self.assertEqual(self._ec.deactivate_component(ref_), RTC.RTC_OK)
+    time.sleep(0.1)
+    self.assertEqual(self._ec.get_component_state(ref_), RTC.INACTIVE_STATE)
+    count_ = self._comp._count
+    time.sleep(0.1)
+    self.assertEqual(self._comp._count, count_)
+    return
+
+
+  def test_async_transition(self):
+    # No data arrives and max_interval is disabled
+    self.start("NO")
+    self.check_transitions()
+    return
+
+
+  def test_sync_transition(self):
+    self.start("YES")
+    self.check_transitions()
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
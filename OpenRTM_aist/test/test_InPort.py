@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file test_InPort.py
+# @brief test for InPort class
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+
+try:
+  import asyncio
+except ImportError:
+  asyncio = None
+
+import RTC
+import OpenRTM_aist
+
+
+@unittest.skipIf(asyncio is None, "asyncio is not available")
+class TestInPortReadAsync(unittest.TestCase):
+
+  def setUp(self):
+    self._loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(self._loop)
+    self._d_in = RTC.TimedLong(RTC.Time(0,0),0)
+    self._inIn = OpenRTM_aist.InPort("in", self._d_in)
+    return
+
+
+  def tearDown(self):
+    asyncio.set_event_loop(None)
+    self._loop.close()
+    return
+
+
+  def test_new_data(self):
+    self._inIn.write(RTC.TimedLong(RTC.Time(0,0),1))
+    future = self._inIn.read_async()
+    self.assertTrue(future.done())
+    self.assertEqual(future.result().data, 1)
+    self.assertEqual(self._inIn._dataWaiters, [])
+    return
+
+
+  def test_data_arrival(self):
+    future = self._inIn.read_async()
+    self.assertFalse(future.done())
+    self.assertEqual(len(self._inIn._dataWaiters), 1)
+    self._loop.call_later(0.01, self._inIn.write,
+                          RTC.TimedLong(RTC.Time(0,0),2))
+    data = self._loop.run_until_complete(asyncio.wait_for(future, 1.0))
+    self.assertEqual(data.data, 2)
+    self._loop.run_until_complete(asyncio.sleep(0))
+    self.assertEqual(self._inIn._dataWaiters, [])
+    return
+
+
+  def test_timeout(self):
+    for i in range(10):
+      self.assertRaises(asyncio.TimeoutError,
+                        self._loop.run_until_complete,
+                        asyncio.wait_for(self._inIn.read_async(), 0.001))
+    self._loop.run_until_complete(asyncio.sleep(0))
+    self.assertEqual(self._inIn._dataWaiters, [])
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
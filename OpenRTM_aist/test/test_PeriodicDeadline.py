@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file test_PeriodicDeadline.py
+# @brief test for PeriodicDeadline class
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+from __future__ import print_function
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+import time
+
+import OpenRTM_aist
+
+
+# 1 kHz for 2 s. examples/Benchmark/PeriodicDrift.py measures longer runs.
+PERIOD_NS = 1000000
+CYCLES = 2000
+
+
+class TestPeriodicDeadline(unittest.TestCase):
+
+  def test_drift(self):
+    deadline = OpenRTM_aist.PeriodicDeadline()
+    start = OpenRTM_aist.monotonic_ns()
+    for i in range(CYCLES):
+      deadline.sleep(PERIOD_NS)
+    end = OpenRTM_aist.monotonic_ns()
+
+    # Skipped cycles move the grid by whole periods only.
+    ideal = start + (CYCLES + deadline.getMissedCount()) * PERIOD_NS
+    drift = end - ideal
+    print("\ndrift: %.3f ms after %d cycles (%d overruns, %d missed)" %
+          (drift / 1e6, CYCLES, deadline.getOverrunCount(),
+           deadline.getMissedCount()))
+    # The wakeup latency of the last cycle only, not of every cycle
+    self.assertTrue(abs(drift) < 2 * PERIOD_NS)
+    return
+
+
+  def test_overrun_skip(self):
+    period = 20000000
+    deadline = OpenRTM_aist.PeriodicDeadline(OpenRTM_aist.OVERRUN_SKIP)
+    self.assertEqual(deadline.sleep(period), 0)
+    start = deadline.getNextDeadline(0)
+    time.sleep(3.5 * period / 1e9)
+    self.assertTrue(deadline.sleep(period) > 0)
+    self.assertEqual(deadline.getOverrunCount(), 1)
+    self.assertEqual(deadline.getMissedCount(), 2)
+    # Realigned to the next deadline on the grid
+    self.assertEqual(deadline.sleep(period), 0)
+    self.assertEqual(deadline.getNextDeadline(0), start + 4 * period)
+    return
+
+
+  def test_overrun_catchup(self):
+    period = 20000000
+    deadline = OpenRTM_aist.PeriodicDeadline(OpenRTM_aist.OVERRUN_CATCHUP)
+    self.assertEqual(deadline.getOverrunPolicy(), OpenRTM_aist.OVERRUN_CATCHUP)
+    self.assertEqual(deadline.sleep(period), 0)
+    start = deadline.getNextDeadline(0)
+    time.sleep(3.5 * period / 1e9)
+    # The missed cycles run back to back
+    for i in range(3):
+      self.assertTrue(deadline.sleep(period) > 0)
+    self.assertEqual(deadline.sleep(period), 0)
+    self.assertEqual(deadline.getOverrunCount(), 3)
+    self.assertEqual(deadline.getMissedCount(), 0)
+    self.assertEqual(deadline.getNextDeadline(0), start + 4 * period)
+    return
+
+
+  def test_setOverrunPolicy(self):
+    deadline = OpenRTM_aist.PeriodicDeadline()
+    self.assertEqual(deadline.getOverrunPolicy(), OpenRTM_aist.OVERRUN_SKIP)
+    self.assertTrue(deadline.setOverrunPolicy(" CatchUp "))
+    self.assertEqual(deadline.getOverrunPolicy(), OpenRTM_aist.OVERRUN_CATCHUP)
+    self.assertFalse(deadline.setOverrunPolicy("none"))
+    self.assertEqual(deadline.getOverrunPolicy(), OpenRTM_aist.OVERRUN_CATCHUP)
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##
+# @file test_Properties.py
+# @brief test for Properties class
+# @date $Date$
+#
+# Copyright (C) 2026
+#     Intelligent Systems Research Institute,
+#     National Institute of
+#         Advanced Industrial Science and Technology (AIST), Japan
+#     All rights reserved.
+#
+
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+import threading
+
+import OpenRTM_aist
+
+
+class TestProperties(unittest.TestCase):
+
+  def setUp(self):
+    self.prop = OpenRTM_aist.Properties()
+    self.prop.setProperty("a.b", "1")
+    self.prop.setProperty("a.c", "2")
+    self.prop.setProperty("d", "3")
+    return
+
+
+  def test_propertyNames(self):
+    self.assertEqual(self.prop.propertyNames(), ["a.b", "a.c", "d"])
+    return
+
+
+  def test_setName(self):
+    node = self.prop.getNode("a")
+    node.name = "e"
+    self.assertEqual(self.prop.findNode("a"), None)
+    self.assertTrue(self.prop.findNode("e") is node)
+    self.assertEqual(self.prop.getProperty("e.b"), "1")
+    self.assertEqual(self.prop.getProperty("a.b"), "")
+    return
+
+
+  def test_removeNode_same_name(self):
+    node = OpenRTM_aist.Properties(key="d", value="4")
+    self.prop.appendLeaf(node)
+    self.assertEqual(self.prop.getProperty("d"), "3")
+    self.assertTrue(self.prop.removeNode("d") is node)
+    self.assertEqual(self.prop.getProperty("d"), "3")
+    self.assertTrue(self.prop.removeNode("d") is not None)
+    self.assertEqual(self.prop.hasKey("d"), None)
+    return
+
+
+  def test_clone(self):
+    clone = self.prop.clone()
+    clone.setProperty("a.b", "4")
+    self.prop.setProperty("a.c", "5")
+    self.assertEqual(self.prop.getProperty("a.b"), "1")
+    self.assertEqual(clone.getProperty("a.b"), "4")
+    self.assertEqual(self.prop.getProperty("a.c"), "5")
+    self.assertEqual(clone.getProperty("a.c"), "2")
+    return
+
+
+  def test_clone_node_obtained_before(self):
+    node = self.prop.getNode("a")
+    clone = self.prop.clone()
+    node.setProperty("b", "4")
+    self.assertEqual(self.prop.getProperty("a.b"), "4")
+    self.assertEqual(clone.getProperty("a.b"), "1")
+    return
+
+
+  def test_clone_value_of_node_obtained_before(self):
+    node = self.prop.getNode("a.b")
+    clone = self.prop.clone()
+    node.value = "4"
+    node.default_value = "5"
+    self.assertEqual(self.prop.getProperty("a.b"), "4")
+    self.assertEqual(clone.getProperty("a.b"), "1")
+    self.assertEqual(clone.getDefault("a.b"), "")
+    return
+
+
+  def test_clone_threads(self):
+    clones = []
+    def clone_():
+      for i in range(100):
+        prop = self.prop.clone()
+        prop.setProperty("a.x", str(i))
+        clones.append(prop)
+    threads = [threading.Thread(target=clone_) for i in range(4)]
+    for th in threads:
+      th.start()
+    for th in threads:
+      th.join()
+    self.prop.setProperty("a.b", "4")
+    self.assertEqual(len(clones), 400)
+    for prop in clones:
+      self.assertEqual(prop.getProperty("a.b"), "1")
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
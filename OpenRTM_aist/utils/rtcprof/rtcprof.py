@@ -20,6 +20,11 @@ import os
 
 import OpenRTM_aist
 
+def printProfile(prop):
+  keys = prop.propertyNames()
+  for key in keys:
+    print("%s:%s"%(key,prop.getProperty(key)))
+
 def main():
 
   if len(sys.argv) != 2:
@@ -31,14 +36,29 @@ def main():
   fullname  = sys.argv[1]
   # directory name
   dirname   = os.path.dirname(sys.argv[1])
-  tmp_path = sys.path
-  sys.path.append(dirname)
 
   # basename
   basename  = os.path.basename(sys.argv[1])
   # classname
   classname  = basename.split(".")[0].lower()
 
+  comp_spec_name = classname+"_spec"
+
+  with open(str(fullname)) as f:
+    if f.read().find(comp_spec_name) == -1:
+      return
+
+  # If *_spec is a literal, it is printed without executing the module
+  # and initializing the manager.
+  comp_spec = OpenRTM_aist.extractSpec(fullname, comp_spec_name)
+  if comp_spec is not None:
+    if comp_spec:
+      printProfile(OpenRTM_aist.Properties(defaults_str=comp_spec))
+    return
+
+  tmp_path = sys.path
+  sys.path.append(dirname)
+
   opts =[]
   opts.append("dummy")
   opts.append("-o")
@@ -59,11 +79,6 @@ def main():
   oldp = mgr.getFactoryProfiles()
 
   # for new
-  comp_spec_name = classname+"_spec"
-
-  with open(str(fullname)) as f:
-    if f.read().find(comp_spec_name) == -1:
-      return
   try:
     imp_file = __import__(basename.split(".")[0])
   except:
@@ -92,7 +107,7 @@ def main():
         
   # loaded component profile have to be one
   if len(profs) == 0:
-    print("Load failed. file name: ", fname)
+    print("Load failed. file name: ", fullname)
     sys.path = tmp_path
     return OpenRTM_aist.Properties()
 
@@ -101,9 +116,7 @@ def main():
     sys.path = tmp_path
     return OpenRTM_aist.Properties()
 
-  keys = profs[0].propertyNames()
-  for key in keys:
-    print("%s:%s"%(key,profs[0].getProperty(key)))
+  printProfile(profs[0])
 
   sys.path = tmp_path
   return